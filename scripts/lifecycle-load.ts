@@ -0,0 +1,225 @@
+#!/usr/bin/env npx tsx
+/**
+ * scripts/lifecycle-load.ts
+ * Replays a synthetic outage storm through the outage → SLA → payment lifecycle and reports
+ * per-endpoint p50/p99 latency and throughput, compared against stored baselines.
+ *
+ * Usage:
+ *   npx tsx scripts/lifecycle-load.ts [seed-pack] [--update-baseline]
+ *
+ * Env:
+ *   LOAD_BASE_URL            backend origin (default http://localhost:8000)
+ *   LOAD_AUTH_TOKEN          bearer token sent with every request (default "test-token")
+ *   LOAD_OUTAGES             outages per storm (default 1000)
+ *   LOAD_CONCURRENCY         in-flight requests per phase (default 32)
+ *   LOAD_REGRESSION_TOLERANCE  allowed fractional slowdown vs baseline (default 0.2)
+ *   LOAD_OUTAGE_AGE_MIN      minutes before now that seeded outages started (default 240)
+ *
+ * Outages are created with a start time LOAD_OUTAGE_AGE_MIN in the past so that resolving them breaches
+ * the SLA and makes them payment-eligible. Only 2xx answers are timed into the percentiles. 4xx answers
+ * (e.g. a bad token, or an outage that is still not eligible for a payment) are reported as
+ * rejections, network errors and 5xx answers as failures; either makes the run exit 1 without
+ * writing or comparing a baseline.
+ *
+ * Exit 0 = within baseline (or baseline written), Exit 1 = regression, rejected or failed requests.
+ */
+
+import { existsSync, readFileSync, writeFileSync } from "node:fs";
+import path from "node:path";
+
+import { getSeedPack, listSeedPacks } from "../tests/fixtures/seed-packs";
+
+const BASE_URL = process.env.LOAD_BASE_URL ?? "http://localhost:8000";
+const AUTH_TOKEN = process.env.LOAD_AUTH_TOKEN ?? "test-token";
+const OUTAGES = Number(process.env.LOAD_OUTAGES ?? 1000);
+const CONCURRENCY = Number(process.env.LOAD_CONCURRENCY ?? 32);
+const TOLERANCE = Number(process.env.LOAD_REGRESSION_TOLERANCE ?? 0.2);
+const OUTAGE_AGE_MIN = Number(process.env.LOAD_OUTAGE_AGE_MIN ?? 240);
+const BASELINE_PATH = path.join(__dirname, "lifecycle-load-baselines.json");
+
+type Endpoint = "create" | "resolve" | "sla" | "payment";
+
+interface EndpointStats {
+  requests: number;
+  failures: number;
+  rejected: number;
+  p50_ms: number;
+  p99_ms: number;
+  rps: number;
+}
+
+type Report = Record<Endpoint, EndpointStats>;
+
+// ── Request helpers ─────────────────────────────────────────────────────────
+
+interface TimedResult {
+  ms: number;
+  /** HTTP status, or 0 when the request never got an answer. */
+  status: number;
+  data: unknown;
+}
+
+async function timedRequest(method: string, url: string, body?: unknown): Promise<TimedResult> {
+  const started = performance.now();
+  try {
+    const res = await fetch(`${BASE_URL}${url}`, {
+      method,
+      headers: { "Content-Type": "application/json", Authorization: `Bearer ${AUTH_TOKEN}` },
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const data = res.headers.get("content-type")?.includes("json") ? await res.json() : await res.text();
+    return { ms: performance.now() - started, status: res.status, data };
+  } catch {
+    return { ms: performance.now() - started, status: 0, data: null };
+  }
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (!sorted.length) return 0;
+  const rank = Math.ceil((p / 100) * sorted.length) - 1;
+  return sorted[Math.min(Math.max(rank, 0), sorted.length - 1)];
+}
+
+/**
+ * Runs `count` requests with at most CONCURRENCY in flight and summarizes the latency of the 2xx answers.
+ * 4xx answers are counted as rejections; network errors and 5xx answers as failures.
+ */
+async function runPhase(
+  count: number,
+  request: (index: number) => Promise<TimedResult>,
+  onResult?: (index: number, data: unknown) => void,
+): Promise<EndpointStats> {
+  const latencies: number[] = [];
+  let failures = 0;
+  let rejected = 0;
+  let next = 0;
+  const started = performance.now();
+
+  async function worker() {
+    while (next < count) {
+      const index = next++;
+      const result = await request(index);
+      if (result.status >= 200 && result.status < 300) {
+        latencies.push(result.ms);
+        onResult?.(index, result.data);
+      } else if (result.status >= 400 && result.status < 500) rejected++;
+      else failures++;
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(CONCURRENCY, count) }, worker));
+  const elapsedS = (performance.now() - started) / 1000;
+  latencies.sort((a, b) => a - b);
+
+  return {
+    requests: count,
+    failures,
+    rejected,
+    p50_ms: Number(percentile(latencies, 50).toFixed(2)),
+    p99_ms: Number(percentile(latencies, 99).toFixed(2)),
+    rps: Number((count / elapsedS).toFixed(1)),
+  };
+}
+
+// ── Baseline comparison ─────────────────────────────────────────────────────
+
+function compareToBaseline(report: Report, baseline: Partial<Report>): string[] {
+  const regressions: string[] = [];
+  for (const [endpoint, stats] of Object.entries(report) as [Endpoint, EndpointStats][]) {
+    const base = baseline[endpoint];
+    if (!base) continue;
+    if (stats.p50_ms > base.p50_ms * (1 + TOLERANCE)) regressions.push(`${endpoint}: p50 ${stats.p50_ms}ms vs baseline ${base.p50_ms}ms`);
+    if (stats.p99_ms > base.p99_ms * (1 + TOLERANCE)) regressions.push(`${endpoint}: p99 ${stats.p99_ms}ms vs baseline ${base.p99_ms}ms`);
+    if (stats.rps < base.rps * (1 - TOLERANCE)) regressions.push(`${endpoint}: ${stats.rps} req/s vs baseline ${base.rps} req/s`);
+  }
+  return regressions;
+}
+
+// ── Storm ───────────────────────────────────────────────────────────────────
+
+async function main() {
+  const args = process.argv.slice(2);
+  const updateBaseline = args.includes("--update-baseline");
+  const packName = args.find((arg) => !arg.startsWith("--")) ?? "incident-heavy";
+  const pack = getSeedPack(packName);
+
+  if (!pack || !pack.outages.length) {
+    console.error(`Seed pack "${packName}" is unknown or has no outages to replay.`);
+    console.log("Available:", listSeedPacks().map((p) => p.name).join(", "));
+    process.exit(1);
+  }
+
+  const runId = Date.now().toString(36);
+  const startedAt = new Date(Date.now() - OUTAGE_AGE_MIN * 60_000).toISOString();
+  const ids: string[] = new Array(OUTAGES);
+
+  console.log(`Lifecycle load: ${OUTAGES} outages from "${pack.name}" against ${BASE_URL} (concurrency ${CONCURRENCY})`);
+
+  const report = {} as Report;
+  report.create = await runPhase(
+    OUTAGES,
+    (index) => {
+      const template = pack.outages[index % pack.outages.length];
+      return timedRequest("POST", "/api/outages", {
+        title: `${template.site_name} (${runId}-${index})`,
+        description: template.description,
+        severity: template.severity,
+        affected_nodes: template.affected_services,
+        reported_by: template.assigned_to ?? "load-generator",
+        customer_id: template.site_id ?? template.id,
+        started_at: startedAt,
+      });
+    },
+    (index, data) => {
+      ids[index] = (data as { id: string }).id;
+    },
+  );
+
+  const created = ids.filter(Boolean);
+  report.resolve = await runPhase(created.length, (index) =>
+    timedRequest("PATCH", `/api/outages/${created[index]}/resolve`, { resolved_by: "load-generator" }),
+  );
+  report.sla = await runPhase(created.length, (index) => timedRequest("GET", `/api/outages/${created[index]}/sla`));
+  report.payment = await runPhase(created.length, (index) =>
+    timedRequest("POST", `/api/outages/${created[index]}/payment/generate`),
+  );
+
+  console.table(report);
+
+  const failures = Object.values(report).reduce((sum, stats) => sum + stats.failures, 0);
+  const rejected = Object.values(report).reduce((sum, stats) => sum + stats.rejected, 0);
+  if (failures || rejected) {
+    for (const [endpoint, stats] of Object.entries(report)) {
+      if (stats.rejected) console.error(`${endpoint}: ${stats.rejected} of ${stats.requests} requests rejected with 4xx`);
+      if (stats.failures) console.error(`${endpoint}: ${stats.failures} of ${stats.requests} requests failed`);
+    }
+    console.error("\nResults are not comparable to the baseline; no baseline was written or compared.");
+    process.exit(1);
+  }
+
+  const baselines: Record<string, Partial<Report>> = existsSync(BASELINE_PATH)
+    ? JSON.parse(readFileSync(BASELINE_PATH, "utf8"))
+    : {};
+  const key = `${pack.name}:${OUTAGES}:${CONCURRENCY}`;
+
+  if (updateBaseline || !baselines[key]) {
+    baselines[key] = report;
+    writeFileSync(BASELINE_PATH, `${JSON.stringify(baselines, null, 2)}\n`);
+    console.log(`\nBaseline for ${key} written to ${path.relative(process.cwd(), BASELINE_PATH)}.`);
+    return;
+  }
+
+  const regressions = compareToBaseline(report, baselines[key]);
+  if (regressions.length) {
+    console.error(`\nPerformance regression vs baseline ${key} (tolerance ${TOLERANCE * 100}%):`);
+    for (const line of regressions) console.error(`  ${line}`);
+    process.exit(1);
+  }
+
+  console.log(`\nWithin ${TOLERANCE * 100}% of baseline ${key}.`);
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
@@ -1,15 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from app.services.metrics import ReliabilityScorecardService, ScorecardMetrics
+from app.services.scorecard_history import HISTORY_RETENTION_DAYS, get_scorecard_history
+from app.repositories.utils.instrumentation import SCORECARD_EVALUATE_SECONDS, SCORECARDS_EVALUATED
 
 router = APIRouter()
+logger = logging.getLogger("reliability_scorecard")
+
+MAX_SCORECARD_BATCH = 1000
+
+def _record_history(scorecards: List[Dict[str, Any]], scope: str) -> None:
+    """
+    Best-effort history write, run as a background task after the response is sent (Starlette runs sync
+    tasks in its threadpool, off the event loop). A failing history store is logged and never fails the evaluation.
+    """
+    try:
+        get_scorecard_history().record_many(scorecards, scope=scope)
+    except Exception:
+        logger.exception("Failed to record %d scorecard evaluations for scope %s", len(scorecards), scope)
 
 @router.post("/scorecard/evaluate", status_code=status.HTTP_200_OK)
-async def evaluate_release_governance(metrics: ScorecardMetrics):
+async def evaluate_release_governance(metrics: ScorecardMetrics, background_tasks: BackgroundTasks, scope: str = "default"):
     """
     Evaluates system logs and telemetry payloads against governance criteria to issue an auditable deployment decision.
     """
     try:
-        scorecard = ReliabilityScorecardService.calculate_reliability_index(metrics)
+        with SCORECARD_EVALUATE_SECONDS.time(endpoint="single"):
+            scorecard = ReliabilityScorecardService.evaluate_cached(metrics)
+        SCORECARDS_EVALUATED.inc(endpoint="single")
+        background_tasks.add_task(_record_history, [scorecard], scope)
         return {
             "success": True,
             "data": scorecard
@@ -18,4 +40,60 @@ async def evaluate_release_governance(metrics: ScorecardMetrics):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to compile reliability analytics: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.post("/scorecard/evaluate/batch", status_code=status.HTTP_200_OK)
+async def evaluate_release_governance_batch(
+    background_tasks: BackgroundTasks,
+    metrics_batch: List[ScorecardMetrics] = Body(...),
+    scope: str = "default",
+):
+    """
+    Evaluates an array of metric sets in one round-trip, returning decisions in request order.
+    """
+    if len(metrics_batch) > MAX_SCORECARD_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Scorecard batches are limited to {MAX_SCORECARD_BATCH} metric sets"
+        )
+    try:
+        with SCORECARD_EVALUATE_SECONDS.time(endpoint="batch"):
+            scorecards = ReliabilityScorecardService.evaluate_batch(metrics_batch)
+        SCORECARDS_EVALUATED.inc(len(metrics_batch), endpoint="batch")
+        background_tasks.add_task(_record_history, scorecards, scope)
+        return {
+            "success": True,
+            "data": scorecards
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compile reliability analytics: {str(e)}"
+        )
+
+def _load_trends(scope: str, as_of: date, days: int) -> Dict[str, Any]:
+    history = get_scorecard_history()
+    trends = history.get_trends(as_of=as_of, scope=scope)
+    trends["daily"] = history.get_daily(as_of - timedelta(days=days - 1), as_of, scope=scope)
+    return trends
+
+@router.get("/scorecard/trends", status_code=status.HTTP_200_OK)
+async def get_scorecard_trends(
+    scope: str = "default",
+    as_of: Optional[date] = None,
+    days: int = Query(30, ge=1, le=HISTORY_RETENTION_DAYS),
+):
+    """
+    Rolling 7/30-day mean reliability index and GO-rate, plus the per-day series, for the trend dashboards.
+    """
+    try:
+        trends = await run_in_threadpool(_load_trends, scope, as_of or datetime.utcnow().date(), days)
+        return {
+            "success": True,
+            "data": trends
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to load scorecard trends: {str(e)}"
+        )
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.repositories.utils.instrumentation import PROMETHEUS_CONTENT_TYPE, REGISTRY
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def export_prometheus_metrics():
+    """
+    Exposes reconciliation engine and scorecard handler timings in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,7 +1,8 @@
 "use client";
 
-import { useEffect, useRef, useState } from "react";
+import { useEffect, useState } from "react";
 import { useParams, useRouter } from "next/navigation";
+import { useQueryClient } from "@tanstack/react-query";
 
 import { SLADisputesPanel } from "@/components/outages/SLADisputesPanel";
 import { PrintButton } from "@/components/shared/PrintButton";
@@ -11,7 +12,9 @@ import { RouteEmptyState, RouteErrorState, RouteLoadingState } from "@/component
 import { Separator } from "@/components/ui/separator";
 import { useToast } from "@/components/ui/toast";
 import { ResolveOutageModal } from "@/features/outages/components/ResolveOutageModal";
-import { getOutage, resolveOutage, updateOutage, deleteOutage } from "@/services/outages";
+import { outageKeys, useOutage } from "@/features/outages/hooks/useOutageMutations";
+import { resolveOutage, updateOutage, deleteOutage, generateOutagePayment } from "@/services/outages";
+import { waitForPaymentJob } from "@/services/paymentService";
 import type { Outage, OutageResolutionPayment, OutageUpdate, Severity, OutageStatus } from "@/types/outages";
 
 function getErrorMessage(err: unknown) {
@@ -40,13 +43,18 @@ export default function OutageDetailsPage() {
   const router = useRouter();
   const toast = useToast();
   const id = params?.id;
+  const queryClient = useQueryClient();
 
-  const [outage, setOutage] = useState<Outage | null>(null);
-  const [loading, setLoading] = useState(true);
+  // Refreshed by the change feed's invalidations, with a fast poll only while no live feed covers it
+  const outageQuery = useOutage(id ?? "");
+  const outage = outageQuery.data ?? null;
+  const loading = !!id && outageQuery.isPending;
   const [error, setError] = useState<string | null>(null);
   const [resolving, setResolving] = useState(false);
   const [isResolveModalOpen, setIsResolveModalOpen] = useState(false);
   const [resolutionPayment, setResolutionPayment] = useState<OutageResolutionPayment | null>(null);
+  const [paymentJobId, setPaymentJobId] = useState<string | null>(null);
+  const [generatingPayment, setGeneratingPayment] = useState(false);
 
   const [editing, setEditing] = useState(false);
   const [saving, setSaving] = useState(false);
@@ -55,54 +63,35 @@ export default function OutageDetailsPage() {
   const [deleting, setDeleting] = useState(false);
   const [deleteError, setDeleteError] = useState<string | null>(null);
 
-  const abortRef = useRef<AbortController | null>(null);
+  function setOutage(next: Outage) {
+    if (id) queryClient.setQueryData(outageKeys.detail(id), next);
+  }
 
+  // Settlement runs on the payment job queue; show the payment once it lands, and stop polling on unmount
   useEffect(() => {
-    if (!id) return;
+    if (!paymentJobId) return;
 
-    abortRef.current?.abort();
     const controller = new AbortController();
-    abortRef.current = controller;
-
-    setLoading(true);
-    setError(null);
-
-    getOutage(id, { signal: controller.signal })
-      .then((data) => {
-        setOutage(data);
-        setLoading(false);
+    waitForPaymentJob(paymentJobId, { signal: controller.signal })
+      .then((job) => {
+        if (job.status === "failed") {
+          toast(job.error ?? "Payment generation failed.", "error");
+          // Offer a manual retry through generateOutagePayment
+          setPaymentJobId(null);
+          return;
+        }
+        setResolutionPayment(job.payments?.[0] ?? null);
       })
       .catch((err: unknown) => {
-        if ((err as { name?: string }).name === "CanceledError") return;
-        setError(getErrorMessage(err));
-        setLoading(false);
+        const name = (err as { name?: string }).name;
+        if (name === "CanceledError" || name === "AbortError") return;
+        toast(getErrorMessage(err), "error");
       });
 
     return () => {
       controller.abort();
     };
-  }, [id]);
-
-  // Poll for updates while outage is open
-  useEffect(() => {
-    if (!id || !outage || outage.status === "resolved") return;
-
-    const controller = new AbortController();
-    const intervalId = setInterval(() => {
-      getOutage(id, { signal: controller.signal })
-        .then((data) => setOutage(data))
-        .catch((err: unknown) => {
-          if ((err as { name?: string }).name !== "CanceledError") {
-            console.error("Poll error:", err);
-          }
-        });
-    }, 15_000);
-
-    return () => {
-      controller.abort();
-      clearInterval(intervalId);
-    };
-  }, [id, outage?.status]);
+  }, [paymentJobId, toast]);
 
   function startEdit() {
     if (!outage) return;
@@ -141,9 +130,12 @@ export default function OutageDetailsPage() {
     try {
       const updated = await resolveOutage(id, { mttr_minutes: mttrMinutes });
       setOutage({ ...updated.outage, sla_status: updated.sla });
-      setResolutionPayment(updated.payment);
+      setResolutionPayment(updated.payment ?? null);
       setIsResolveModalOpen(false);
       toast("Outage resolved successfully.", "success");
+      if (!updated.payment && updated.payment_job) {
+        setPaymentJobId(updated.payment_job.job_id);
+      }
     } catch (err) {
       const msg = getErrorMessage(err);
       setError(msg);
@@ -153,6 +145,20 @@ export default function OutageDetailsPage() {
     }
   }
 
+  async function handleGeneratePayment() {
+    if (!id) return;
+    setGeneratingPayment(true);
+    try {
+      // Keyed by outage, so a double click or a retry after a lost response cannot pay twice
+      setResolutionPayment(await generateOutagePayment(id));
+      toast("Payment generated.", "success");
+    } catch (err) {
+      toast(getErrorMessage(err), "error");
+    } finally {
+      setGeneratingPayment(false);
+    }
+  }
+
   async function handleDelete() {
     if (!id) return;
     setDeleting(true);
@@ -175,11 +181,13 @@ export default function OutageDetailsPage() {
     );
   }
 
-  if (error && !outage) {
+  const loadError = outageQuery.error ? getErrorMessage(outageQuery.error) : error;
+
+  if (loadError && !outage) {
     return (
       <RouteErrorState
         title="Error loading outage"
-        description={error}
+        description={loadError}
         primaryAction={{ label: "Reload page", onClick: () => window.location.reload() }}
         
       />
@@ -410,6 +418,14 @@ export default function OutageDetailsPage() {
                   </span>
                 </div>
               </>
+            ) : isResolved && !paymentJobId ? (
+              <button
+                onClick={handleGeneratePayment}
+                disabled={generatingPayment}
+                className="rounded-md bg-blue-600 px-4 py-2 text-sm font-medium text-white hover:bg-blue-700 disabled:opacity-60"
+              >
+                {generatingPayment ? "Generating…" : "Generate payment"}
+              </button>
             ) : (
               <span className="italic text-muted-foreground">Resolve the outage to view the generated payment record.</span>
             )}
@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from "react";
 import { useRouter } from "next/navigation";
-import { createOutage } from "@/services/outages";
+import { createOutage, loadOpenOutageNodeIndex } from "@/services/outages";
 import { saveDraft, clearDraft, loadDraft } from "@/lib/drafts";
 import type { OutageCreate, Severity, OutageStatus } from "@/types/outages";
 
@@ -29,10 +29,16 @@ export default function NewOutagePage() {
   const [hasDraft] = useState(() => !!loadDraft(DRAFT_KEY));
   const [submitting, setSubmitting] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [confirmedDuplicate, setConfirmedDuplicate] = useState<string | null>(null);
   const [draftRestoreShown, setDraftRestoreShown] = useState(hasDraft);
 
   const [form, setForm] = useState(INITIAL_FORM);
 
+  // Page the open-outage index in while the form is filled, so submit's duplicate check does not wait on it
+  useEffect(() => {
+    loadOpenOutageNodeIndex().catch(() => undefined);
+  }, []);
+
   useEffect(() => {
     if (hasDraft) {
       const timer = setInterval(
@@ -96,6 +102,16 @@ export default function NewOutagePage() {
       assigned_to: form.assigned_to.trim() || undefined,
     };
 
+    // Duplicate check is advisory: if the index cannot load, create as before
+    const index = await loadOpenOutageNodeIndex().catch(() => null);
+    const duplicate = index?.findDuplicate(payload);
+    if (duplicate && duplicate !== confirmedDuplicate) {
+      setConfirmedDuplicate(duplicate);
+      setError(`Open outage ${duplicate} already covers these services. Submit again to create it anyway.`);
+      setSubmitting(false);
+      return;
+    }
+
     try {
       const outage = await createOutage(payload);
       clearDraft(DRAFT_KEY);
@@ -1,9 +1,54 @@
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-# Assuming standard SQLAlchemy model mappings exist internally
-# from app.models.payment import Payment 
+from sqlalchemy import text
+
+# Per-dialect time-bucket expression, minor-unit amount expression and byte-order collation. The WHERE
+# clause stays a bare range on updated_at so the planner can prune monthly partitions and walk
+# ix_payments_summary_covering (see sql/payments_summary.sql). Byte-order sorting keeps ORDER BY identical
+# to Python's key comparison, which the streaming merge-join depends on. Collated ORDER BY terms must be expressions, not ordinals:
+# PostgreSQL reads `2 COLLATE "C"` as a collated integer constant and rejects it.
+_DIALECT_EXPRESSIONS = {
+    "postgresql": {
+        "bucket": "date_bin(make_interval(secs => :bucket_seconds), {column}, TIMESTAMP '1970-01-01')",
+        # Summed as NUMERIC, which is exact; a BIGINT cast overflows for amounts above ~9.2e11, well
+        # inside NUMERIC(20, 7)
+        "minor_units": "ROUND(amount * 10000000)",
+        "collate": ' COLLATE "C"',
+    },
+    "sqlite": {
+        "bucket": "datetime((CAST(strftime('%s', {column}) AS INTEGER) / :bucket_seconds) * :bucket_seconds, 'unixepoch')",
+        # SQLite has no exact decimal type; its 64-bit integer SUM raises on overflow rather than wrapping
+        "minor_units": "CAST(ROUND(amount * 10000000) AS INTEGER)",
+        "collate": "",
+    },
+}
+
+# Amounts are summed as exact integer minor units (10^-7, see utils/money.py) rather than floats;
+# as_summary converts the dialect's sum to int
+_STATUS_SUMMARY_SQL = """
+    SELECT status, COUNT(*) AS count, COALESCE(SUM({minor_units}), 0) AS total_minor
+    FROM payments
+    WHERE updated_at >= :start_time AND updated_at < :end_time
+    GROUP BY status
+"""
+
+_BUCKETED_SUMMARY_SQL = """
+    SELECT {bucket} AS bucket, status, COALESCE(customer_id, '') AS customer_id,
+           COUNT(*) AS count, COALESCE(SUM({minor_units}), 0) AS total_minor
+    FROM payments
+    WHERE updated_at >= :start_time AND updated_at < :end_time
+    GROUP BY 1, 2, 3
+    ORDER BY 1, status{collate}, COALESCE(customer_id, ''){collate}
+"""
+
+_BUCKET_TOTALS_SQL = """
+    SELECT {bucket} AS bucket, COUNT(*) AS count, COALESCE(SUM({minor_units}), 0) AS total_minor
+    FROM payments
+    WHERE updated_at >= :start_time AND updated_at < :end_time
+    GROUP BY 1
+"""
 
 class PaymentRepository:
     def __init__(self, db_session: Session):
@@ -14,18 +59,71 @@ class PaymentRepository:
         Fetches an absolute transactional source-of-truth summary within an explicit bounded window.
         Uses a read-committed snapshot to prevent dirty reads from ongoing concurrent writes.
         """
-        # Mock query execution representing:
-        # SELECT status, COUNT(id) as count, SUM(amount) as total FROM payments 
-        # WHERE updated_at >= start_time AND updated_at < end_time GROUP BY status;
-        
-        # In production, execute against your database session directly:
-        # return self.db.query(
-        #     Payment.status,
-        #     func.count(Payment.id).label('count'),
-        #     func.sum(Payment.amount).label('total')
-        # ).filter(Payment.updated_at >= start_time, Payment.updated_at < end_time).group_by(Payment.status).all()
-        
-        return [
-            {"status": "SUCCESS", "count": 1420, "total": 3550000.00},
-            {"status": "FAILED", "count": 85, "total": 212500.00}
-        ]
\ No newline at end of file
+        rows = self.db.execute(self.summary_statement(_STATUS_SUMMARY_SQL), {"start_time": start_time, "end_time": end_time})
+        return [as_summary(row) for row in rows.mappings()]
+
+    def iter_transactional_summary(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        bucket_size: timedelta = timedelta(minutes=1),
+        chunk_size: int = 5000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the transactional summary ordered by reconciliation key (bucket, status, customer).
+        Rows are pulled through a server-side cursor in chunks so memory stays flat regardless of window width.
+        """
+        statement = self.summary_statement(_BUCKETED_SUMMARY_SQL).execution_options(stream_results=True, yield_per=chunk_size)
+        rows = self.db.execute(statement, bucket_params(start_time, end_time, bucket_size))
+        for row in rows.mappings():
+            yield as_summary(row)
+
+    def get_bucket_totals(self, start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Dict[datetime, Dict[str, Any]]:
+        """
+        Lightweight per-bucket (count, total) rollup used to fingerprint closed buckets for late-arrival detection.
+        Groups on the bucket only, so it is far cheaper than the full reconciliation summary.
+        """
+        rows = self.db.execute(self.summary_statement(_BUCKET_TOTALS_SQL), bucket_params(start_time, end_time, bucket_size))
+        return {as_bucket(row["bucket"]): {"count": row["count"], "total_minor": int(row["total_minor"])} for row in rows.mappings()}
+
+    def summary_statement(self, template: str):
+        """
+        Renders a bucketed summary query for the session's dialect.
+        """
+        return render_summary_statement(self.db, template, "updated_at")
+
+def bucket_params(start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Dict[str, Any]:
+    return {"start_time": start_time, "end_time": end_time, "bucket_seconds": int(bucket_size.total_seconds())}
+
+def render_summary_statement(db_session: Session, template: str, bucket_column: str):
+    """
+    Fills a summary query template with the dialect's bucket expression over `bucket_column`, its minor-unit
+    amount expression and its collation.
+    """
+    return _summary_statement(db_session.get_bind().dialect.name, template, bucket_column)
+
+# Statements are built once per process and reused, so every run hits SQLAlchemy's compiled cache and
+# pooled connections can keep their server-side prepared statements (see utils/pools.py)
+@lru_cache(maxsize=64)
+def _summary_statement(dialect: str, template: str, bucket_column: str):
+    if dialect not in _DIALECT_EXPRESSIONS:
+        raise NotImplementedError(f"Bucketed payment summaries are not supported on {dialect}")
+    expressions = _DIALECT_EXPRESSIONS[dialect]
+    return text(
+        template.format(
+            bucket=expressions["bucket"].format(column=bucket_column),
+            minor_units=expressions["minor_units"],
+            collate=expressions["collate"],
+        )
+    )
+
+def as_bucket(value: Any) -> datetime:
+    # SQLite renders datetime() results as text; PostgreSQL already returns timestamps
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+def as_summary(row) -> Dict[str, Any]:
+    summary = dict(row)
+    summary["total_minor"] = int(summary["total_minor"])
+    if "bucket" in summary:
+        summary["bucket"] = as_bucket(summary["bucket"])
+    return summary
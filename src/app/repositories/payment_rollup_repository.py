@@ -0,0 +1,142 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from app.repositories.payment_repository import as_bucket, as_summary, bucket_params, render_summary_statement
+from app.repositories.utils.money import to_minor_units
+from app.repositories.utils.reconciliation_cursor import floor_to_bucket
+
+ROLLUP_GRANULARITY = timedelta(minutes=1)
+
+_ENQUEUE_SQL = """
+    INSERT INTO payment_rollup_outbox (bucket, status, customer_id, count_delta, total_minor_delta)
+    VALUES (:bucket, :status, :customer_id, :count_delta, :total_minor_delta)
+"""
+
+_DRAIN_SQL = """
+    SELECT id, bucket, status, customer_id, count_delta, total_minor_delta
+    FROM payment_rollup_outbox
+    ORDER BY id
+    LIMIT :batch_size
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO payment_rollups_minute (bucket, status, customer_id, count, total_minor)
+    VALUES (:bucket, :status, :customer_id, :count_delta, :total_minor_delta)
+    ON CONFLICT (bucket, status, customer_id) DO UPDATE SET
+        count = payment_rollups_minute.count + excluded.count,
+        total_minor = payment_rollups_minute.total_minor + excluded.total_minor
+"""
+
+# Drained entries are deleted by id rather than by range: outbox ids from concurrent writers can commit out of order
+_DELETE_DRAINED_SQL = "DELETE FROM payment_rollup_outbox WHERE id = :id"
+
+_STATUS_ROLLUP_SQL = """
+    SELECT status, SUM(count) AS count, COALESCE(SUM(total_minor), 0) AS total_minor
+    FROM payment_rollups_minute
+    WHERE bucket >= :start_time AND bucket < :end_time
+    GROUP BY status
+    HAVING SUM(count) > 0
+"""
+
+_BUCKETED_ROLLUP_SQL = """
+    SELECT {bucket} AS bucket, status, customer_id, SUM(count) AS count, COALESCE(SUM(total_minor), 0) AS total_minor
+    FROM payment_rollups_minute
+    WHERE bucket >= :start_time AND bucket < :end_time
+    GROUP BY 1, 2, 3
+    HAVING SUM(count) > 0
+    ORDER BY 1, status{collate}, customer_id{collate}
+"""
+
+_BUCKET_TOTALS_ROLLUP_SQL = """
+    SELECT {bucket} AS bucket, SUM(count) AS count, COALESCE(SUM(total_minor), 0) AS total_minor
+    FROM payment_rollups_minute
+    WHERE bucket >= :start_time AND bucket < :end_time
+    GROUP BY 1
+"""
+
+RollupKey = Tuple[datetime, str, str]
+
+class PaymentRollupRepository:
+    """
+    Per-minute (status, customer) payment counters maintained on write through a transactional outbox.
+    Exposes the same summary interface as PaymentRepository, but reads cost O(minutes in window)
+    instead of O(payments in window). Windows must be aligned to whole minutes.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def record_payment_change(self, before: Optional[Mapping[str, Any]], after: Optional[Mapping[str, Any]]) -> None:
+        """
+        Enqueues rollup deltas for a payment insert, update or delete inside the caller's transaction.
+        An update retracts the old (minute, status, customer) contribution and adds the new one, mirroring
+        how the raw summary query re-buckets a payment when its updated_at or status changes.
+        """
+        deltas: Dict[RollupKey, List[Any]] = defaultdict(lambda: [0, 0])
+        for payment, sign in ((before, -1), (after, 1)):
+            if payment is None:
+                continue
+            key = (floor_to_bucket(payment["updated_at"], ROLLUP_GRANULARITY), payment["status"], payment.get("customer_id") or "")
+            deltas[key][0] += sign
+            deltas[key][1] += sign * to_minor_units(payment["amount"])
+
+        rows = [
+            {"bucket": bucket, "status": status, "customer_id": customer_id, "count_delta": count, "total_minor_delta": total}
+            for (bucket, status, customer_id), (count, total) in deltas.items()
+            if count or total
+        ]
+        if rows:
+            self.db.execute(text(_ENQUEUE_SQL), rows)
+
+    def flush_outbox(self, batch_size: int = 10000) -> int:
+        """
+        Drains up to `batch_size` outbox entries, coalesces them per rollup key and applies them as one
+        batched upsert in a single transaction. Intended to run from a single drainer; returns entries applied.
+        """
+        drained = self.db.execute(text(_DRAIN_SQL), {"batch_size": batch_size}).mappings().all()
+        if not drained:
+            return 0
+
+        coalesced: Dict[RollupKey, List[Any]] = defaultdict(lambda: [0, 0])
+        for entry in drained:
+            key = (as_bucket(entry["bucket"]), entry["status"], entry["customer_id"])
+            coalesced[key][0] += entry["count_delta"]
+            coalesced[key][1] += entry["total_minor_delta"]
+
+        self.db.execute(text(_UPSERT_SQL), [
+            {"bucket": bucket, "status": status, "customer_id": customer_id, "count_delta": count, "total_minor_delta": total}
+            for (bucket, status, customer_id), (count, total) in coalesced.items()
+        ])
+        self.db.execute(text(_DELETE_DRAINED_SQL), [{"id": entry["id"]} for entry in drained])
+        self.db.commit()
+        return len(drained)
+
+    def get_transactional_summary(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        _require_minute_aligned(start_time, end_time)
+        rows = self.db.execute(text(_STATUS_ROLLUP_SQL), {"start_time": start_time, "end_time": end_time})
+        return [as_summary(row) for row in rows.mappings()]
+
+    def iter_transactional_summary(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        bucket_size: timedelta = ROLLUP_GRANULARITY,
+        chunk_size: int = 5000,
+    ) -> Iterator[Dict[str, Any]]:
+        _require_minute_aligned(start_time, end_time)
+        statement = render_summary_statement(self.db, _BUCKETED_ROLLUP_SQL, "bucket").execution_options(stream_results=True, yield_per=chunk_size)
+        for row in self.db.execute(statement, bucket_params(start_time, end_time, bucket_size)).mappings():
+            yield as_summary(row)
+
+    def get_bucket_totals(self, start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Dict[datetime, Dict[str, Any]]:
+        _require_minute_aligned(start_time, end_time)
+        statement = render_summary_statement(self.db, _BUCKET_TOTALS_ROLLUP_SQL, "bucket")
+        rows = self.db.execute(statement, bucket_params(start_time, end_time, bucket_size))
+        return {as_bucket(row["bucket"]): {"count": row["count"], "total_minor": int(row["total_minor"])} for row in rows.mappings()}
+
+def _require_minute_aligned(start_time: datetime, end_time: datetime) -> None:
+    for marker in (start_time, end_time):
+        if floor_to_bucket(marker, ROLLUP_GRANULARITY) != marker:
+            raise ValueError(f"Rollup windows must be aligned to whole minutes, got {marker.isoformat()}")
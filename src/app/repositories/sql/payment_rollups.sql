@@ -0,0 +1,27 @@
+-- Per-minute payment rollups maintained on write (PostgreSQL 14+).
+--
+-- Payment writes enqueue signed deltas into payment_rollup_outbox in the same transaction
+-- (PaymentRollupRepository.record_payment_change); a single drainer folds them into
+-- payment_rollups_minute with a batched upsert (PaymentRollupRepository.flush_outbox).
+-- Summary reads over any minute-aligned window then scan one row per (minute, status, customer).
+-- Amounts are kept as exact integer minor units (10^-7 of the payment asset) in NUMERIC(38,0):
+-- a single NUMERIC(20,7) payment can reach ~10^20 minor units, past BIGINT's ~9.2 * 10^18, and
+-- rollup totals sum many of them. 38 digits match the exact NUMERIC sums PaymentRepository reads.
+
+CREATE TABLE IF NOT EXISTS payment_rollup_outbox (
+    id          BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    bucket      TIMESTAMP NOT NULL,
+    status      TEXT NOT NULL,
+    customer_id TEXT NOT NULL DEFAULT '',
+    count_delta BIGINT NOT NULL,
+    total_minor_delta NUMERIC(38, 0) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS payment_rollups_minute (
+    bucket      TIMESTAMP NOT NULL,
+    status      TEXT NOT NULL,
+    customer_id TEXT NOT NULL DEFAULT '',
+    count       BIGINT NOT NULL,
+    total_minor NUMERIC(38, 0) NOT NULL,
+    PRIMARY KEY (bucket, status, customer_id)
+);
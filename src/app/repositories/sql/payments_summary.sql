@@ -0,0 +1,28 @@
+-- Storage layout backing PaymentRepository summary queries (PostgreSQL 14+).
+--
+-- payments is range-partitioned by month on updated_at, so the bounded reconciliation windows
+-- only touch the one or two partitions they overlap (runtime partition pruning on bound parameters).
+-- The covering index carries every column the summary queries read, turning them into
+-- index-only scans over a narrow range instead of heap scans across the whole table.
+
+CREATE TABLE IF NOT EXISTS payments (
+    id          BIGINT GENERATED ALWAYS AS IDENTITY,
+    customer_id TEXT,
+    status      TEXT NOT NULL,
+    amount      NUMERIC(20, 7) NOT NULL,
+    created_at  TIMESTAMP NOT NULL DEFAULT now(),
+    updated_at  TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, updated_at)
+) PARTITION BY RANGE (updated_at);
+
+-- One partition per month; create ahead of time from the scheduler (example for 2026-10).
+CREATE TABLE IF NOT EXISTS payments_2026_10 PARTITION OF payments
+    FOR VALUES FROM ('2026-10-01') TO ('2026-11-01');
+
+-- Declared on the parent so every existing and future partition inherits it.
+CREATE INDEX IF NOT EXISTS ix_payments_summary_covering
+    ON payments (updated_at, status, customer_id)
+    INCLUDE (amount);
+
+-- Index-only scans depend on an up-to-date visibility map; keep autovacuum aggressive on hot partitions.
+ALTER TABLE payments_2026_10 SET (autovacuum_vacuum_scale_factor = 0.01, autovacuum_analyze_scale_factor = 0.01);
@@ -0,0 +1,205 @@
+import fcntl
+import importlib
+import http.server
+import logging
+import os
+import random
+import signal
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Only lightweight modules load at start-up; SQLAlchemy, NumPy and the job modules load on warm-up
+from app.repositories.utils.instrumentation import (
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY,
+    RECONCILIATION_CYCLE_SECONDS,
+    RECONCILIATION_CYCLES_SKIPPED,
+)
+
+_PROCESS_STARTED = time.monotonic()
+
+logger = logging.getLogger("reconciliation_engine.daemon")
+
+INTERVAL_SECONDS = float(os.getenv("RECONCILIATION_INTERVAL_SECONDS", "60"))
+# Each cycle starts up to this many seconds after its tick, so it does not hit the sources in lockstep with
+# other jobs scheduled on the same minute boundary
+JITTER_SECONDS = float(os.getenv("RECONCILIATION_JITTER_SECONDS", "5"))
+# flock() lock file, resolved to an absolute path so every daemon on the host agrees on it whatever its
+# working directory. The lock is single-host: daemons on different hosts (or sharing it over NFS) are
+# not excluded, so run one daemon host per database.
+LOCK_PATH = os.path.abspath(os.getenv("RECONCILIATION_DAEMON_LOCK", os.path.join(tempfile.gettempdir(), "reconciliation_daemon.lock")))
+# Serves the Prometheus text format on this port when set, since the daemon runs outside the API process
+METRICS_PORT = os.getenv("RECONCILIATION_DAEMON_METRICS_PORT")
+# "module:callable" returning a new analytics client; unset uses the exporter's built-in source
+ANALYTICS_CLIENT_FACTORY = os.getenv("RECONCILIATION_ANALYTICS_CLIENT_FACTORY")
+JOB_OPTIONS = {
+    "streaming": os.getenv("RECONCILIATION_STREAMING", "") == "1",
+    "vectorized": os.getenv("RECONCILIATION_VECTORIZED", "") == "1",
+    "use_rollups": os.getenv("RECONCILIATION_USE_ROLLUPS", "") == "1",
+}
+
+class DaemonLockedError(RuntimeError):
+    """
+    Raised when another daemon already holds the reconciliation lock.
+    """
+
+def load_callable(path: str) -> Callable[..., Any]:
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+class ReconciliationDaemon:
+    """
+    Resident scheduler for the reconciliation job.
+    The first cycle pays for imports and connection setup once; later cycles reuse the warm engine, analytics
+    client pool and per-process caches. Cycles run on a fixed interval plus random jitter, and never overlap:
+    a cycle that overruns skips the ticks it covered instead of queueing catch-up runs, and an exclusive file
+    lock keeps a second daemon on the same host from reconciling the same data concurrently.
+    """
+
+    def __init__(
+        self,
+        job: Optional[Callable[[], Any]] = None,
+        interval: float = INTERVAL_SECONDS,
+        jitter: float = JITTER_SECONDS,
+        lock_path: Optional[str] = LOCK_PATH,
+        job_options: Optional[Dict[str, Any]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.job = job
+        self.interval = interval
+        self.jitter = jitter
+        self.lock_path = lock_path
+        self.job_options = JOB_OPTIONS if job_options is None else job_options
+        self.rng = rng or random.Random()
+        self.stopped = threading.Event()
+        self.lock_file = None
+        self.cold_start: Dict[str, float] = {}
+        self.cycles = 0
+
+    def acquire_lock(self) -> None:
+        if self.lock_path is None:
+            return
+        lock_file = open(self.lock_path, "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise DaemonLockedError(f"Another reconciliation daemon holds {self.lock_path}")
+        self.lock_file = lock_file
+
+    def release_lock(self) -> None:
+        if self.lock_file is not None:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+            self.lock_file.close()
+            self.lock_file = None
+
+    def warm_up(self) -> None:
+        """
+        Imports the job and opens its pools ahead of the first tick, recording how long each phase took.
+        """
+        if self.job is None:
+            started = time.monotonic()
+            sla_tasks = importlib.import_module("app.repositories.tasks.sla_tasks")
+            pools = importlib.import_module("app.repositories.utils.pools")
+            self.cold_start["import"] = time.monotonic() - started
+
+            started = time.monotonic()
+            factory = load_callable(ANALYTICS_CLIENT_FACTORY) if ANALYTICS_CLIENT_FACTORY else (lambda: None)
+            pools.configure_analytics_client_pool(factory)
+            with pools.get_engine().connect():
+                pass
+            self.cold_start["connect"] = time.monotonic() - started
+
+            options = dict(self.job_options)
+            self.job = lambda: sla_tasks.run_pooled_reconciliation_job(**options)
+        self.cold_start["ready"] = time.monotonic() - _PROCESS_STARTED
+
+    def run_cycle(self) -> Optional[bool]:
+        """
+        Runs one reconciliation; failures are logged and counted so the daemon keeps its schedule.
+        """
+        started = time.monotonic()
+        try:
+            outcome = self.job()
+        except Exception:
+            logger.exception("Reconciliation cycle failed.")
+            outcome, label = None, "error"
+        else:
+            label = "aligned" if outcome else "drift"
+        elapsed = time.monotonic() - started
+        RECONCILIATION_CYCLE_SECONDS.observe(elapsed, outcome=label)
+
+        self.cycles += 1
+        if self.cycles == 1:
+            self.cold_start["first_cycle"] = elapsed
+            logger.info(
+                "Reconciliation daemon cold start: %s",
+                ", ".join(f"{phase}={seconds:.3f}s" for phase, seconds in self.cold_start.items()),
+            )
+        logger.info("Reconciliation cycle %d finished in %.3fs (%s).", self.cycles, elapsed, label)
+        return outcome
+
+    def next_run_at(self, tick: float, now: float) -> float:
+        """
+        Returns the next tick after `tick` that has not already passed, counting the ticks skipped to get there.
+        """
+        next_tick = tick + self.interval
+        if next_tick < now:
+            skipped = int((now - next_tick) // self.interval) + 1
+            RECONCILIATION_CYCLES_SKIPPED.inc(skipped)
+            logger.warning("Reconciliation cycle overran; skipping %d scheduled runs.", skipped)
+            next_tick += skipped * self.interval
+        return next_tick
+
+    def run_forever(self) -> None:
+        self.acquire_lock()
+        try:
+            self.warm_up()
+            tick = time.monotonic()
+            while not self.stopped.is_set():
+                self.run_cycle()
+                tick = self.next_run_at(tick, time.monotonic())
+                delay = tick + self.rng.uniform(0, self.jitter) - time.monotonic()
+                self.stopped.wait(max(0.0, delay))
+        finally:
+            self.release_lock()
+
+    def stop(self, *_: Any) -> None:
+        self.stopped.set()
+
+def _cold_start_gauge(daemon: ReconciliationDaemon):
+    return lambda: {(phase,): seconds for phase, seconds in daemon.cold_start.items()}
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+def serve_metrics(port: int) -> http.server.HTTPServer:
+    server = http.server.ThreadingHTTPServer(("", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="reconciliation-metrics", daemon=True).start()
+    return server
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    daemon = ReconciliationDaemon()
+    REGISTRY.gauge(
+        "reconciliation_daemon_cold_start_seconds", "Daemon start-up time by phase.", ("phase",), _cold_start_gauge(daemon)
+    )
+    if METRICS_PORT:
+        serve_metrics(int(METRICS_PORT))
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    daemon.run_forever()
+
+if __name__ == "__main__":
+    main()
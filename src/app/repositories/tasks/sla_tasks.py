@@ -1,53 +1,390 @@
 import logging
+import time
 from datetime import datetime, timedelta
-from app.repositories.payment_repository import PaymentRepository
-from app.utils.analytics_exporter import AnalyticsExporter
+# SQLAlchemy (repositories, pools), NumPy/pyarrow (vectorized runs) and the process pool (sharded runs)
+# are imported by the jobs that use them, so importing this module stays cheap for the daemon's start-up
+from app.repositories.utils.analytics_exporter import AnalyticsExporter
+from app.repositories.utils.merge_diff import EMPTY_AGGREGATE, merge_join_diff
+from app.repositories.utils.reconciliation_cursor import ReconciliationCursor, floor_to_bucket, iter_buckets
+from app.repositories.utils.parallel_fetch import fetch_summaries_concurrently
+from app.repositories.utils.alert_dispatcher import get_alert_dispatcher
+from app.repositories.utils.instrumentation import (
+    ALERT_BATCHES_DROPPED,
+    DIFF_SECONDS,
+    MISMATCHES_EMITTED,
+    SOURCE_QUERY_SECONDS,
+    TimedRows,
+    profiled,
+    timed_source,
+)
+from app.repositories.utils.sharded_reconciliation import DEFAULT_TIME_SLICE, DEFAULT_WORKERS
 
 logger = logging.getLogger("reconciliation_engine")
 
-def run_analytics_reconciliation_job(db_session, analytics_client):
+# Fine-grained reconciliation key used by the streaming merge-join mode
+STREAMING_KEY_FIELDS = ("bucket", "status", "customer_id")
+# Upper bound on mismatch records retained for alerting; drift beyond this is counted, not buffered
+MAX_REPORTED_MISMATCHES = 500
+# Bucket granularity and late-arrival re-check horizon for checkpointed runs
+RECONCILIATION_BUCKET = timedelta(minutes=5)
+LATE_ARRIVAL_LOOKBACK = timedelta(hours=6)
+# Amounts are exact integer minor units end to end, so any nonzero drift is real drift
+AMOUNT_TOLERANCE_MINOR = 0
+# Per-source deadline (seconds) for concurrent summary fetches
+SOURCE_FETCH_TIMEOUT = 120.0
+
+@profiled("analytics_reconciliation")
+def run_analytics_reconciliation_job(
+    db_session,
+    analytics_client,
+    streaming: bool = False,
+    use_rollups: bool = False,
+    vectorized: bool = False,
+):
     """
     Automated check-and-balance task checking metrics consistency.
     Executes behind a 10-minute sliding safety buffer to account for data pipeline latency.
+    With `streaming=True` both sources are merge-joined as key-sorted iterators instead of in-memory dicts.
+    With `vectorized=True` the per-bucket x status x customer summaries are diffed in bulk as NumPy columns.
+    With `use_rollups=True` the transactional side reads per-minute rollups and the window snaps to whole minutes.
     """
+    from app.repositories.payment_rollup_repository import ROLLUP_GRANULARITY
+    
     # Define validation tracking windows
+    end_marker = datetime.utcnow() - timedelta(minutes=10)
+    if use_rollups:
+        end_marker = floor_to_bucket(end_marker, ROLLUP_GRANULARITY)
+    start_marker = end_marker - timedelta(hours=1)
+    
+    repo = _payment_source(db_session, use_rollups)
+    exporter = AnalyticsExporter(analytics_client)
+    
+    if streaming:
+        return _run_streaming_reconciliation(repo, exporter, start_marker, end_marker)
+    if vectorized:
+        return _run_vectorized_reconciliation(repo, exporter, start_marker, end_marker)
+    
+    return _diff_summaries(
+        timed_source("transactional", repo.get_transactional_summary)(start_marker, end_marker),
+        timed_source("analytics", exporter.get_aggregated_analytics_summary)(start_marker, end_marker),
+        start_marker,
+        end_marker,
+    )
+
+def run_pooled_reconciliation_job(**options):
+    """
+    Scheduler entry point: borrows a pooled session and analytics client for one cycle, so jobs running
+    every minute reuse warm connections instead of paying connection setup each time.
+    Accepts the same keyword options as run_analytics_reconciliation_job.
+    """
+    from app.repositories.utils.pools import get_analytics_client_pool, get_session_factory
+    
+    with get_session_factory()() as session, get_analytics_client_pool().acquire() as analytics_client:
+        return run_analytics_reconciliation_job(session, analytics_client, **options)
+
+@profiled("parallel_reconciliation")
+def run_parallel_reconciliation_job(
+    session_factory,
+    analytics_client,
+    shards: int = 1,
+    tx_timeout: float = SOURCE_FETCH_TIMEOUT,
+    analytics_timeout: float = SOURCE_FETCH_TIMEOUT,
+):
+    """
+    Same check as run_analytics_reconciliation_job, with both summary queries issued concurrently.
+    Each transactional shard opens its own session from `session_factory`, since sessions are not thread-safe;
+    the analytics client is shared across shards and must tolerate concurrent calls.
+    """
+    from app.repositories.payment_repository import PaymentRepository
+    
     end_marker = datetime.utcnow() - timedelta(minutes=10)
     start_marker = end_marker - timedelta(hours=1)
     
-    repo = PaymentRepository(db_session)
     exporter = AnalyticsExporter(analytics_client)
     
-    tx_truth = {item["status"]: item for item in repo.get_transactional_summary(start_marker, end_marker)}
-    analytics_truth = {item["status"]: item for item in exporter.get_aggregated_analytics_summary(start_marker, end_marker)}
+    def fetch_transactional(start_time, end_time):
+        with session_factory() as session:
+            return PaymentRepository(session).get_transactional_summary(start_time, end_time)
+    
+    summaries = fetch_summaries_concurrently(
+        {
+            "transactional": timed_source("transactional", fetch_transactional),
+            "analytics": timed_source("analytics", exporter.get_aggregated_analytics_summary),
+        },
+        start_marker,
+        end_marker,
+        shards=shards,
+        timeouts={"transactional": tx_timeout, "analytics": analytics_timeout},
+    )
+    
+    return _diff_summaries(summaries["transactional"], summaries["analytics"], start_marker, end_marker)
+
+@profiled("sharded_reconciliation")
+def run_sharded_reconciliation_job(
+    analytics_client_factory=None,
+    use_rollups: bool = False,
+    time_slice: timedelta = DEFAULT_TIME_SLICE,
+    max_workers: int = DEFAULT_WORKERS,
+):
+    """
+    Streaming reconciliation of the same window as run_analytics_reconciliation_job, split into
+    time-slice shards and run across a process pool so it scales past one core.
+    Every worker process opens its own pooled session (RECONCILIATION_DATABASE_URL) and builds its analytics
+    client with `analytics_client_factory`, which must be a picklable module-level callable.
+    Mismatch counts and the reported mismatches match a single-process streaming run.
+    """
+    from app.repositories.payment_rollup_repository import ROLLUP_GRANULARITY
+    from app.repositories.utils.sharded_reconciliation import plan_shards, run_sharded
+    
+    end_marker = datetime.utcnow() - timedelta(minutes=10)
+    if use_rollups:
+        end_marker = floor_to_bucket(end_marker, ROLLUP_GRANULARITY)
+    start_marker = end_marker - timedelta(hours=1)
+    
+    mismatch_count, mismatches = run_sharded(
+        plan_shards(start_marker, end_marker, time_slice),
+        _reconcile_shard,
+        STREAMING_KEY_FIELDS,
+        MAX_REPORTED_MISMATCHES,
+        max_workers=max_workers,
+        initializer=_init_shard_worker,
+        initargs=(analytics_client_factory, use_rollups),
+    )
+    for mismatch in mismatches:
+        mismatch["window_start"] = start_marker.isoformat()
+        mismatch["window_end"] = end_marker.isoformat()
+    
+    return _report_outcome(mismatch_count, mismatches, start_marker, end_marker)
+
+# Per-process sources for sharded reconciliation workers, set up once by _init_shard_worker
+_shard_worker_state = {}
+
+def _init_shard_worker(analytics_client_factory, use_rollups):
+    from app.repositories.utils.pools import reset_inherited_pools
+    
+    reset_inherited_pools()
+    _shard_worker_state["analytics_client"] = analytics_client_factory() if analytics_client_factory else None
+    _shard_worker_state["use_rollups"] = use_rollups
+
+def _reconcile_shard(shard):
+    from app.repositories.utils.pools import get_session_factory
+    
+    mismatches = []
+    with get_session_factory()() as session:
+        repo = _payment_source(session, _shard_worker_state["use_rollups"])
+        exporter = AnalyticsExporter(_shard_worker_state["analytics_client"])
+        mismatch_count = _reconcile_window(repo, exporter, shard.start_time, shard.end_time, mismatches)
+    return mismatch_count, mismatches
+
+@profiled("incremental_reconciliation")
+def run_incremental_reconciliation_job(
+    db_session,
+    analytics_client,
+    cursor: ReconciliationCursor,
+    bucket_size: timedelta = RECONCILIATION_BUCKET,
+    late_arrival_lookback: timedelta = LATE_ARRIVAL_LOOKBACK,
+    use_rollups: bool = False,
+):
+    """
+    Checkpointed variant of the reconciliation job driven by a persisted watermark.
+    Only buckets closed since the last watermark are reconciled; buckets inside the late-arrival lookback
+    are re-checked only when their per-bucket source fingerprint changed since they were last seen.
+    A missed run leaves the watermark in place, so the next run covers the gap.
+    """
+    closed_until = floor_to_bucket(datetime.utcnow() - timedelta(minutes=10), bucket_size)
+    watermark = cursor.get_watermark() or closed_until - timedelta(hours=1)
+    
+    if watermark >= closed_until:
+        logger.info("Reconciliation cursor at %s; no newly closed buckets.", watermark.isoformat())
+        return True
+    
+    repo = _payment_source(db_session, use_rollups)
+    exporter = AnalyticsExporter(analytics_client)
+    
+    # Cheap per-bucket totals from both sources fingerprint every bucket from the lookback start to the new watermark
+    lookback_start = watermark - late_arrival_lookback
+    tx_totals = timed_source("transactional_totals", repo.get_bucket_totals)(lookback_start, closed_until, bucket_size)
+    an_totals = timed_source("analytics_totals", exporter.get_bucket_totals)(lookback_start, closed_until, bucket_size)
+    fingerprints = {
+        bucket: _bucket_fingerprint(tx_totals.get(bucket), an_totals.get(bucket))
+        for bucket in iter_buckets(lookback_start, closed_until, bucket_size)
+    }
+    
+    previous = cursor.get_fingerprints(lookback_start, watermark)
+    late_buckets = [bucket for bucket, fingerprint in previous.items() if fingerprints.get(bucket) != fingerprint]
+    windows = _coalesce_buckets(sorted(late_buckets), bucket_size) + [(watermark, closed_until)]
+    
+    mismatches = []
+    mismatch_count = 0
+    for window_start, window_end in windows:
+        mismatch_count += _reconcile_window(repo, exporter, window_start, window_end, mismatches)
+    
+    cursor.checkpoint(closed_until, fingerprints, retain_after=closed_until - late_arrival_lookback)
+    if late_buckets:
+        logger.info("Re-checked %d late-arriving buckets with changed source aggregates.", len(late_buckets))
+    
+    return _report_outcome(mismatch_count, mismatches, watermark, closed_until)
+
+def _payment_source(db_session, use_rollups):
+    from app.repositories.payment_repository import PaymentRepository
+    from app.repositories.payment_rollup_repository import PaymentRollupRepository
+    
+    return PaymentRollupRepository(db_session) if use_rollups else PaymentRepository(db_session)
+
+def _diff_summaries(tx_rows, analytics_rows, start_marker, end_marker):
+    started = time.perf_counter()
+    tx_truth = {item["status"]: item for item in tx_rows}
+    analytics_truth = {item["status"]: item for item in analytics_rows}
     
     mismatches = []
     
     for status, tx_data in tx_truth.items():
-        an_data = analytics_truth.get(status, {"count": 0, "total": 0.0})
+        an_data = analytics_truth.get(status, EMPTY_AGGREGATE)
         
         count_drift = abs(tx_data["count"] - an_data["count"])
-        amount_drift = abs(tx_data["total"] - an_data["total"])
+        amount_drift = abs(tx_data["total_minor"] - an_data["total_minor"])
         
-        if count_drift > 0 or amount_drift > 0.01:
+        if count_drift > 0 or amount_drift > AMOUNT_TOLERANCE_MINOR:
             mismatch_log = {
                 "status_scope": status,
                 "window_start": start_marker.isoformat(),
                 "window_end": end_marker.isoformat(),
                 "expected": tx_data,
-                "actual": an_data,
-                "drift": {"count_diff": count_drift, "amount_diff": amount_drift}
+                "actual": dict(an_data),
+                "drift": {"count_diff": count_drift, "amount_diff_minor": amount_drift}
             }
             mismatches.append(mismatch_log)
+    
+    DIFF_SECONDS.observe(time.perf_counter() - started, mode="status")
+    MISMATCHES_EMITTED.inc(len(mismatches), mode="status")
             
     if mismatches:
         # Task Requirement: Automatically flags and outputs discrepancies
-        logger.error(f"CRITICAL DISCREPANCY DETECTED: Analytics drift identified: {mismatches}")
+        logger.error(
+            "CRITICAL DISCREPANCY DETECTED: Analytics drift identified in %d status scopes: %s",
+            len(mismatches), ", ".join(str(item["status_scope"]) for item in mismatches),
+        )
         trigger_slack_pagerduty_alert(mismatches)
         return False
         
     logger.info("Reconciliation cycle complete. Data balances are 100% aligned.")
     return True
 
+def _run_streaming_reconciliation(repo, exporter, start_marker, end_marker):
+    """
+    Constant-memory reconciliation pass over per-bucket x status x customer aggregates.
+    """
+    mismatches = []
+    mismatch_count = _reconcile_window(repo, exporter, start_marker, end_marker, mismatches)
+    return _report_outcome(mismatch_count, mismatches, start_marker, end_marker)
+
+def _run_vectorized_reconciliation(repo, exporter, start_marker, end_marker):
+    """
+    Bulk reconciliation pass: both summaries are loaded as columns, aligned on the composite key,
+    and only the mismatching rows are materialized.
+    """
+    # NumPy loads only for vectorized runs, keeping it out of every other job's start-up
+    from app.repositories.utils.columnar_cache import columns_from_table
+    from app.repositories.utils.vectorized_diff import drift_records, to_columns, vectorized_diff
+    
+    tx_columns = to_columns(TimedRows(repo.iter_transactional_summary(start_marker, end_marker), "transactional"), STREAMING_KEY_FIELDS)
+    if exporter.window_cache is not None:
+        # Closed windows are read memory-mapped from the local Arrow cache after the first run
+        with SOURCE_QUERY_SECONDS.time(source="analytics_columnar"):
+            an_columns = columns_from_table(exporter.get_summary_table(start_marker, end_marker), STREAMING_KEY_FIELDS)
+    else:
+        an_columns = to_columns(TimedRows(exporter.iter_aggregated_analytics_summary(start_marker, end_marker), "analytics"), STREAMING_KEY_FIELDS)
+    
+    with DIFF_SECONDS.time(mode="vectorized"):
+        drift = vectorized_diff(tx_columns, an_columns, STREAMING_KEY_FIELDS, amount_tolerance_minor=AMOUNT_TOLERANCE_MINOR)
+    mismatch_count = len(drift["count_drift"])
+    MISMATCHES_EMITTED.inc(mismatch_count, mode="vectorized")
+    
+    mismatches = []
+    for record in drift_records({column: values[:MAX_REPORTED_MISMATCHES] for column, values in drift.items()}, STREAMING_KEY_FIELDS):
+        mismatches.append({
+            "status_scope": record["scope"]["status"],
+            "window_start": start_marker.isoformat(),
+            "window_end": end_marker.isoformat(),
+            **record,
+        })
+    
+    return _report_outcome(mismatch_count, mismatches, start_marker, end_marker)
+
+def _reconcile_window(repo, exporter, start_marker, end_marker, mismatches) -> int:
+    """
+    Merge-joins both sources over one window and returns the number of drifting keys.
+    Only the first MAX_REPORTED_MISMATCHES discrepancies are appended to `mismatches` for the alert payload.
+    """
+    mismatch_count = 0
+    started = time.perf_counter()
+    
+    tx_rows = TimedRows(repo.iter_transactional_summary(start_marker, end_marker), "transactional")
+    an_rows = TimedRows(exporter.iter_aggregated_analytics_summary(start_marker, end_marker), "analytics")
+    drift_stream = merge_join_diff(
+        tx_rows,
+        an_rows,
+        STREAMING_KEY_FIELDS,
+        amount_tolerance_minor=AMOUNT_TOLERANCE_MINOR,
+    )
+    
+    for key, tx_data, an_data, count_drift, amount_drift in drift_stream:
+        mismatch_count += 1
+        if len(mismatches) >= MAX_REPORTED_MISMATCHES:
+            continue
+        scope = dict(zip(STREAMING_KEY_FIELDS, key))
+        mismatches.append({
+            "status_scope": scope["status"],
+            "scope": scope,
+            "window_start": start_marker.isoformat(),
+            "window_end": end_marker.isoformat(),
+            "expected": tx_data,
+            "actual": an_data,
+            "drift": {"count_diff": count_drift, "amount_diff_minor": amount_drift}
+        })
+    
+    # Source iterators are consumed inside the merge loop; their wait time is reported separately
+    DIFF_SECONDS.observe(time.perf_counter() - started - tx_rows.seconds - an_rows.seconds, mode="streaming")
+    MISMATCHES_EMITTED.inc(mismatch_count, mode="streaming")
+    return mismatch_count
+
+def _report_outcome(mismatch_count, mismatches, start_marker, end_marker):
+    if mismatch_count:
+        logger.error(
+            "CRITICAL DISCREPANCY DETECTED: %d drifting buckets in window %s - %s (%d reported)",
+            mismatch_count, start_marker.isoformat(), end_marker.isoformat(), len(mismatches),
+        )
+        trigger_slack_pagerduty_alert(mismatches)
+        return False
+    
+    logger.info("Reconciliation cycle complete. Data balances are 100% aligned.")
+    return True
+
+def _bucket_fingerprint(tx_totals, an_totals) -> str:
+    tx_totals = tx_totals or EMPTY_AGGREGATE
+    an_totals = an_totals or EMPTY_AGGREGATE
+    return f"{tx_totals['count']}:{tx_totals['total_minor']}|{an_totals['count']}:{an_totals['total_minor']}"
+
+def _coalesce_buckets(buckets, bucket_size):
+    """
+    Collapses sorted bucket starts into contiguous (start, end) windows so adjacent late buckets share one query.
+    """
+    windows = []
+    for bucket in buckets:
+        if windows and windows[-1][1] == bucket:
+            windows[-1] = (windows[-1][0], bucket + bucket_size)
+        else:
+            windows.append((bucket, bucket + bucket_size))
+    return windows
+
 def trigger_slack_pagerduty_alert(payload):
-    # Call core webhooks or operational notification utilities here
-    pass
\ No newline at end of file
+    """
+    Hands mismatches to the background alert pipeline without waiting on the alert sink.
+    """
+    dispatcher = get_alert_dispatcher()
+    if dispatcher is None:
+        logger.warning("No RECONCILIATION_ALERT_WEBHOOK_URL configured; %d mismatches not dispatched.", len(payload))
+        return
+    if not dispatcher.submit(payload):
+        ALERT_BATCHES_DROPPED.inc()
+        logger.warning("Alert queue full; dropped %d mismatches (%d batches dropped so far).", len(payload), dispatcher.dropped_batches)
\ No newline at end of file
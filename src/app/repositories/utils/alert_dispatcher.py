@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+from app.repositories.utils.instrumentation import ALERT_DISPATCH_SECONDS
+
+logger = logging.getLogger("reconciliation_engine.alerts")
+
+ALERT_WEBHOOK_URL = os.getenv("RECONCILIATION_ALERT_WEBHOOK_URL")
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second refill up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+class AlertDispatcher:
+    """
+    Background alert pipeline for reconciliation mismatches.
+
+    `submit` never blocks the reconciliation job: batches go onto a bounded queue and are dropped (and counted)
+    when it is full. A worker thread coalesces queued mismatches by (scope, window) over `coalesce_interval`
+    seconds, waits on a token bucket before each webhook POST, and serializes the payload only at send time,
+    keeping at most `max_payload_bytes` of sample mismatches per alert.
+    """
+
+    def __init__(
+        self,
+        webhook_url: str,
+        max_queue: int = 1000,
+        rate_per_second: float = 1.0,
+        burst: int = 5,
+        coalesce_interval: float = 2.0,
+        max_payload_bytes: int = 16384,
+        request_timeout: float = 5.0,
+    ):
+        self.webhook_url = webhook_url
+        self.queue: "queue.Queue[List[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+        self.coalesce_interval = coalesce_interval
+        self.max_payload_bytes = max_payload_bytes
+        self.request_timeout = request_timeout
+        self.dropped_batches = 0
+        self.sent_alerts = 0
+        self.failed_alerts = 0
+        self._stopping = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> "AlertDispatcher":
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="reconciliation-alerts", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Flushes whatever is already queued, then stops the worker.
+        """
+        self._stopping.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def submit(self, mismatches: List[Dict[str, Any]]) -> bool:
+        try:
+            self.queue.put_nowait(mismatches)
+            return True
+        except queue.Full:
+            self.dropped_batches += 1
+            return False
+
+    def _run(self) -> None:
+        while not (self._stopping.is_set() and self.queue.empty()):
+            try:
+                batch = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            groups: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+            deadline = time.monotonic() + self.coalesce_interval
+            while True:
+                for mismatch in batch:
+                    groups.setdefault(_coalesce_key(mismatch), []).append(mismatch)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopping.is_set() and self.queue.empty():
+                    break
+                try:
+                    batch = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            for key, grouped in groups.items():
+                self.rate_limiter.acquire()
+                self._send(key, grouped)
+
+    def _send(self, key: Tuple[Any, ...], mismatches: List[Dict[str, Any]]) -> None:
+        body = self.build_payload(key, mismatches)
+        request = urllib.request.Request(self.webhook_url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.request_timeout):
+                self.sent_alerts += 1
+            ALERT_DISPATCH_SECONDS.observe(time.perf_counter() - started, outcome="sent")
+        except Exception as e:
+            self.failed_alerts += 1
+            ALERT_DISPATCH_SECONDS.observe(time.perf_counter() - started, outcome="failed")
+            logger.warning("Reconciliation alert delivery failed for %s: %s", key, e)
+
+    def build_payload(self, key: Tuple[Any, ...], mismatches: List[Dict[str, Any]]) -> bytes:
+        """
+        Summarizes one (scope, window) group and appends sample mismatches until the byte cap is reached.
+        """
+        scope, window_start, window_end = key
+        summary = {
+            "text": f"Reconciliation drift: {len(mismatches)} mismatching buckets in {scope} for {window_start} - {window_end}",
+            "status_scope": scope,
+            "window_start": window_start,
+            "window_end": window_end,
+            "mismatch_count": len(mismatches),
+            "count_diff_total": sum(item["drift"]["count_diff"] for item in mismatches),
+            "amount_diff_minor_total": sum(item["drift"]["amount_diff_minor"] for item in mismatches),
+            "samples": [],
+            "samples_truncated": 0,
+        }
+        size = len(json.dumps(summary, default=str))
+        for index, mismatch in enumerate(mismatches):
+            encoded = json.dumps(mismatch, default=str)
+            if size + len(encoded) + 2 > self.max_payload_bytes:
+                summary["samples_truncated"] = len(mismatches) - index
+                break
+            summary["samples"].append(mismatch)
+            size += len(encoded) + 2
+        return json.dumps(summary, default=str).encode("utf-8")
+
+def _coalesce_key(mismatch: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (mismatch.get("status_scope"), mismatch.get("window_start"), mismatch.get("window_end"))
+
+_dispatcher: Optional[AlertDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+def get_alert_dispatcher() -> Optional[AlertDispatcher]:
+    """
+    Process-wide dispatcher for RECONCILIATION_ALERT_WEBHOOK_URL, started on first use; None when unconfigured.
+    """
+    global _dispatcher
+    if ALERT_WEBHOOK_URL is None:
+        return None
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = AlertDispatcher(ALERT_WEBHOOK_URL).start()
+        return _dispatcher
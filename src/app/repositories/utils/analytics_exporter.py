@@ -1,16 +1,127 @@
-from datetime import datetime
-from typing import Dict, Any, List
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from app.repositories.utils.money import to_minor_units
+from app.repositories.utils.reconciliation_cursor import floor_to_bucket, iter_buckets
+from app.repositories.utils.columnar_cache import (
+    DEFAULT_BATCH_SIZE,
+    ColumnarWindowCache,
+    concat_tables,
+    rows_to_record_batches,
+    table_from_batches,
+)
+
+# Local directory for per-window Arrow caches; unset disables on-disk caching
+COLUMNAR_CACHE_DIR = os.getenv("ANALYTICS_COLUMNAR_CACHE_DIR")
+# A window is closed, and safe to cache, once its end is older than the reconciliation safety buffer
+CLOSED_WINDOW_DELAY = timedelta(minutes=10)
+# Cached blocks are aligned to this grain (a multiple of every summary bucket size), so sliding windows share them
+COLUMNAR_CACHE_BLOCK = timedelta(minutes=5)
+# Simulated analytical store: a steady per-minute stream of aggregates, with 1 in 25 payments failing
+_SIMULATED_GRAIN = timedelta(minutes=1)
+_SIMULATED_MINUTE = (
+    {"status": "FAILED", "count": 1, "total_minor": to_minor_units("2500.00")},
+    {"status": "SUCCESS", "count": 24, "total_minor": to_minor_units("60000.00")},
+)
 
 class AnalyticsExporter:
-    def __init__(self, analytics_client: Any = None):
+    def __init__(self, analytics_client: Any = None, cache_dir: Optional[str] = COLUMNAR_CACHE_DIR):
         self.client = analytics_client
+        self.window_cache = ColumnarWindowCache(cache_dir) if cache_dir else None
 
     def get_aggregated_analytics_summary(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
         """
         Queries the analytical store for aggregated metric records over the identical timeframe window.
+        Totals are returned as integer minor units, matching PaymentRepository.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for row in self._simulated_rows(start_time, end_time, _SIMULATED_GRAIN):
+            summary = totals.setdefault(row["status"], {"status": row["status"], "count": 0, "total_minor": 0})
+            summary["count"] += row["count"]
+            summary["total_minor"] += row["total_minor"]
+        return list(totals.values())
+
+    def iter_aggregated_analytics_summary(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        page_size: int = 5000,
+        bucket_size: timedelta = timedelta(minutes=1),
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams analytical aggregates ordered by reconciliation key (bucket, status, customer), one result page at a time.
+        Rows carry the same key shapes as PaymentRepository.iter_transactional_summary: a datetime bucket, a status,
+        and a customer id with missing customers as "".
+        """
+        # In production, page through the analytical store with an ORDER BY on the reconciliation key
+        # and a keyset cursor of `page_size` rows, yielding each record as it arrives.
+        yield from self._simulated_rows(start_time, end_time, bucket_size)
+
+    def iter_summary_batches(self, start_time: datetime, end_time: datetime, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Streams the window's aggregates as Arrow record batches instead of row dicts.
+        """
+        # In production, request Arrow batches from the analytical store directly rather than re-packing rows
+        yield from rows_to_record_batches(self.iter_aggregated_analytics_summary(start_time, end_time, page_size=batch_size), batch_size)
+
+    def get_summary_table(self, start_time: datetime, end_time: datetime):
         """
-        # Simulating analytical engine aggregates extraction loop
-        return [
-            {"status": "SUCCESS", "count": 1420, "total": 3550000.00},
-            {"status": "FAILED", "count": 83, "total": 207500.00} # Simulated minor drift: 2 records dropped under concurrency
-        ]
\ No newline at end of file
+        Columnar summary for a window, ordered like iter_aggregated_analytics_summary.
+        With a local Arrow cache configured, the window is assembled from COLUMNAR_CACHE_BLOCK-aligned blocks:
+        closed blocks are served from, or written through to, the cache, so a window sliding forward re-reads
+        only its newest blocks. The unaligned head and tail, and blocks not yet closed, are queried directly.
+        """
+        if self.window_cache is None:
+            return table_from_batches(self.iter_summary_batches(start_time, end_time))
+        closed_until = datetime.utcnow() - CLOSED_WINDOW_DELAY
+        tables = []
+        for piece_start, piece_end in _cache_pieces(start_time, end_time, COLUMNAR_CACHE_BLOCK):
+            aligned = piece_end - piece_start == COLUMNAR_CACHE_BLOCK and floor_to_bucket(piece_start, COLUMNAR_CACHE_BLOCK) == piece_start
+            if not aligned or piece_end > closed_until:
+                tables.append(table_from_batches(self.iter_summary_batches(piece_start, piece_end)))
+                continue
+            cached = self.window_cache.get(piece_start, piece_end)
+            if cached is None:
+                cached = self.window_cache.put(piece_start, piece_end, self.iter_summary_batches(piece_start, piece_end))
+            tables.append(cached)
+        return concat_tables(tables)
+
+    def get_bucket_totals(self, start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Dict[datetime, Dict[str, Any]]:
+        """
+        Per-bucket (count, total) rollup from the analytical store, mirroring PaymentRepository.get_bucket_totals.
+        """
+        totals: Dict[datetime, Dict[str, Any]] = {}
+        for row in self._simulated_rows(start_time, end_time, bucket_size):
+            bucket = totals.setdefault(row["bucket"], {"count": 0, "total_minor": 0})
+            bucket["count"] += row["count"]
+            bucket["total_minor"] += row["total_minor"]
+        return totals
+
+    def _simulated_rows(self, start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Iterator[Dict[str, Any]]:
+        """
+        Stand-in for the analytical store: every whole minute in [start_time, end_time) contributes
+        _SIMULATED_MINUTE, grouped into `bucket_size` buckets in reconciliation-key order. Each bucket's
+        totals depend only on the minutes it covers, never on the window that asked for it.
+        """
+        for bucket in iter_buckets(start_time, end_time, bucket_size):
+            minutes = sum(1 for minute in iter_buckets(bucket, bucket + bucket_size, _SIMULATED_GRAIN) if start_time <= minute < end_time)
+            if not minutes:
+                continue
+            for aggregate in _SIMULATED_MINUTE:
+                yield {
+                    "bucket": bucket,
+                    "status": aggregate["status"],
+                    "customer_id": "",
+                    "count": aggregate["count"] * minutes,
+                    "total_minor": aggregate["total_minor"] * minutes,
+                }
+
+def _cache_pieces(start_time: datetime, end_time: datetime, block: timedelta) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Splits [start_time, end_time) at every multiple of `block` from the epoch, in time order.
+    """
+    piece_start = start_time
+    while piece_start < end_time:
+        piece_end = min(floor_to_bucket(piece_start, block) + block, end_time)
+        yield piece_start, piece_end
+        piece_start = piece_end
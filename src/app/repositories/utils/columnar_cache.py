@@ -0,0 +1,141 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_BATCH_SIZE = 65536
+# Cached windows whose end falls further back than this are pruned, at most once per PRUNE_INTERVAL of writes
+DEFAULT_RETENTION = timedelta(days=7)
+PRUNE_INTERVAL = timedelta(hours=1)
+# Full precision, so distinct windows never share a file
+_WINDOW_FORMAT = "%Y%m%dT%H%M%S%f"
+
+def _arrow():
+    """
+    Imports pyarrow, and with it NumPy, on first columnar use, so jobs that never go columnar do not load either.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:  # pragma: no cover - columnar export is optional
+        raise ImportError("pyarrow is required for columnar analytics export; install pyarrow to enable it") from None
+    return pyarrow, pyarrow.ipc
+
+def summary_schema() -> "pa.Schema":
+    """
+    Arrow schema for reconciliation summary rows; key dimensions are nullable, measures are exact int64 minor units.
+    """
+    pa, _ = _arrow()
+    return pa.schema([
+        ("bucket", pa.timestamp("us")),
+        ("status", pa.string()),
+        ("customer_id", pa.string()),
+        ("count", pa.int64()),
+        ("total_minor", pa.int64()),
+    ])
+
+def rows_to_record_batches(rows: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator["pa.RecordBatch"]:
+    """
+    Packs a stream of summary rows into record batches of at most `batch_size` rows.
+    Only one batch worth of row dicts is held at a time.
+    """
+    pa, _ = _arrow()
+    schema = summary_schema()
+    pending = []
+    for row in rows:
+        pending.append(row)
+        if len(pending) >= batch_size:
+            yield pa.RecordBatch.from_pylist(pending, schema=schema)
+            pending = []
+    if pending:
+        yield pa.RecordBatch.from_pylist(pending, schema=schema)
+
+def table_from_batches(batches: Iterable["pa.RecordBatch"]) -> "pa.Table":
+    pa, _ = _arrow()
+    return pa.Table.from_batches(list(batches), schema=summary_schema())
+
+def concat_tables(tables: Sequence["pa.Table"]) -> "pa.Table":
+    """
+    Joins consecutive window pieces without copying; an empty sequence gives an empty summary table.
+    """
+    pa, _ = _arrow()
+    return pa.concat_tables(tables) if tables else table_from_batches([])
+
+def columns_from_table(table: "pa.Table", key_fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    Converts a summary table into the column layout produced by vectorized_diff.to_columns.
+    Measure columns are viewed without copying when the table is a single chunk; key dimensions are
+    materialized through vectorized_diff.key_column so both sides share key dtypes.
+    """
+    import numpy as np
+    from app.repositories.utils.vectorized_diff import key_column
+
+    columns = {field: key_column(table.column(field).to_pylist()) for field in key_fields}
+    for measure in ("count", "total_minor"):
+        columns[measure] = table.column(measure).to_numpy().astype(np.int64, copy=False)
+    return columns
+
+class ColumnarWindowCache:
+    """
+    Local disk cache of analytics summaries, one Arrow IPC file per closed (start, end) window.
+    Files are written atomically and read back memory-mapped, so repeated reconciliations and backfills over
+    the same window page data in from the OS cache instead of re-querying the analytics store.
+    Only closed windows may be cached: nothing invalidates a file once written.
+    """
+
+    def __init__(self, cache_dir: str, retention: timedelta = DEFAULT_RETENTION):
+        _arrow()
+        self.cache_dir = cache_dir
+        self.retention = retention
+        self.pruned_before: Optional[datetime] = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, start_time: datetime, end_time: datetime) -> str:
+        return os.path.join(self.cache_dir, f"summary-{start_time.strftime(_WINDOW_FORMAT)}-{end_time.strftime(_WINDOW_FORMAT)}.arrow")
+
+    def get(self, start_time: datetime, end_time: datetime) -> Optional["pa.Table"]:
+        path = self.path_for(start_time, end_time)
+        if not os.path.exists(path):
+            return None
+        pa, pa_ipc = _arrow()
+        # The table's buffers keep the mapping alive after the file handle and reader are closed
+        with pa.memory_map(path, "r") as source, pa_ipc.open_file(source) as reader:
+            return reader.read_all()
+
+    def put(self, start_time: datetime, end_time: datetime, batches: Iterable["pa.RecordBatch"]) -> "pa.Table":
+        """
+        Streams `batches` to the window's cache file and returns the memory-mapped result.
+        """
+        _, pa_ipc = _arrow()
+        schema = summary_schema()
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".arrow.tmp")
+        try:
+            with os.fdopen(fd, "wb") as sink, pa_ipc.new_file(sink, schema) as writer:
+                for batch in batches:
+                    writer.write_batch(batch)
+            os.replace(tmp_path, self.path_for(start_time, end_time))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        retain_after = end_time - self.retention
+        if self.pruned_before is None or retain_after - self.pruned_before >= PRUNE_INTERVAL:
+            self.prune(retain_after)
+        return self.get(start_time, end_time)
+
+    def prune(self, retain_after: datetime) -> int:
+        """
+        Deletes cached windows that ended before `retain_after`; returns the number removed.
+        """
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not (name.startswith("summary-") and name.endswith(".arrow")):
+                continue
+            window_end = datetime.strptime(name[len("summary-"):-len(".arrow")].split("-")[1], _WINDOW_FORMAT)
+            if window_end < retain_after.replace(tzinfo=None):
+                os.unlink(os.path.join(self.cache_dir, name))
+                removed += 1
+        self.pruned_before = retain_after
+        return removed
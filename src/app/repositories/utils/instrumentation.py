@@ -0,0 +1,295 @@
+import bisect
+import cProfile
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("reconciliation_engine.instrumentation")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# "cprofile" or "pyinstrument" profiles every profiled job run; unset leaves profiling to request_profile()
+PROFILE_MODE = os.getenv("RECONCILIATION_PROFILE")
+PROFILE_DIR = os.getenv("RECONCILIATION_PROFILE_DIR", tempfile.gettempdir())
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labelnames: Sequence[str], values: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    """
+    Monotonic counter, optionally split by a fixed set of label names.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[LabelValues, float] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self.lock:
+            values = sorted(self.values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in values]
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus exposition layout (_bucket, _sum, _count).
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (last slot is +Inf), sum, count]
+        self.values: Dict[LabelValues, List[Any]] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels: Any) -> "_Timer":
+        return _Timer(self, labels)
+
+    def samples(self) -> List[str]:
+        with self.lock:
+            values = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self.values.items())
+        lines = []
+        for key, (bucket_counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+class Gauge:
+    """
+    Point-in-time values read from `collect` at render time, so the hot path pays nothing to keep them current.
+    `collect` returns a mapping of label-value tuples to the current value.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], collect: Callable[[], Dict[LabelValues, float]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def samples(self) -> List[str]:
+        values = sorted(self.collect().items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in values]
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+class MetricsRegistry:
+    """
+    Process-local collection of metrics rendered together on the Prometheus text endpoint.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str], collect: Callable[[], Dict[LabelValues, float]]) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, collect))
+
+    def _register(self, metric):
+        with self.lock:
+            if metric.name in self.metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self.metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+SOURCE_QUERY_SECONDS = REGISTRY.histogram(
+    "reconciliation_source_query_seconds", "Time spent fetching summary rows, per source.", ("source",)
+)
+SOURCE_ROWS = REGISTRY.counter(
+    "reconciliation_source_rows_total", "Summary rows read, per source.", ("source",)
+)
+DIFF_SECONDS = REGISTRY.histogram(
+    "reconciliation_diff_seconds", "Time spent diffing source summaries, excluding fetch time.", ("mode",)
+)
+MISMATCHES_EMITTED = REGISTRY.counter(
+    "reconciliation_mismatches_total", "Drifting reconciliation keys detected.", ("mode",)
+)
+ALERT_DISPATCH_SECONDS = REGISTRY.histogram(
+    "reconciliation_alert_dispatch_seconds", "Webhook delivery latency for reconciliation alerts.", ("outcome",)
+)
+ALERT_BATCHES_DROPPED = REGISTRY.counter(
+    "reconciliation_alert_batches_dropped_total", "Mismatch batches dropped because the alert queue was full."
+)
+SCORECARD_EVALUATE_SECONDS = REGISTRY.histogram(
+    "scorecard_evaluate_seconds", "Scorecard evaluation handler latency.", ("endpoint",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+SCORECARDS_EVALUATED = REGISTRY.counter(
+    "scorecard_evaluations_total", "Metric sets evaluated by the scorecard handlers.", ("endpoint",)
+)
+RECONCILIATION_CYCLE_SECONDS = REGISTRY.histogram(
+    "reconciliation_cycle_seconds", "Wall time of resident daemon reconciliation cycles.", ("outcome",)
+)
+RECONCILIATION_CYCLES_SKIPPED = REGISTRY.counter(
+    "reconciliation_cycles_skipped_total", "Scheduled daemon cycles skipped because the previous cycle overran."
+)
+
+class TimedRows:
+    """
+    Wraps a summary row iterator, accumulating the time spent waiting on the source and the rows it yielded.
+    Both are recorded against `source` once the iterator is exhausted, so lazily streamed queries
+    are measured without including the consumer's own work.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], source: str):
+        self.rows = iter(rows)
+        self.source = source
+        self.seconds = 0.0
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            row = next(self.rows)
+        except StopIteration:
+            self.seconds += time.perf_counter() - started
+            SOURCE_QUERY_SECONDS.observe(self.seconds, source=self.source)
+            SOURCE_ROWS.inc(self.count, source=self.source)
+            raise
+        self.seconds += time.perf_counter() - started
+        self.count += 1
+        return row
+
+def timed_source(source: str, fetch: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps an eager summary fetcher so each call records its latency and returned row count against `source`.
+    """
+    @functools.wraps(fetch)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with SOURCE_QUERY_SECONDS.time(source=source):
+            rows = fetch(*args, **kwargs)
+        SOURCE_ROWS.inc(len(rows), source=source)
+        return rows
+    return wrapper
+
+_profile_requests: Dict[str, str] = {}
+
+def request_profile(job_name: str, mode: str = "cprofile") -> None:
+    """
+    Arms a one-shot profile of the next run of `job_name` ("cprofile" or "pyinstrument").
+    """
+    if mode not in ("cprofile", "pyinstrument"):
+        raise ValueError(f"Unknown profiler {mode!r}")
+    _profile_requests[job_name] = mode
+
+def profiled(job_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorates a job entry point with an on-demand profiler hook.
+    When no profile is requested the wrapper costs one dict lookup per job run.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mode = _profile_requests.pop(job_name, None) or PROFILE_MODE
+            if mode is None:
+                return func(*args, **kwargs)
+            return _run_profiled(job_name, mode, func, args, kwargs)
+        return wrapper
+    return decorator
+
+def _run_profiled(job_name: str, mode: str, func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    path_stem = os.path.join(PROFILE_DIR, f"{job_name}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}")
+
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed; profiling %s with cProfile instead.", job_name)
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.stop()
+                with open(f"{path_stem}.html", "w") as report:
+                    report.write(profiler.output_html())
+                logger.info("Wrote pyinstrument profile for %s to %s.html", job_name, path_stem)
+
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        profile.dump_stats(f"{path_stem}.prof")
+        logger.info("Wrote cProfile stats for %s to %s.prof", job_name, path_stem)
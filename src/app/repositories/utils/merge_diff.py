@@ -0,0 +1,62 @@
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+ReconciliationKey = Tuple[Any, ...]
+
+# Read-only: it is shared by every caller that stands it in for a missing side
+EMPTY_AGGREGATE: Mapping[str, Any] = MappingProxyType({"count": 0, "total_minor": 0})
+
+def reconciliation_key(item: Dict[str, Any], key_fields: Sequence[str]) -> ReconciliationKey:
+    """
+    Builds the composite ordering key for a summary row.
+    Missing dimensions collapse to an empty string so both sources always compare cleanly.
+    """
+    return tuple("" if item.get(field) is None else item.get(field) for field in key_fields)
+
+def _ordered(rows: Iterable[Dict[str, Any]], key_fields: Sequence[str], source: str) -> Iterator[Tuple[ReconciliationKey, Dict[str, Any]]]:
+    previous: Optional[ReconciliationKey] = None
+    for row in rows:
+        key = reconciliation_key(row, key_fields)
+        if previous is not None and key <= previous:
+            raise ValueError(f"{source} summary stream is not strictly ordered by {tuple(key_fields)}: {key!r} after {previous!r}")
+        previous = key
+        yield key, row
+
+def merge_join_diff(
+    tx_rows: Iterable[Dict[str, Any]],
+    analytics_rows: Iterable[Dict[str, Any]],
+    key_fields: Sequence[str],
+    amount_tolerance_minor: int = 0,
+) -> Iterator[Tuple[ReconciliationKey, Dict[str, Any], Dict[str, Any], int, int]]:
+    """
+    Full outer merge-join of two key-sorted summary streams.
+    Holds a single row from each side at a time, so memory stays constant regardless of window width or key cardinality.
+    Yields (key, expected, actual, count_drift, amount_drift_minor) only for keys that drift beyond tolerance.
+    """
+    tx_stream = _ordered(tx_rows, key_fields, "transactional")
+    an_stream = _ordered(analytics_rows, key_fields, "analytics")
+
+    tx_next = next(tx_stream, None)
+    an_next = next(an_stream, None)
+
+    while tx_next is not None or an_next is not None:
+        if an_next is None or (tx_next is not None and tx_next[0] < an_next[0]):
+            key, tx_data = tx_next
+            an_data = EMPTY_AGGREGATE
+            tx_next = next(tx_stream, None)
+        elif tx_next is None or an_next[0] < tx_next[0]:
+            key, an_data = an_next
+            tx_data = EMPTY_AGGREGATE
+            an_next = next(an_stream, None)
+        else:
+            key, tx_data = tx_next
+            an_data = an_next[1]
+            tx_next = next(tx_stream, None)
+            an_next = next(an_stream, None)
+
+        count_drift = abs(tx_data["count"] - an_data["count"])
+        amount_drift = abs(tx_data["total_minor"] - an_data["total_minor"])
+
+        if count_drift > 0 or amount_drift > amount_tolerance_minor:
+            # Plain copies, so callers may mutate or serialize them even where a side is EMPTY_AGGREGATE
+            yield key, dict(tx_data), dict(an_data), count_drift, amount_drift
@@ -0,0 +1,21 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Union
+
+# Payments are stored as NUMERIC(20, 7) (Stellar's 7-decimal precision); reconciliation carries
+# amounts as integer counts of 10^-7 units so sums and drift comparisons are exact.
+AMOUNT_SCALE = 7
+MINOR_UNITS_PER_UNIT = 10 ** AMOUNT_SCALE
+
+_QUANTUM = Decimal(1).scaleb(-AMOUNT_SCALE)
+
+def to_minor_units(amount: Union[Decimal, int, str, float]) -> int:
+    """
+    Converts a monetary amount to integer minor units, rounding half-even at the storage scale.
+    Floats go through their shortest repr so 0.1 becomes exactly 1000000, not its binary expansion.
+    """
+    if isinstance(amount, float):
+        amount = repr(amount)
+    return int(Decimal(amount).quantize(_QUANTUM, rounding=ROUND_HALF_EVEN).scaleb(AMOUNT_SCALE))
+
+def from_minor_units(minor_units: int) -> Decimal:
+    return Decimal(minor_units).scaleb(-AMOUNT_SCALE)
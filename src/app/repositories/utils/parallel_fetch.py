@@ -0,0 +1,88 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+SummaryFetcher = Callable[[datetime, datetime], List[Dict[str, Any]]]
+# Upper bound on concurrent summary queries per call, whatever the source and shard counts
+MAX_FETCH_WORKERS = int(os.getenv("RECONCILIATION_FETCH_WORKERS", "8"))
+
+class SourceTimeoutError(TimeoutError):
+    """
+    Raised when one summary source fails to answer within its own deadline.
+    """
+
+    def __init__(self, source: str, timeout: float):
+        super().__init__(f"{source} summary fetch exceeded {timeout}s timeout")
+        self.source = source
+        self.timeout = timeout
+
+def split_window(start_time: datetime, end_time: datetime, shards: int) -> List[Tuple[datetime, datetime]]:
+    """
+    Splits [start_time, end_time) into `shards` contiguous, non-overlapping sub-windows.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    step = (end_time - start_time) / shards
+    bounds = [start_time + step * index for index in range(shards)] + [end_time]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def merge_shard_rows(shard_results: Sequence[List[Dict[str, Any]]], key_fields: Sequence[str] = ("status",)) -> List[Dict[str, Any]]:
+    """
+    Folds per-shard summary rows back into one row per key by summing count and total_minor.
+    """
+    merged: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for rows in shard_results:
+        for item in rows:
+            key = tuple(item.get(field) for field in key_fields)
+            if key in merged:
+                merged[key]["count"] += item["count"]
+                merged[key]["total_minor"] += item["total_minor"]
+            else:
+                merged[key] = dict(item)
+    return list(merged.values())
+
+def fetch_summaries_concurrently(
+    sources: Dict[str, SummaryFetcher],
+    start_time: datetime,
+    end_time: datetime,
+    shards: int = 1,
+    timeouts: Optional[Dict[str, float]] = None,
+    key_fields: Sequence[str] = ("status",),
+    max_workers: int = MAX_FETCH_WORKERS,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Issues every source's summary query concurrently, optionally sharded into N sub-windows per source,
+    so end-to-end latency tracks the slowest single query instead of their sum.
+    At most `max_workers` queries run at once; fetches are queued window by window across sources so no
+    source waits behind all of another's shards. Each source is held to its own deadline measured from
+    submission, queueing included; on timeout or failure all not-yet-started fetches are cancelled and the
+    error is raised to the caller.
+    """
+    timeouts = timeouts or {}
+    windows = split_window(start_time, end_time, shards)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources) * len(windows))), thread_name_prefix="reconciliation-fetch")
+    submitted_at = time.monotonic()
+
+    try:
+        futures: Dict[str, List[Any]] = {name: [] for name in sources}
+        for window_start, window_end in windows:
+            for name, fetch in sources.items():
+                futures[name].append(executor.submit(fetch, window_start, window_end))
+
+        results = {}
+        for name, pending in futures.items():
+            timeout = timeouts.get(name)
+            shard_results = []
+            for future in pending:
+                remaining = None if timeout is None else max(0.0, submitted_at + timeout - time.monotonic())
+                try:
+                    shard_results.append(future.result(timeout=remaining))
+                except FuturesTimeoutError:
+                    raise SourceTimeoutError(name, timeout)
+            results[name] = shard_results[0] if len(windows) == 1 else merge_shard_rows(shard_results, key_fields)
+        return results
+    finally:
+        # Running queries cannot be interrupted from Python; backends should also enforce a statement timeout
+        executor.shutdown(wait=False, cancel_futures=True)
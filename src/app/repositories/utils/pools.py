@@ -0,0 +1,249 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from app.repositories.utils.instrumentation import REGISTRY
+
+logger = logging.getLogger("reconciliation_engine.pools")
+
+DATABASE_URL = os.getenv("RECONCILIATION_DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("RECONCILIATION_DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("RECONCILIATION_DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("RECONCILIATION_DB_POOL_TIMEOUT", "30"))
+# Recycle before typical server/load-balancer idle cutoffs so pre-ping rarely has to replace a connection
+DB_POOL_RECYCLE = int(os.getenv("RECONCILIATION_DB_POOL_RECYCLE", "1800"))
+ANALYTICS_POOL_SIZE = int(os.getenv("RECONCILIATION_ANALYTICS_POOL_SIZE", "4"))
+
+class PoolTimeoutError(TimeoutError):
+    """
+    Raised when no pooled client frees up within the checkout timeout.
+    """
+
+def build_engine(
+    url: str,
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+    pool_timeout: float = DB_POOL_TIMEOUT,
+    pool_recycle: int = DB_POOL_RECYCLE,
+) -> Engine:
+    """
+    Builds the pooled engine shared by every reconciliation run in the process.
+    Connections are health-checked on checkout (pool_pre_ping) and recycled on age. On psycopg 3, statements
+    executed more than once per connection are prepared server-side, and stay prepared across runs
+    because the connection outlives the session.
+    """
+    connect_args: Dict[str, Any] = {}
+    if url.startswith("postgresql+psycopg:"):
+        connect_args["prepare_threshold"] = 1
+
+    engine = create_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+    event.listen(engine, "connect", _count_connect)
+    return engine
+
+# Connections opened over the process lifetime; steady growth means the pool is churning
+_db_connects = 0
+# Connect events fire on whichever thread checks out a new connection
+_db_connects_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+def _count_connect(dbapi_connection, connection_record) -> None:
+    global _db_connects
+    with _db_connects_lock:
+        _db_connects += 1
+
+def get_engine() -> Engine:
+    """
+    Process-wide engine for RECONCILIATION_DATABASE_URL, created on first use.
+    """
+    global _engine, _session_factory
+    with _engine_lock:
+        if _engine is None:
+            if DATABASE_URL is None:
+                raise RuntimeError("RECONCILIATION_DATABASE_URL is not configured")
+            _engine = build_engine(DATABASE_URL)
+            _session_factory = sessionmaker(bind=_engine)
+        return _engine
+
+def get_session_factory() -> sessionmaker:
+    get_engine()
+    return _session_factory
+
+def reset_inherited_pools() -> None:
+    """
+    Call first in a forked worker process. Connections and clients inherited from the parent are dropped
+    without being closed, since closing them would tear down the parent's sockets; the worker then opens its own.
+    """
+    global _analytics_pool
+    if _engine is not None:
+        _engine.dispose(close=False)
+    _analytics_pool = None
+
+class ClientPool:
+    """
+    Bounded LIFO pool of long-lived backend clients (e.g. the analytics store client).
+    Clients are created lazily up to `max_size`, health-checked on checkout when `health_check` is given,
+    and replaced when the check fails or they exceed `max_age` seconds.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = ANALYTICS_POOL_SIZE,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        close: Optional[Callable[[Any], None]] = None,
+        max_age: Optional[float] = None,
+        checkout_timeout: float = 30.0,
+    ):
+        self.factory = factory
+        self.max_size = max_size
+        self.health_check = health_check
+        self.close_client = close
+        self.max_age = max_age
+        self.checkout_timeout = checkout_timeout
+        self.idle: List[Any] = []
+        self.created_at: Dict[int, float] = {}
+        self.in_use = 0
+        self.created = 0
+        self.waits = 0
+        self.condition = threading.Condition()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        client = self._checkout()
+        try:
+            yield client
+        except Exception:
+            # The client may be mid-request or in a bad state; do not hand it to the next caller
+            self._discard(client)
+            raise
+        else:
+            self._checkin(client)
+
+    def _checkout(self) -> Any:
+        deadline = time.monotonic() + self.checkout_timeout
+        with self.condition:
+            if not self.idle and self.in_use >= self.max_size:
+                self.waits += 1
+            while not self.idle and self.in_use >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.condition.wait(remaining):
+                    raise PoolTimeoutError(f"No pooled client available within {self.checkout_timeout}s")
+            self.in_use += 1
+            client = self.idle.pop() if self.idle else None
+
+        if client is not None and self._healthy(client):
+            return client
+        if client is not None:
+            self._close(client)
+        try:
+            client = self.factory()
+        except Exception:
+            with self.condition:
+                self.in_use -= 1
+                self.condition.notify()
+            raise
+        self.created += 1
+        self.created_at[id(client)] = time.monotonic()
+        return client
+
+    def _healthy(self, client: Any) -> bool:
+        if self.max_age is not None and time.monotonic() - self.created_at.get(id(client), 0) > self.max_age:
+            return False
+        if self.health_check is None:
+            return True
+        try:
+            return bool(self.health_check(client))
+        except Exception as e:
+            logger.warning("Pooled client failed its health check: %s", e)
+            return False
+
+    def _checkin(self, client: Any) -> None:
+        with self.condition:
+            self.in_use -= 1
+            self.idle.append(client)
+            self.condition.notify()
+
+    def _discard(self, client: Any) -> None:
+        with self.condition:
+            self.in_use -= 1
+            self.condition.notify()
+        self._close(client)
+
+    def _close(self, client: Any) -> None:
+        self.created_at.pop(id(client), None)
+        if self.close_client is not None:
+            try:
+                self.close_client(client)
+            except Exception as e:
+                logger.warning("Failed to close pooled client: %s", e)
+
+    def stats(self) -> Dict[str, float]:
+        with self.condition:
+            return {
+                "in_use": self.in_use,
+                "idle": len(self.idle),
+                "max_size": self.max_size,
+                "saturation": self.in_use / self.max_size if self.max_size else 0.0,
+                "waits": self.waits,
+                "created": self.created,
+            }
+
+_analytics_pool: Optional[ClientPool] = None
+
+def configure_analytics_client_pool(factory: Callable[[], Any], **options: Any) -> ClientPool:
+    """
+    Installs the process-wide analytics client pool; call once at startup with the client constructor.
+    """
+    global _analytics_pool
+    _analytics_pool = ClientPool(factory, **options)
+    return _analytics_pool
+
+def get_analytics_client_pool() -> ClientPool:
+    if _analytics_pool is None:
+        raise RuntimeError("Analytics client pool is not configured; call configure_analytics_client_pool at startup")
+    return _analytics_pool
+
+def _db_pool_stats() -> Dict[str, float]:
+    if _engine is None:
+        return {}
+    pool = _engine.pool
+    capacity = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    checked_out = pool.checkedout()
+    return {
+        "in_use": checked_out,
+        "idle": pool.checkedin(),
+        "max_size": capacity,
+        "saturation": checked_out / capacity if capacity else 0.0,
+        "created": _db_connects,
+    }
+
+def _collect(stat: str):
+    def collect():
+        values = {}
+        for backend, stats in (("transactional", _db_pool_stats()), ("analytics", _analytics_pool.stats() if _analytics_pool else {})):
+            if stat in stats:
+                values[(backend,)] = stats[stat]
+        return values
+    return collect
+
+REGISTRY.gauge("reconciliation_pool_in_use", "Pooled connections or clients currently checked out.", ("backend",), _collect("in_use"))
+REGISTRY.gauge("reconciliation_pool_idle", "Pooled connections or clients idle and ready for reuse.", ("backend",), _collect("idle"))
+REGISTRY.gauge("reconciliation_pool_saturation", "Checked-out share of pool capacity, 0-1.", ("backend",), _collect("saturation"))
+REGISTRY.gauge("reconciliation_pool_created", "Connections or clients opened since process start.", ("backend",), _collect("created"))
+REGISTRY.gauge("reconciliation_pool_waits", "Checkouts that had to wait for a free client.", ("backend",), _collect("waits"))
@@ -0,0 +1,82 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional
+
+DEFAULT_CURSOR_PATH = os.getenv("RECONCILIATION_CURSOR_PATH", "reconciliation_cursor.db")
+
+def floor_to_bucket(timestamp: datetime, bucket_size: timedelta) -> datetime:
+    """
+    Aligns a timestamp down to the start of its bucket, counting from the Unix epoch.
+    """
+    epoch = datetime(1970, 1, 1, tzinfo=timestamp.tzinfo)
+    return timestamp - ((timestamp - epoch) % bucket_size)
+
+def iter_buckets(start_time: datetime, end_time: datetime, bucket_size: timedelta) -> Iterator[datetime]:
+    bucket = floor_to_bucket(start_time, bucket_size)
+    while bucket < end_time:
+        yield bucket
+        bucket += bucket_size
+
+class ReconciliationCursor:
+    """
+    Persisted reconciliation checkpoint backed by a local SQLite file.
+    Tracks the high watermark of closed buckets already reconciled, plus a per-bucket source fingerprint
+    used to decide whether a late-arriving bucket needs a re-check.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CURSOR_PATH, job_name: str = "analytics_reconciliation"):
+        self.job_name = job_name
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reconciliation_watermarks (
+                job_name TEXT PRIMARY KEY,
+                watermark TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS reconciliation_buckets (
+                job_name TEXT NOT NULL,
+                bucket_start TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (job_name, bucket_start)
+            );
+            """
+        )
+
+    def get_watermark(self) -> Optional[datetime]:
+        row = self.conn.execute(
+            "SELECT watermark FROM reconciliation_watermarks WHERE job_name = ?", (self.job_name,)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def get_fingerprints(self, start_time: datetime, end_time: datetime) -> Dict[datetime, str]:
+        rows = self.conn.execute(
+            "SELECT bucket_start, fingerprint FROM reconciliation_buckets "
+            "WHERE job_name = ? AND bucket_start >= ? AND bucket_start < ?",
+            (self.job_name, start_time.isoformat(), end_time.isoformat()),
+        )
+        return {datetime.fromisoformat(bucket): fingerprint for bucket, fingerprint in rows}
+
+    def checkpoint(self, watermark: datetime, fingerprints: Dict[datetime, str], retain_after: datetime) -> None:
+        """
+        Atomically advances the watermark, records bucket fingerprints and prunes buckets that
+        have aged out of the late-arrival lookback.
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO reconciliation_watermarks (job_name, watermark) VALUES (?, ?) "
+                "ON CONFLICT(job_name) DO UPDATE SET watermark = excluded.watermark",
+                (self.job_name, watermark.isoformat()),
+            )
+            self.conn.executemany(
+                "INSERT INTO reconciliation_buckets (job_name, bucket_start, fingerprint) VALUES (?, ?, ?) "
+                "ON CONFLICT(job_name, bucket_start) DO UPDATE SET fingerprint = excluded.fingerprint",
+                [(self.job_name, bucket.isoformat(), fingerprint) for bucket, fingerprint in fingerprints.items()],
+            )
+            self.conn.execute(
+                "DELETE FROM reconciliation_buckets WHERE job_name = ? AND bucket_start < ?",
+                (self.job_name, retain_after.isoformat()),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
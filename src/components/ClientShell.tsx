@@ -4,10 +4,13 @@ import type { ReactNode } from "react";
 import { useConflictDetection } from "@/components/notifications/ConflictNotification";
 import { ConflictNotification } from "@/components/notifications/ConflictNotification";
 import SessionExpiryModal from "@/components/session/SessionExpiryModal";
+import { LiveRegion, useOutageRealtimeStream } from "@/hooks/useOutageRealtime";
 import { getPendingMutations, clearAllPendingMutations } from "@/lib/mutationTracker";
 
 export default function ClientShell({ children, nonce }: { children: ReactNode; nonce?: string }) {
   const { conflict, dismiss, refreshContext } = useConflictDetection();
+  // One unfiltered feed for the whole app keeps outage, SLA and payment views current without fast polling
+  useOutageRealtimeStream();
   const pendingMutations = getPendingMutations().map((m) => ({
     id: m.id,
     description: m.description,
@@ -28,6 +31,7 @@ export default function ClientShell({ children, nonce }: { children: ReactNode;
   return (
     <>
       {children}
+      <LiveRegion />
       {conflict && (
         <ConflictNotification
           conflict={conflict}
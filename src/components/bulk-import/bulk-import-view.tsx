@@ -3,20 +3,30 @@
 import Link from "next/link";
 import { useRef, useState, useCallback, useId } from "react";
 
-import { bulkImportOutages } from "@/services/bulkImportService";
+import {
+  REQUIRED_IMPORT_FIELDS,
+  createRowParser,
+  isCSVImportFile,
+  parseCSVLine,
+  readLines,
+  validateOutageRow,
+} from "@/lib/bulkImportRows";
+import { createIdempotencyNonce } from "@/lib/idempotency";
+import { BulkImportError, bulkImportOutages, streamBulkImportOutages } from "@/services/bulkImportService";
 import type {
   BulkImportResult,
   ImportValidationError,
 } from "@/types/bulkImport";
 
 // ─── Constants ───────────────────────────────────────────────────────────────
-const ACCEPTED_TYPES = ["text/csv", "application/json"] as const;
-const ACCEPTED_EXTENSIONS = [".csv", ".json"] as const;
+const ACCEPTED_TYPES = ["text/csv", "application/x-ndjson", "application/json"] as const;
+const ACCEPTED_EXTENSIONS = [".csv", ".ndjson", ".json"] as const;
 const MAX_PREVIEW_ROWS = 100;
+// JSON arrays are parsed and uploaded whole; CSV and NDJSON stream at flat memory and have no cap
 const MAX_FILE_SIZE_MB = 5;
 const MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024;
 
-const REQUIRED_FIELDS = ["service_id", "start_time", "end_time"] as const;
+const REQUIRED_FIELDS = REQUIRED_IMPORT_FIELDS;
 
 type AcceptedExtension = (typeof ACCEPTED_EXTENSIONS)[number];
 type AcceptedMimeType = (typeof ACCEPTED_TYPES)[number];
@@ -27,7 +37,10 @@ interface PreviewState {
   rows: string[][];
   warnings: ImportValidationError[];
   errors: ImportValidationError[];
-  totalRows: number; // Added: track total for "showing X of Y" messaging
+  /** Source row number of each previewed row, as used in validation errors. */
+  rowNumbers: number[];
+  /** True when the file has more rows than the preview shows. */
+  hasMore: boolean;
 }
 
 interface FileValidationResult {
@@ -43,137 +56,7 @@ type UploadStatus =
   | "error"
   | "cancelled";
 
-// ─── CSV Parsing ─────────────────────────────────────────────────────────────
-interface ParsedCSV {
-  headers: string[];
-  rows: string[][];
-  totalRows: number;
-}
-
-function parseCSV(text: string): ParsedCSV {
-  const lines = text
-    .trim()
-    .split(/\r?\n/)
-    .filter((line) => line.trim().length > 0);
-
-  if (lines.length === 0) {
-    return { headers: [], rows: [], totalRows: 0 };
-  }
-
-  // Robust CSV parsing: handles quoted fields containing commas
-  const parseLine = (line: string): string[] => {
-    const result: string[] = [];
-    let current = "";
-    let inQuotes = false;
-
-    for (let i = 0; i < line.length; i++) {
-      const char = line[i];
-      const nextChar = line[i + 1];
-
-      if (char === '"') {
-        if (inQuotes && nextChar === '"') {
-          current += '"';
-          i++; // Skip escaped quote
-        } else {
-          inQuotes = !inQuotes;
-        }
-      } else if (char === "," && !inQuotes) {
-        result.push(current.trim());
-        current = "";
-      } else {
-        current += char;
-      }
-    }
-    result.push(current.trim());
-    return result;
-  };
-
-  const headers = parseLine(lines[0]).map((h) => h.replace(/^"|"$/g, ""));
-  const allRows = lines.slice(1).map(parseLine);
-
-  return {
-    headers,
-    rows: allRows.slice(0, MAX_PREVIEW_ROWS),
-    totalRows: allRows.length,
-  };
-}
-
 // ─── Validation ──────────────────────────────────────────────────────────────
-function isValidDate(dateString: string): boolean {
-  const d = new Date(dateString);
-  return d instanceof Date && !isNaN(d.getTime());
-}
-
-function validateCSV(
-  headers: string[],
-  rows: string[][],
-): ImportValidationError[] {
-  const errors: ImportValidationError[] = [];
-
-  const missing = REQUIRED_FIELDS.filter((f) => !headers.includes(f));
-  if (missing.length > 0) {
-    errors.push({
-      message: `Missing required columns: ${missing.join(", ")}`,
-      field: missing.join(", "),
-    });
-  }
-
-  rows.forEach((row, i) => {
-    if (row.length !== headers.length) {
-      errors.push({
-        row: i + 2,
-        message: `Column count mismatch (expected ${headers.length}, got ${row.length})`,
-      });
-    }
-
-    // Validate required fields have values and correct formats
-    REQUIRED_FIELDS.forEach((field) => {
-      const colIndex = headers.indexOf(field);
-      if (colIndex !== -1) {
-        if (!row[colIndex] || row[colIndex].trim() === "") {
-          errors.push({
-            row: i + 2,
-            field,
-            message: `Required field "${field}" is empty`,
-          });
-        } else if (field === "start_time" || field === "end_time") {
-          if (!isValidDate(row[colIndex])) {
-            errors.push({
-              row: i + 2,
-              field,
-              message: `Invalid date format for "${field}"`,
-            });
-          }
-        }
-      }
-    });
-
-    // Check if end_time is after start_time
-    const startTimeIndex = headers.indexOf("start_time");
-    const endTimeIndex = headers.indexOf("end_time");
-    if (
-      startTimeIndex !== -1 &&
-      endTimeIndex !== -1 &&
-      row[startTimeIndex] &&
-      row[endTimeIndex] &&
-      isValidDate(row[startTimeIndex]) &&
-      isValidDate(row[endTimeIndex])
-    ) {
-      const startTime = new Date(row[startTimeIndex]);
-      const endTime = new Date(row[endTimeIndex]);
-      if (startTime >= endTime) {
-        errors.push({
-          row: i + 2,
-          field: "end_time",
-          message: "End time must be after start time",
-        });
-      }
-    }
-  });
-
-  return errors;
-}
-
 function validateJSON(text: string): {
   errors: ImportValidationError[];
   parsed?: Record<string, unknown>[];
@@ -213,54 +96,81 @@ function validateJSON(text: string): {
       return;
     }
 
-    REQUIRED_FIELDS.forEach((field) => {
-      if (item[field] == null || item[field] === "") {
-        errors.push({
-          row: i + 1,
-          field,
-          message: `Missing required field "${field}"`,
-        });
-      }
-    });
+    errors.push(...validateOutageRow(item, i + 1));
   });
 
   return { errors, parsed: records };
 }
 
 // ─── Preview Builder ─────────────────────────────────────────────────────────
-async function buildPreview(file: File): Promise<PreviewState> {
-  const text = await file.text();
-  const ext = file.name
-    .slice(file.name.lastIndexOf("."))
-    .toLowerCase() as AcceptedExtension;
-
-  if (ext === ".csv" || file.type === "text/csv") {
-    const { headers, rows, totalRows } = parseCSV(text);
-    const errors = validateCSV(headers, rows);
-    const warnings: ImportValidationError[] = [];
-
-    if (totalRows === 0 && errors.length === 0) {
-      warnings.push({ message: "File has a header row but no data rows." });
-    } else if (totalRows > MAX_PREVIEW_ROWS) {
-      warnings.push({
-        message: `Showing ${MAX_PREVIEW_ROWS} of ${totalRows} total rows.`,
-      });
+function isStreamedImportFile(file: File): boolean {
+  return isCSVImportFile(file) || file.name.toLowerCase().endsWith(".ndjson") || file.type === "application/x-ndjson";
+}
+
+/**
+ * Previews a CSV or NDJSON file from its first MAX_PREVIEW_ROWS rows, read through the same line
+ * reader and row parser as the streaming upload; the rest of the file is never loaded here.
+ */
+async function buildStreamedPreview(file: File): Promise<PreviewState> {
+  const isCSV = isCSVImportFile(file);
+  const parseRow = createRowParser(isCSV);
+  let headers: string[] = [];
+  const rows: string[][] = [];
+  const rowNumbers: number[] = [];
+  const errors: ImportValidationError[] = [];
+  let hasMore = false;
+
+  for await (const { line, lineNumber } of readLines(file)) {
+    if (rows.length >= MAX_PREVIEW_ROWS) {
+      hasMore = true;
+      break;
+    }
+
+    const parsed = parseRow(line, lineNumber);
+    errors.push(...parsed.errors);
+    if (parsed.header) {
+      headers = parsed.header;
+      // A missing column fails every row
+      if (parsed.errors.length) break;
+      continue;
     }
 
-    return { headers, rows, errors, warnings, totalRows };
+    if (!headers.length && parsed.record) headers = Object.keys(parsed.record);
+    rowNumbers.push(lineNumber);
+    if (isCSV) {
+      rows.push(parseCSVLine(line));
+    } else {
+      rows.push(parsed.record ? headers.map((h) => String(parsed.record?.[h] ?? "")) : [line]);
+    }
   }
 
-  // JSON
-  const { errors, parsed } = validateJSON(text);
+  const warnings: ImportValidationError[] = [];
+  if (rows.length === 0 && errors.length === 0) {
+    warnings.push({ message: isCSV ? "File has a header row but no data rows." : "File has no data rows." });
+  } else if (hasMore) {
+    warnings.push({
+      message: `Showing the first ${MAX_PREVIEW_ROWS} rows; the remaining rows are validated as they upload.`,
+    });
+  }
+
+  return { headers, rows, rowNumbers, errors, warnings, hasMore };
+}
+
+async function buildPreview(file: File): Promise<PreviewState> {
+  if (isStreamedImportFile(file)) {
+    return buildStreamedPreview(file);
+  }
+
+  // JSON arrays are bounded by MAX_FILE_SIZE_BYTES, so they are parsed whole
+  const { errors, parsed } = validateJSON(await file.text());
 
   if (errors.length > 0 || !parsed) {
-    return { headers: [], rows: [], errors, warnings: [], totalRows: 0 };
+    return { headers: [], rows: [], rowNumbers: [], errors, warnings: [], hasMore: false };
   }
 
   const headers = parsed.length > 0 ? Object.keys(parsed[0]) : [];
-  const rows = parsed
-    .slice(0, MAX_PREVIEW_ROWS)
-    .map((r) => headers.map((h) => String(r[h] ?? "")));
+  const previewed = parsed.slice(0, MAX_PREVIEW_ROWS);
+  const rows = previewed.map((r) => headers.map((h) => String(r[h] ?? "")));
 
   const warnings: ImportValidationError[] = [];
   if (parsed.length > MAX_PREVIEW_ROWS) {
@@ -269,7 +179,14 @@ async function buildPreview(file: File): Promise<PreviewState> {
     });
   }
 
-  return { headers, rows, errors, warnings, totalRows: parsed.length };
+  return {
+    headers,
+    rows,
+    rowNumbers: previewed.map((_, i) => i + 1),
+    errors,
+    warnings,
+    hasMore: parsed.length > MAX_PREVIEW_ROWS,
+  };
 }
 
 // ─── Components ──────────────────────────────────────────────────────────────
@@ -395,14 +312,16 @@ function ValidationList({ errors }: { errors: ImportValidationError[] }) {
 function ValidationTable({
   headers,
   rows,
+  rowNumbers,
   errors,
 }: {
   headers: string[];
   rows: string[][];
+  rowNumbers: number[];
   errors: ImportValidationError[];
 }) {
   const getCellError = (rowIndex: number, field: string) => {
-    return errors.find((e) => e.row === rowIndex + 2 && e.field === field)
+    return errors.find((e) => e.row === rowNumbers[rowIndex] && e.field === field)
       ?.message;
   };
 
@@ -426,10 +345,10 @@ function ValidationTable({
         </thead>
         <tbody className="divide-y divide-gray-200">
           {rows.map((row, i) => {
-            const hasRowError = errors.some((e) => e.row === i + 2);
+            const hasRowError = errors.some((e) => e.row === rowNumbers[i]);
             return (
               <tr key={`row-${i}`} className={hasRowError ? "bg-red-50" : ""}>
-                <td className="px-4 py-2 text-gray-500">{i + 2}</td>
+                <td className="px-4 py-2 text-gray-500">{rowNumbers[i]}</td>
                 {headers.map((h, j) => {
                   const cellError = getCellError(i, h);
                   return (
@@ -460,6 +379,8 @@ function ValidationTable({
 export default function BulkImportView() {
   const inputRef = useRef<HTMLInputElement>(null);
   const abortRef = useRef<AbortController | null>(null);
+  // One import per selected file: retrying after a failure resumes it, re-selecting the file starts a new one
+  const importIdRef = useRef<string>(createIdempotencyNonce());
   const dropZoneRef = useRef<HTMLDivElement>(null);
 
   const [file, setFile] = useState<File | null>(null);
@@ -491,10 +412,10 @@ export default function BulkImportView() {
       };
     }
 
-    if (nextFile.size > MAX_FILE_SIZE_BYTES) {
+    if (!isStreamedImportFile(nextFile) && nextFile.size > MAX_FILE_SIZE_BYTES) {
       return {
         valid: false,
-        error: `File too large. Maximum size: ${MAX_FILE_SIZE_MB}MB`,
+        error: `File too large. Maximum size for .json: ${MAX_FILE_SIZE_MB}MB; use .csv or .ndjson for larger imports`,
       };
     }
 
@@ -518,6 +439,7 @@ export default function BulkImportView() {
 
       setFileError(null);
       setFile(nextFile);
+      importIdRef.current = createIdempotencyNonce();
       setResult(null);
       setSubmitError(null);
       setStatus("validating");
@@ -599,10 +521,17 @@ export default function BulkImportView() {
     setResult(null);
 
     try {
-      const response = await bulkImportOutages(file, {
-        signal: controller.signal,
-        onProgress: setProgress,
-      });
+      // CSV and NDJSON rows are independent lines, so they stream in batches; JSON arrays go up whole
+      const response = isStreamedImportFile(file)
+        ? await streamBulkImportOutages(file, {
+            importId: importIdRef.current,
+            signal: controller.signal,
+            onProgress: ({ percent }) => setProgress(percent),
+          })
+        : await bulkImportOutages(file, {
+            signal: controller.signal,
+            onProgress: setProgress,
+          });
 
       setResult(response);
       setFile(null);
@@ -616,6 +545,11 @@ export default function BulkImportView() {
         (err as { name?: string }).name === "AbortError"
       ) {
         setStatus("cancelled");
+      } else if (err instanceof BulkImportError && err.partial.imported > 0) {
+        setSubmitError(
+          `${err.message} ${err.partial.imported} rows were imported before the failure; uploading again resumes the import.`,
+        );
+        setStatus("error");
       } else if (err instanceof Error) {
         setSubmitError(err.message || "Upload failed. Please try again.");
         setStatus("error");
@@ -668,7 +602,8 @@ export default function BulkImportView() {
         </div>
         <p className="text-sm text-gray-500">
           Upload a{" "}
-          <code className="rounded bg-gray-100 px-1 py-0.5 text-xs">.csv</code>{" "}
+          <code className="rounded bg-gray-100 px-1 py-0.5 text-xs">.csv</code>,{" "}
+          <code className="rounded bg-gray-100 px-1 py-0.5 text-xs">.ndjson</code>{" "}
           or{" "}
           <code className="rounded bg-gray-100 px-1 py-0.5 text-xs">.json</code>{" "}
           file to create outages in one pass.
@@ -716,7 +651,7 @@ export default function BulkImportView() {
           <span className="text-blue-600 underline">browse</span>
         </p>
         <p className="mt-1 text-xs text-gray-400">
-          Accepted formats: {ACCEPTED_EXTENSIONS.join(", ")} (max{" "}
+          Accepted formats: {ACCEPTED_EXTENSIONS.join(", ")} (.json max{" "}
           {MAX_FILE_SIZE_MB}MB)
         </p>
         <input
@@ -820,6 +755,7 @@ export default function BulkImportView() {
             <ValidationTable
               headers={preview.headers}
               rows={preview.rows}
+              rowNumbers={preview.rowNumbers}
               errors={preview.errors}
             />
           )}
@@ -845,8 +781,8 @@ export default function BulkImportView() {
                   Preview
                 </p>
                 <p className="text-xs text-gray-400">
-                  {preview.totalRows > MAX_PREVIEW_ROWS
-                    ? `Showing ${preview.rows.length} of ${preview.totalRows} rows`
+                  {preview.hasMore
+                    ? `Showing the first ${preview.rows.length} rows`
                     : `${preview.rows.length} row${preview.rows.length > 1 ? "s" : ""}`}
                 </p>
               </div>
@@ -8,6 +8,7 @@ import {
   batchRecalculateSLA,
   batchResolveOutages,
 } from "@/services/outages";
+import type { PaymentJob } from "@/types/payment";
 
 import { outageKeys } from "./useOutageMutations";
 
@@ -29,6 +30,8 @@ export interface BatchResult {
   failure: number;
   errors: Array<{ id: string; error: string }>;
   operation: BatchOperation;
+  /** Batched payment generation job enqueued by a bulk resolve, if any */
+  paymentJob?: PaymentJob | null;
 }
 
 export interface UseBatchOperationsReturn {
@@ -66,6 +69,7 @@ export function useBatchOperations(): UseBatchOperationsReturn {
         success_count: number;
         failure_count: number;
         errors?: Array<{ id: string; error: string }>;
+        payment_job?: PaymentJob | null;
       },
     ): BatchResult => ({
       total,
@@ -73,6 +77,7 @@ export function useBatchOperations(): UseBatchOperationsReturn {
       failure: response.failure_count,
       errors: response.errors ?? [],
       operation,
+      paymentJob: response.payment_job ?? null,
     }),
     [],
   );
@@ -98,6 +103,7 @@ export function useBatchOperations(): UseBatchOperationsReturn {
             success_count: number;
             failure_count: number;
             errors?: Array<{ id: string; error: string }>;
+            payment_job?: PaymentJob | null;
           },
         );
         setResult(res);
@@ -141,14 +147,16 @@ export function useBatchOperations(): UseBatchOperationsReturn {
     mutationFn: async ({
       ids,
       mttrMinutes,
+      generatePayments,
     }: {
       ids: string[];
       mttrMinutes?: number;
+      generatePayments?: boolean;
     }) => {
       return executeWithProgress(
         "resolve",
         ids,
-        () => batchResolveOutages(ids, { mttr_minutes: mttrMinutes }),
+        () => batchResolveOutages(ids, { mttr_minutes: mttrMinutes, generate_payments: generatePayments }),
         () => {
           void queryClient.invalidateQueries({ queryKey: outageKeys.all });
         },
@@ -177,8 +185,8 @@ export function useBatchOperations(): UseBatchOperationsReturn {
     progress,
     result,
     acknowledge: (ids: string[]) => acknowledgeMutation.mutateAsync(ids),
-    resolve: (ids: string[], mttrMinutes?: number) =>
-      resolveMutation.mutateAsync({ ids, mttrMinutes }),
+    resolve: (ids: string[], mttrMinutes?: number, generatePayments = false) =>
+      resolveMutation.mutateAsync({ ids, mttrMinutes, generatePayments }),
     recalculateSLA: (ids: string[]) => recalculateSLAMutation.mutateAsync(ids),
     isExecuting:
       acknowledgeMutation.isPending ||
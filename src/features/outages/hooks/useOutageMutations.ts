@@ -1,5 +1,7 @@
+import { useEffect } from "react";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 
+import { isChangeFeedLive, onChangeFeedStatusChange } from "@/lib/changeFeed";
 import { deleteOutage, getOutage, resolveOutage } from "@/services/outages";
 
 export const outageKeys = {
@@ -8,12 +10,26 @@ export const outageKeys = {
 };
 
 export function useOutage(id: string) {
+  const qc = useQueryClient();
+
+  // refetchInterval is only re-read after a fetch, so a dropped feed refetches now to fall back to the fast poll
+  useEffect(() => {
+    if (!id) return;
+    return onChangeFeedStatusChange((connected) => {
+      if (!connected) void qc.invalidateQueries({ queryKey: outageKeys.detail(id) });
+    });
+  }, [qc, id]);
+
   return useQuery({
     queryKey: outageKeys.detail(id),
-    queryFn: () => getOutage(id),
+    queryFn: ({ signal }) => getOutage(id, { signal }),
     enabled: !!id,
-    refetchInterval: (query) =>
-      query.state.data?.status === "resolved" ? false : 15_000,
+    // A feed delivering this outage's events invalidates the query on transitions, so only a slow safety poll remains
+    refetchInterval: (query) => {
+      const outage = query.state.data;
+      if (outage?.status === "resolved") return false;
+      return isChangeFeedLive(outage) ? 300_000 : 15_000;
+    },
   });
 }
 
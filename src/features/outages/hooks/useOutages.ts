@@ -1,6 +1,9 @@
-import { keepPreviousData, useQuery } from "@tanstack/react-query";
+import { useEffect } from "react";
+import { keepPreviousData, useQuery, useQueryClient } from "@tanstack/react-query";
 
+import { isChangeFeedLive, onChangeFeedStatusChange } from "@/lib/changeFeed";
 import { fetchOutages } from "@/lib/outages";
+import { queryKeys } from "@/lib/queryKeys";
 import type { PaginatedOutages } from "@/types/outages";
 
 export interface UseOutagesParams {
@@ -16,6 +19,7 @@ const DEFAULT_PAGE = 1;
 const DEFAULT_PAGE_SIZE = 10;
 
 export function useOutages(params: UseOutagesParams = {}) {
+  const qc = useQueryClient();
   const page = params.page ?? DEFAULT_PAGE;
 
   const normalizedParams: UseOutagesParams = {
@@ -27,8 +31,16 @@ export function useOutages(params: UseOutagesParams = {}) {
     sort: params.sort?.trim() || undefined,
   };
 
+  // refetchInterval is only re-read after a fetch, so a dropped feed refetches now to fall back to the fast poll
+  useEffect(() => {
+    return onChangeFeedStatusChange((connected) => {
+      if (!connected) void qc.invalidateQueries({ queryKey: ["outages", "list"] });
+    });
+  }, [qc]);
+
   return useQuery<PaginatedOutages, Error>({
-    queryKey: ["outages", normalizedParams],
+    // Under ["outages", "list"], which the change feed invalidates on every outage event
+    queryKey: queryKeys.outages.list({ ...normalizedParams }),
 
     queryFn: () => fetchOutages({
       page: normalizedParams.page ?? DEFAULT_PAGE,
@@ -49,6 +61,9 @@ export function useOutages(params: UseOutagesParams = {}) {
 
     refetchOnWindowFocus: false,
 
+    // New outages only reach the list through a poll unless a live feed covers the filtered severity
+    refetchInterval: () => (isChangeFeedLive({ severity: normalizedParams.severity }) ? 300_000 : 15_000),
+
     enabled: page > 0,
 
     select: (data) => ({
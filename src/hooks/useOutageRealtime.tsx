@@ -1,33 +1,52 @@
 "use client";
 
-import { useEffect, useRef, useState } from "react";
+import { useEffect, useState } from "react";
 import { useQueryClient } from "@tanstack/react-query";
 
+import { getChangeFeed, type ChangeFeedFilter } from "@/lib/changeFeed";
+import { queryKeys } from "@/lib/queryKeys";
+import { applyOutageChange, invalidateOpenOutageNodeIndex } from "@/services/outages";
+
 // Closes #351: real-time outage status updates via Server-Sent Events
 // Closes #356: ARIA live region announcements for async state changes
 
-export function useOutageRealtimeStream(streamUrl = "/api/v1/stream/outages") {
+export function useOutageRealtimeStream(
+  streamUrl = "/api/v1/stream/outages",
+  filter: ChangeFeedFilter = {},
+) {
   const queryClient = useQueryClient();
-  const sourceRef = useRef<EventSource | null>(null);
+  const customerIds = filter.customerIds?.join(",") ?? "";
+  const severities = filter.severities?.join(",") ?? "";
 
   useEffect(() => {
-    const source = new EventSource(streamUrl, { withCredentials: true });
-    sourceRef.current = source;
-
-    source.addEventListener("outage.status_changed", (event) => {
-      const payload = JSON.parse((event as MessageEvent).data) as {
-        id: string;
-        status: string;
-      };
-      queryClient.invalidateQueries({ queryKey: ["outages", payload.id] });
-      queryClient.invalidateQueries({ queryKey: ["outages", "list"] });
-      announce(`Outage ${payload.id} status changed to ${payload.status}`);
+    const feed = getChangeFeed(streamUrl, {
+      customerIds: customerIds ? customerIds.split(",") : undefined,
+      severities: severities ? severities.split(",") : undefined,
     });
 
-    source.onerror = () => source.close();
+    return feed.subscribe({
+      onEvent: (event) => {
+        applyOutageChange(event);
+        queryClient.invalidateQueries({ queryKey: ["outages", event.outage_id] });
+        queryClient.invalidateQueries({ queryKey: ["outages", "list"] });
 
-    return () => source.close();
-  }, [queryClient, streamUrl]);
+        if (event.type === "outage.status_changed") {
+          announce(`Outage ${event.outage_id} status changed to ${event.status}`);
+        } else if (event.type === "sla.breached") {
+          announce(`Outage ${event.outage_id} breached its SLA`);
+        } else if (event.type === "payment.generated") {
+          queryClient.invalidateQueries({ queryKey: queryKeys.payments.all });
+          announce(`Payment generated for outage ${event.outage_id}`);
+        }
+      },
+      // Missed events cannot be replayed to this subscriber; refetch everything it covers
+      onOverflow: () => {
+        invalidateOpenOutageNodeIndex();
+        queryClient.invalidateQueries({ queryKey: ["outages"] });
+        queryClient.invalidateQueries({ queryKey: queryKeys.payments.all });
+      },
+    });
+  }, [queryClient, streamUrl, customerIds, severities]);
 }
 
 // Minimal aria-live announcer; mount <LiveRegion /> once in the app shell.
@@ -2,6 +2,8 @@
 
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "@/lib/api";
+import { queryKeys } from "@/lib/queryKeys";
+import { getSLAConfig } from "@/services/sla";
 
 type Severity = "critical" | "high" | "medium" | "low";
 
@@ -11,8 +13,6 @@ type SLASeverityConfig = {
   reward_base: number;
 };
 
-type SLAConfigMap = Record<string, SLASeverityConfig>;
-
 export type EditableConfig = SLASeverityConfig & { severity: Severity };
 
 const SEVERITY_ORDER: Record<Severity, number> = {
@@ -22,17 +22,14 @@ const SEVERITY_ORDER: Record<Severity, number> = {
   low: 3,
 };
 
-const SLA_CONFIG_KEY = ["sla", "config"] as const;
-
 export function useSlaConfig() {
   return useQuery({
-    queryKey: SLA_CONFIG_KEY,
-    queryFn: async () => {
-      const { data } = await api.get<SLAConfigMap>("/sla/config");
-      return Object.entries(data)
-        .map(([severity, config]) => ({ severity: severity as Severity, ...config }))
-        .sort((a, b) => SEVERITY_ORDER[a.severity] - SEVERITY_ORDER[b.severity]);
-    },
+    queryKey: queryKeys.sla.config(),
+    // Each fetch is a conditional request, so refetches of an unchanged table are 304s
+    queryFn: async () =>
+      (await getSLAConfig())
+        .map((config) => ({ ...config, severity: config.severity as Severity }))
+        .sort((a, b) => SEVERITY_ORDER[a.severity] - SEVERITY_ORDER[b.severity]),
   });
 }
 
@@ -45,7 +42,7 @@ export function useUpdateSlaConfig() {
       return { severity, ...data } as EditableConfig;
     },
     onSuccess: (updated) => {
-      queryClient.setQueryData<EditableConfig[]>(SLA_CONFIG_KEY, (prev) =>
+      queryClient.setQueryData<EditableConfig[]>(queryKeys.sla.config(), (prev) =>
         prev?.map((c) => (c.severity === updated.severity ? updated : c)) ?? [],
       );
     },
@@ -0,0 +1,46 @@
+// @vitest-environment node
+import { describe, it, expect } from "vitest";
+import { createRowParser, parseCSVLine, readLines } from "./bulkImportRows";
+
+async function collect(file: File) {
+  const lines = [];
+  for await (const line of readLines(file)) lines.push(line);
+  return lines;
+}
+
+describe("readLines", () => {
+  it("numbers lines across CRLF, blank lines and a multi-byte character split between slices", async () => {
+    const head = "a".repeat(1024 * 1024 - 1);
+    const lines = await collect(new File([`${head}é\r\n\r\nlast`], "f.csv"));
+
+    expect(lines.map((l) => l.lineNumber)).toEqual([1, 3]);
+    expect(lines[0].line.endsWith("é")).toBe(true);
+    expect(lines[1].line).toBe("last");
+  });
+});
+
+describe("createRowParser", () => {
+  it("reports missing CSV columns on the header line", () => {
+    const parse = createRowParser(true);
+    expect(parse("service_id,start_time", 1).errors[0].message).toBe("Missing required columns: end_time");
+  });
+
+  it("keeps the record of an invalid row alongside its errors", () => {
+    const parse = createRowParser(true);
+    parse("service_id,start_time,end_time", 1);
+
+    const { record, errors } = parse("s1,2026-01-02,2026-01-01", 2);
+    expect(record).toEqual({ service_id: "s1", start_time: "2026-01-02", end_time: "2026-01-01" });
+    expect(errors).toEqual([{ row: 2, field: "end_time", message: "End time must be after start time" }]);
+  });
+
+  it("rejects NDJSON lines that are not objects", () => {
+    expect(createRowParser(false)("[1]", 4).errors).toEqual([{ row: 4, message: "Line is not an outage object" }]);
+  });
+});
+
+describe("parseCSVLine", () => {
+  it("keeps commas and escaped quotes inside quoted fields", () => {
+    expect(parseCSVLine('s1,"Lagos, ""core""",x')).toEqual(["s1", 'Lagos, "core"', "x"]);
+  });
+});
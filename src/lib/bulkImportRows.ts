@@ -0,0 +1,143 @@
+import type { ImportValidationError } from "@/types/bulkImport";
+
+/**
+ * Line-oriented parsing and validation of outage import files, shared by the import preview and the
+ * streaming upload so both accept and reject exactly the same rows.
+ */
+
+export const REQUIRED_IMPORT_FIELDS = ["service_id", "start_time", "end_time"] as const;
+
+export type OutageRow = Record<string, unknown>;
+
+export interface ParsedImportLine {
+  record?: OutageRow;
+  /** Set on a CSV file's header line, which carries no record. */
+  header?: string[];
+  errors: ImportValidationError[];
+}
+
+/** CSV files are parsed by header; anything else line-oriented is read as NDJSON. */
+export function isCSVImportFile(file: File): boolean {
+  return file.name.toLowerCase().endsWith(".csv") || file.type === "text/csv";
+}
+
+const READ_CHUNK_BYTES = 1024 * 1024;
+
+/**
+ * Yields the file's non-empty lines with their 1-based line numbers, reading and decoding one
+ * READ_CHUNK_BYTES slice at a time. Stopping the iteration early skips the rest of the file, so
+ * previews only read the slices they need.
+ */
+export async function* readLines(
+  file: File,
+  onBytes?: (loaded: number) => void
+): AsyncGenerator<{ line: string; lineNumber: number }> {
+  const decoder = new TextDecoder();
+  let buffered = "";
+  let lineNumber = 0;
+
+  for (let offset = 0; offset < file.size; offset += READ_CHUNK_BYTES) {
+    const chunk = await file.slice(offset, offset + READ_CHUNK_BYTES).arrayBuffer();
+    onBytes?.(Math.min(file.size, offset + READ_CHUNK_BYTES));
+    buffered += decoder.decode(chunk, { stream: true });
+
+    const lines = buffered.split(/\r?\n/);
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      lineNumber++;
+      if (line.trim()) yield { line, lineNumber };
+    }
+  }
+
+  buffered += decoder.decode();
+  if (buffered.trim()) yield { line: buffered, lineNumber: lineNumber + 1 };
+}
+
+/**
+ * Splits one CSV line into trimmed cells, honouring quoted fields and "" escapes.
+ */
+export function parseCSVLine(line: string): string[] {
+  const result: string[] = [];
+  let current = "";
+  let inQuotes = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+
+    if (char === '"') {
+      if (inQuotes && line[i + 1] === '"') {
+        current += '"';
+        i++;
+      } else {
+        inQuotes = !inQuotes;
+      }
+    } else if (char === "," && !inQuotes) {
+      result.push(current.trim());
+      current = "";
+    } else {
+      current += char;
+    }
+  }
+  result.push(current.trim());
+  return result;
+}
+
+export function validateOutageRow(record: OutageRow, row: number): ImportValidationError[] {
+  const errors: ImportValidationError[] = [];
+
+  for (const field of REQUIRED_IMPORT_FIELDS) {
+    const value = record[field];
+    if (value == null || String(value).trim() === "") {
+      errors.push({ row, field, message: `Required field "${field}" is empty` });
+    } else if (field !== "service_id" && isNaN(new Date(String(value)).getTime())) {
+      errors.push({ row, field, message: `Invalid date format for "${field}"` });
+    }
+  }
+
+  if (!errors.length && new Date(String(record.start_time)) >= new Date(String(record.end_time))) {
+    errors.push({ row, field: "end_time", message: "End time must be after start time" });
+  }
+
+  return errors;
+}
+
+/**
+ * Returns a parser for successive lines of one CSV or NDJSON file. Each line yields its record, when
+ * it could be read as one, and its errors; only error-free records should be imported. CSV quoted
+ * fields may not span lines.
+ */
+export function createRowParser(isCSV: boolean) {
+  let headers: string[] | null = null;
+
+  return (line: string, row: number): ParsedImportLine => {
+    if (isCSV) {
+      const cells = parseCSVLine(line);
+      if (!headers) {
+        headers = cells.map((h) => h.replace(/^"|"$/g, ""));
+        const missing = REQUIRED_IMPORT_FIELDS.filter((f) => !headers?.includes(f));
+        return missing.length
+          ? { header: headers, errors: [{ row, field: missing.join(", "), message: `Missing required columns: ${missing.join(", ")}` }] }
+          : { header: headers, errors: [] };
+      }
+      if (cells.length !== headers.length) {
+        return {
+          errors: [{ row, message: `Column count mismatch (expected ${headers.length}, got ${cells.length})` }],
+        };
+      }
+      const record = Object.fromEntries(headers.map((h, i) => [h, cells[i]]));
+      return { record, errors: validateOutageRow(record, row) };
+    }
+
+    let parsed: unknown;
+    try {
+      parsed = JSON.parse(line);
+    } catch (e) {
+      return { errors: [{ row, message: `Invalid JSON: ${(e as Error).message}` }] };
+    }
+    if (parsed === null || typeof parsed !== "object" || Array.isArray(parsed)) {
+      return { errors: [{ row, message: "Line is not an outage object" }] };
+    }
+    const record = parsed as OutageRow;
+    return { record, errors: validateOutageRow(record, row) };
+  };
+}
@@ -0,0 +1,148 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+
+import {
+  buildChangeFeedUrl,
+  createChangeFeed,
+  getChangeFeed,
+  isChangeFeedLive,
+  onChangeFeedStatusChange,
+  type ChangeEvent,
+} from "./changeFeed";
+
+class FakeSource {
+  listeners = new Map<string, (event: MessageEvent) => void>();
+  onopen: ((event: Event) => void) | null = null;
+  onerror: ((event: Event) => void) | null = null;
+  closed = false;
+
+  constructor(public url: string) {}
+
+  addEventListener(type: string, listener: (event: MessageEvent) => void) {
+    this.listeners.set(type, listener);
+  }
+
+  emit(type: string, id: string, data: Record<string, unknown>) {
+    this.listeners.get(type)?.({ data: JSON.stringify(data), lastEventId: id } as MessageEvent);
+  }
+
+  close() {
+    this.closed = true;
+  }
+}
+
+const flush = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+describe("change feed", () => {
+  let sources: FakeSource[];
+  const createSource = (url: string) => {
+    const source = new FakeSource(url);
+    sources.push(source);
+    return source;
+  };
+
+  beforeEach(() => {
+    sources = [];
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("encodes filters and the resume id in the stream URL", () => {
+    expect(buildChangeFeedUrl("/api/v1/stream/outages", { customerIds: ["b", "a"], severities: ["critical"] }, "42")).toBe(
+      "/api/v1/stream/outages?customer_id=a%2Cb&severity=critical&last_event_id=42",
+    );
+  });
+
+  it("fans one connection out to subscribers by event type", async () => {
+    const feed = createChangeFeed("/stream", { createSource });
+    const all: ChangeEvent[] = [];
+    const payments: ChangeEvent[] = [];
+    feed.subscribe({ onEvent: (e) => all.push(e) });
+    feed.subscribe({ types: ["payment.generated"], onEvent: (e) => payments.push(e) });
+
+    sources[0].emit("outage.status_changed", "1", { outage_id: "o1", status: "resolved" });
+    sources[0].emit("payment.generated", "2", { outage_id: "o1", payment_id: "p1" });
+    await flush();
+
+    expect(sources).toHaveLength(1);
+    expect(all.map((e) => e.id)).toEqual(["1", "2"]);
+    expect(payments).toEqual([{ id: "2", type: "payment.generated", outage_id: "o1", payment_id: "p1" }]);
+  });
+
+  it("resets a subscriber that falls behind its buffer instead of growing it", async () => {
+    const feed = createChangeFeed("/stream", { createSource, bufferSize: 2 });
+    const received: string[] = [];
+    const onOverflow = vi.fn();
+    feed.subscribe({ onEvent: (e) => received.push(e.id), onOverflow });
+
+    for (const id of ["1", "2", "3", "4"]) sources[0].emit("sla.breached", id, { outage_id: "o1" });
+    await flush();
+
+    expect(onOverflow).toHaveBeenCalledTimes(1);
+    expect(received).toEqual(["4"]);
+  });
+
+  it("reconnects with backoff and resumes after the last event", () => {
+    vi.useFakeTimers();
+    const feed = createChangeFeed("/stream", { createSource, filter: { severities: ["critical"] } });
+    feed.subscribe({ onEvent: () => undefined });
+    sources[0].onopen?.(new Event("open"));
+    sources[0].emit("outage.created", "17", { outage_id: "o1", severity: "critical" });
+
+    sources[0].onerror?.(new Event("error"));
+    expect(sources[0].closed).toBe(true);
+    expect(feed.isConnected()).toBe(false);
+
+    vi.advanceTimersByTime(2_000);
+    expect(sources[1].url).toBe("/stream?severity=critical&last_event_id=17");
+  });
+
+  it("treats polling as covered only by a live feed whose filter admits the target", () => {
+    vi.stubGlobal("EventSource", class extends FakeSource {
+      constructor(url: string) {
+        super(url);
+        sources.push(this);
+      }
+    });
+    try {
+      const stopFiltered = getChangeFeed("/stream/coverage", { severities: ["critical"] }).subscribe({ onEvent: () => undefined });
+      sources[0].onopen?.(new Event("open"));
+      expect(isChangeFeedLive()).toBe(false);
+      expect(isChangeFeedLive({ severity: "critical" })).toBe(true);
+      expect(isChangeFeedLive({ severity: "low" })).toBe(false);
+
+      const stopAll = getChangeFeed("/stream/coverage").subscribe({ onEvent: () => undefined });
+      sources[1].onopen?.(new Event("open"));
+      expect(isChangeFeedLive()).toBe(true);
+
+      stopFiltered();
+      stopAll();
+      expect(isChangeFeedLive({ severity: "critical" })).toBe(false);
+    } finally {
+      vi.unstubAllGlobals();
+    }
+  });
+
+  it("notifies status listeners when a shared feed drops", () => {
+    vi.stubGlobal("EventSource", class extends FakeSource {
+      constructor(url: string) {
+        super(url);
+        sources.push(this);
+      }
+    });
+    const changes: boolean[] = [];
+    const unlisten = onChangeFeedStatusChange((connected) => changes.push(connected));
+    try {
+      const stop = getChangeFeed("/stream/status").subscribe({ onEvent: () => undefined });
+      sources[0].onopen?.(new Event("open"));
+      sources[0].onerror?.(new Event("error"));
+      stop();
+
+      expect(changes).toEqual([true, false]);
+    } finally {
+      unlisten();
+      vi.unstubAllGlobals();
+    }
+  });
+});
@@ -0,0 +1,266 @@
+import { calculateBackoff } from "@/lib/liveDeliveryStream";
+
+export type ChangeEventType =
+  | "outage.created"
+  | "outage.status_changed"
+  | "sla.breached"
+  | "sla.updated"
+  | "payment.generated";
+
+export const CHANGE_EVENT_TYPES: readonly ChangeEventType[] = [
+  "outage.created",
+  "outage.status_changed",
+  "sla.breached",
+  "sla.updated",
+  "payment.generated",
+];
+
+export interface ChangeEvent {
+  /** Server-assigned, monotonically increasing within a stream; used to resume. */
+  id: string;
+  type: ChangeEventType;
+  outage_id: string;
+  customer_id?: string;
+  severity?: string;
+  status?: string;
+  payment_id?: string;
+  occurred_at?: string;
+}
+
+export interface ChangeFeedFilter {
+  customerIds?: readonly string[];
+  severities?: readonly string[];
+}
+
+/** What a view polls for; a feed covers it when every event about it passes the feed's filter. */
+export interface ChangeFeedTarget {
+  customer_id?: string;
+  severity?: string;
+}
+
+export interface ChangeSubscriber {
+  types?: readonly ChangeEventType[];
+  onEvent: (event: ChangeEvent) => void;
+  /** Called instead of delivering events once the subscriber falls `bufferSize` events behind; refetch to resync. */
+  onOverflow?: () => void;
+}
+
+interface EventSourceLike {
+  addEventListener(type: string, listener: (event: MessageEvent) => void): void;
+  onopen: ((event: Event) => void) | null;
+  onerror: ((event: Event) => void) | null;
+  close(): void;
+}
+
+export interface ChangeFeedOptions {
+  filter?: ChangeFeedFilter;
+  /** Per-subscriber queue bound. */
+  bufferSize?: number;
+  createSource?: (url: string) => EventSourceLike;
+}
+
+const DEFAULT_BUFFER_SIZE = 256;
+const BASE_RECONNECT_MS = 1_000;
+
+/* ------------------------------------------------------------------ */
+/* Feed                                                                */
+/* ------------------------------------------------------------------ */
+
+/**
+ * Builds the stream URL with server-side filters and, on reconnect, the id of the last event seen
+ * so the server replays only what was missed. EventSource cannot set the Last-Event-ID header on a
+ * fresh connection, hence the query parameter.
+ */
+export function buildChangeFeedUrl(baseUrl: string, filter: ChangeFeedFilter = {}, lastEventId?: string): string {
+  const [path, query = ""] = baseUrl.split("?");
+  const params = new URLSearchParams(query);
+  if (filter.customerIds?.length) params.set("customer_id", [...filter.customerIds].sort().join(","));
+  if (filter.severities?.length) params.set("severity", [...filter.severities].sort().join(","));
+  if (lastEventId) params.set("last_event_id", lastEventId);
+  const search = params.toString();
+  return search ? `${path}?${search}` : path;
+}
+
+/**
+ * One shared SSE connection fanned out to any number of in-process subscribers.
+ * Each subscriber has its own bounded queue drained on a microtask, so a slow handler never blocks
+ * the connection or other subscribers; a subscriber that falls too far behind is reset and told to
+ * resync rather than growing without bound. Dropped connections reconnect with backoff and resume
+ * from the last delivered event id.
+ */
+export function createChangeFeed(baseUrl: string, options: ChangeFeedOptions = {}) {
+  const filter = options.filter ?? {};
+  const bufferSize = options.bufferSize ?? DEFAULT_BUFFER_SIZE;
+  const createSource =
+    options.createSource ?? ((url: string) => new EventSource(url, { withCredentials: true }));
+
+  const subscribers = new Set<{ subscriber: ChangeSubscriber; queue: ChangeEvent[]; scheduled: boolean }>();
+  let source: EventSourceLike | null = null;
+  let lastEventId: string | undefined;
+  let connected = false;
+  let backoffMs = BASE_RECONNECT_MS;
+  let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  const statusListeners = new Set<(connected: boolean) => void>();
+
+  function matchesFilter(event: ChangeFeedTarget): boolean {
+    if (filter.customerIds?.length && (!event.customer_id || !filter.customerIds.includes(event.customer_id))) return false;
+    if (filter.severities?.length && (!event.severity || !filter.severities.includes(event.severity))) return false;
+    return true;
+  }
+
+  function setConnected(next: boolean) {
+    if (connected === next) return;
+    connected = next;
+    for (const listener of statusListeners) listener(next);
+  }
+
+  function drain(entry: { subscriber: ChangeSubscriber; queue: ChangeEvent[]; scheduled: boolean }) {
+    entry.scheduled = false;
+    const events = entry.queue.splice(0);
+    for (const event of events) {
+      try {
+        entry.subscriber.onEvent(event);
+      } catch (err) {
+        console.error("[changeFeed] subscriber failed:", err);
+      }
+    }
+  }
+
+  function publish(event: ChangeEvent) {
+    lastEventId = event.id;
+    if (!matchesFilter(event)) return;
+
+    for (const entry of subscribers) {
+      if (entry.subscriber.types && !entry.subscriber.types.includes(event.type)) continue;
+      if (entry.queue.length >= bufferSize) {
+        entry.queue.length = 0;
+        entry.subscriber.onOverflow?.();
+        continue;
+      }
+      entry.queue.push(event);
+      if (!entry.scheduled) {
+        entry.scheduled = true;
+        queueMicrotask(() => drain(entry));
+      }
+    }
+  }
+
+  function connect() {
+    const next = createSource(buildChangeFeedUrl(baseUrl, filter, lastEventId));
+    source = next;
+
+    for (const type of CHANGE_EVENT_TYPES) {
+      next.addEventListener(type, (message) => {
+        try {
+          const payload = JSON.parse(message.data) as Omit<ChangeEvent, "id" | "type">;
+          publish({ ...payload, id: message.lastEventId, type });
+        } catch (err) {
+          console.error(`[changeFeed] malformed ${type} event:`, err);
+        }
+      });
+    }
+
+    next.onopen = () => {
+      setConnected(true);
+      backoffMs = BASE_RECONNECT_MS;
+    };
+
+    next.onerror = () => {
+      // Take over reconnection so the resume id and backoff are ours, not the browser's
+      next.close();
+      setConnected(false);
+      if (source !== next) return;
+      source = null;
+      backoffMs = calculateBackoff(backoffMs, false);
+      reconnectTimer = setTimeout(() => {
+        reconnectTimer = null;
+        if (subscribers.size) connect();
+      }, backoffMs);
+    };
+  }
+
+  function close() {
+    if (reconnectTimer) clearTimeout(reconnectTimer);
+    reconnectTimer = null;
+    source?.close();
+    source = null;
+    setConnected(false);
+  }
+
+  function subscribe(subscriber: ChangeSubscriber): () => void {
+    const entry = { subscriber, queue: [] as ChangeEvent[], scheduled: false };
+    subscribers.add(entry);
+    if (!source && !reconnectTimer) connect();
+
+    return () => {
+      subscribers.delete(entry);
+      if (!subscribers.size) close();
+    };
+  }
+
+  /** Notified with the new state whenever the connection opens or drops. */
+  function onStatusChange(listener: (connected: boolean) => void): () => void {
+    statusListeners.add(listener);
+    return () => {
+      statusListeners.delete(listener);
+    };
+  }
+
+  return {
+    subscribe,
+    close,
+    onStatusChange,
+    isConnected: () => connected,
+    /** True when every event about `target` passes this feed's filter. */
+    covers: (target: ChangeFeedTarget) => matchesFilter(target),
+    lastEventId: () => lastEventId,
+  };
+}
+
+export type ChangeFeed = ReturnType<typeof createChangeFeed>;
+
+/* ------------------------------------------------------------------ */
+/* Shared feeds                                                        */
+/* ------------------------------------------------------------------ */
+
+const feeds = new Map<string, ChangeFeed>();
+const feedStatusListeners = new Set<(connected: boolean) => void>();
+
+/**
+ * Process-wide feed per stream URL and filter, so every component watching the same slice shares a
+ * single connection.
+ */
+export function getChangeFeed(baseUrl: string, filter: ChangeFeedFilter = {}): ChangeFeed {
+  const key = buildChangeFeedUrl(baseUrl, filter);
+  let feed = feeds.get(key);
+  if (!feed) {
+    feed = createChangeFeed(baseUrl, { filter });
+    feed.onStatusChange((connected) => {
+      for (const listener of feedStatusListeners) listener(connected);
+    });
+    feeds.set(key, feed);
+  }
+  return feed;
+}
+
+/**
+ * True while a connected shared feed delivers every event about `target`, so polling for it can back
+ * off. With no target only an unfiltered feed qualifies.
+ */
+export function isChangeFeedLive(target: ChangeFeedTarget = {}): boolean {
+  for (const feed of feeds.values()) {
+    if (feed.isConnected() && feed.covers(target)) return true;
+  }
+  return false;
+}
+
+/**
+ * Notified whenever any shared feed connects or drops, so backed-off polls can resume at once rather
+ * than after their slow interval.
+ */
+export function onChangeFeedStatusChange(listener: (connected: boolean) => void): () => void {
+  feedStatusListeners.add(listener);
+  return () => {
+    feedStatusListeners.delete(listener);
+  };
+}
@@ -0,0 +1,72 @@
+// @vitest-environment node
+import { describe, it, expect, vi } from "vitest";
+import { createIdempotentRunner, deriveIdempotencyKey } from "./idempotency";
+
+describe("deriveIdempotencyKey", () => {
+  it("is stable for identical parts and scoped", async () => {
+    const a = await deriveIdempotencyKey("payment-generate", ["outage-1"]);
+    expect(await deriveIdempotencyKey("payment-generate", ["outage-1"])).toBe(a);
+    expect(await deriveIdempotencyKey("payment-generate", ["outage-2"])).not.toBe(a);
+    expect(await deriveIdempotencyKey("bulk-resolve", ["outage-1"])).not.toBe(a);
+  });
+
+  it("falls back to a local digest where crypto.subtle is unavailable", async () => {
+    vi.stubGlobal("crypto", {});
+    try {
+      const a = await deriveIdempotencyKey("payment-generate", ["outage-1"]);
+      expect(a).toMatch(/^payment-generate:[0-9a-f]{64}$/);
+      expect(await deriveIdempotencyKey("payment-generate", ["outage-1"])).toBe(a);
+      expect(await deriveIdempotencyKey("payment-generate", ["outage-2"])).not.toBe(a);
+    } finally {
+      vi.unstubAllGlobals();
+    }
+  });
+});
+
+describe("createIdempotentRunner", () => {
+  it("runs one mutation for many concurrent calls with the same key", async () => {
+    const runner = createIdempotentRunner<string>();
+    const mutate = vi.fn().mockResolvedValue("payment-1");
+
+    const results = await Promise.all(Array.from({ length: 1000 }, () => runner.run("k", mutate)));
+
+    expect(mutate).toHaveBeenCalledTimes(1);
+    expect(new Set(results)).toEqual(new Set(["payment-1"]));
+  });
+
+  it("replays a settled response until it expires", async () => {
+    vi.useFakeTimers();
+    const runner = createIdempotentRunner<string>(1000);
+    const mutate = vi.fn().mockResolvedValue("payment-1");
+
+    await runner.run("k", mutate);
+    await runner.run("k", mutate);
+    expect(mutate).toHaveBeenCalledTimes(1);
+
+    vi.advanceTimersByTime(1001);
+    await runner.run("k", mutate);
+    expect(mutate).toHaveBeenCalledTimes(2);
+    vi.useRealTimers();
+  });
+
+  it("does not cache failures", async () => {
+    const runner = createIdempotentRunner<string>();
+    const mutate = vi.fn().mockRejectedValueOnce(new Error("timeout")).mockResolvedValue("payment-1");
+
+    await expect(runner.run("k", mutate)).rejects.toThrow("timeout");
+    await expect(runner.run("k", mutate)).resolves.toBe("payment-1");
+  });
+
+  it("sweeps expired responses when a new one is stored", async () => {
+    vi.useFakeTimers();
+    const runner = createIdempotentRunner<string>(1000);
+
+    for (let i = 0; i < 100; i++) await runner.run(`old-${i}`, async () => "payment");
+    expect(runner.size()).toBe(100);
+
+    vi.advanceTimersByTime(1001);
+    await runner.run("new", async () => "payment");
+    expect(runner.size()).toBe(1);
+    vi.useRealTimers();
+  });
+});
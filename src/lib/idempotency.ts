@@ -0,0 +1,94 @@
+export const IDEMPOTENCY_HEADER = "Idempotency-Key";
+const DEFAULT_REPLAY_TTL_MS = 10 * 60_000;
+
+/**
+ * 256-bit non-cryptographic digest: eight independently seeded 32-bit multiply-xorshift lanes.
+ * Only used where crypto.subtle is unavailable (plain-http origins); keys need to be well spread,
+ * not secret.
+ */
+function fallbackDigest(bytes: Uint8Array): Uint8Array {
+  const lanes = Uint32Array.from({ length: 8 }, (_, lane) => (0x811c9dc5 ^ Math.imul(lane + 1, 0x9e3779b9)) >>> 0);
+  for (const byte of bytes) {
+    for (let lane = 0; lane < lanes.length; lane++) {
+      lanes[lane] = Math.imul(lanes[lane] ^ byte, 0x01000193 + 2 * lane);
+    }
+  }
+  for (let lane = 0; lane < lanes.length; lane++) {
+    let h = lanes[lane] ^ bytes.length;
+    h = Math.imul(h ^ (h >>> 16), 0x85ebca6b);
+    h = Math.imul(h ^ (h >>> 13), 0xc2b2ae35);
+    lanes[lane] = h ^ (h >>> 16);
+  }
+  return new Uint8Array(lanes.buffer);
+}
+
+/**
+ * Derives a stable idempotency key from a scope and request parts, so retries of the same
+ * logical operation (including after a reload) reuse the key the server has already seen.
+ * Parts are order-sensitive; sort them first when order does not matter. Include a
+ * createIdempotencyNonce() part when the key should only cover one user action.
+ * Hashes with SHA-256 where crypto.subtle exists and with a local digest otherwise, so keys differ
+ * between secure and non-secure contexts but are stable within each.
+ */
+export async function deriveIdempotencyKey(
+  scope: string,
+  parts: readonly unknown[],
+): Promise<string> {
+  const encoded = new TextEncoder().encode(JSON.stringify([scope, ...parts]));
+  const subtle = globalThis.crypto?.subtle;
+  const digest = subtle ? new Uint8Array(await subtle.digest("SHA-256", encoded)) : fallbackDigest(encoded);
+  const hex = Array.from(digest, (byte) => byte.toString(16).padStart(2, "0")).join("");
+
+  return `${scope}:${hex}`;
+}
+
+/**
+ * Random id scoping idempotency keys to one user action, so repeating the action on purpose is not
+ * mistaken for a retry. Does not rely on crypto.randomUUID, which is missing outside secure contexts.
+ */
+export function createIdempotencyNonce(): string {
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+}
+
+/**
+ * Client half of idempotent mutations: concurrent calls with the same key share one in-flight
+ * request, and a successful response is replayed for the same key until it expires. Failures are
+ * not cached, so a retry after an error goes back to the server with the same key. Expired
+ * responses are swept whenever a new one is stored, so the replay cache only holds live entries.
+ */
+export function createIdempotentRunner<T>(ttlMs: number = DEFAULT_REPLAY_TTL_MS) {
+  const inflight = new Map<string, Promise<T>>();
+  // Insertion order is expiry order, since every entry gets the same TTL
+  const settled = new Map<string, { value: T; expiresAt: number }>();
+
+  function sweep(now: number): void {
+    for (const [key, entry] of settled) {
+      if (entry.expiresAt > now) break;
+      settled.delete(key);
+    }
+  }
+
+  function run(key: string, mutate: () => Promise<T>): Promise<T> {
+    const cached = settled.get(key);
+    if (cached && cached.expiresAt > Date.now()) return Promise.resolve(cached.value);
+    if (cached) settled.delete(key);
+
+    const existing = inflight.get(key);
+    if (existing) return existing;
+
+    const promise = mutate()
+      .then((value) => {
+        const now = Date.now();
+        sweep(now);
+        settled.set(key, { value, expiresAt: now + ttlMs });
+        return value;
+      })
+      .finally(() => {
+        inflight.delete(key);
+      });
+    inflight.set(key, promise);
+    return promise;
+  }
+
+  return { run, size: () => settled.size };
+}
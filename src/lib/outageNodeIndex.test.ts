@@ -0,0 +1,38 @@
+import { describe, expect, it } from "vitest";
+
+import { createOutageNodeIndex } from "./outageNodeIndex";
+
+const open = (id: string, nodes: string[], site_id?: string) =>
+  ({ id, status: "open" as const, affected_services: nodes, site_id });
+
+describe("outage node index", () => {
+  it("answers node lookups and ranks correlations by shared nodes", () => {
+    const index = createOutageNodeIndex();
+    index.rebuild([open("o1", ["router-01", "router-02"]), open("o2", ["Router-01 "]), open("o3", ["switch-9"])]);
+
+    expect(index.openOutagesForNode("ROUTER-01").sort()).toEqual(["o1", "o2"]);
+    expect(index.correlate(["router-01", "router-02"])).toEqual([
+      { outageId: "o1", sharedNodes: ["router-01", "router-02"] },
+      { outageId: "o2", sharedNodes: ["router-01"] },
+    ]);
+  });
+
+  it("drops outages from every posting when they resolve", () => {
+    const index = createOutageNodeIndex();
+    index.upsert(open("o1", ["router-01", "router-02"]));
+    index.upsert({ ...open("o1", ["router-01", "router-02"]), status: "resolved" });
+
+    expect(index.size()).toBe(0);
+    expect(index.openOutagesForNode("router-01")).toEqual([]);
+  });
+
+  it("flags an exact node-set match at the same site as a duplicate", () => {
+    const index = createOutageNodeIndex();
+    index.rebuild([open("o1", ["router-01", "router-02"], "site-a"), open("o2", ["router-01"], "site-a")]);
+
+    expect(index.findDuplicate({ affected_services: ["router-02", "router-01"], site_id: "site-a" })).toBe("o1");
+    expect(index.findDuplicate({ affected_services: ["router-01", "router-02"], site_id: "site-b" })).toBeUndefined();
+    expect(index.findDuplicate({ affected_services: ["router-01", "router-03"] })).toBeUndefined();
+    expect(index.findDuplicate({ affected_services: [] })).toBeUndefined();
+  });
+});
@@ -0,0 +1,112 @@
+import type { Outage } from "@/types/outages";
+
+type IndexedOutage = Pick<Outage, "id" | "status" | "affected_services" | "site_id">;
+
+export interface NodeCorrelation {
+  outageId: string;
+  /** Nodes shared between the query and this open outage. */
+  sharedNodes: string[];
+}
+
+function normalizeNode(node: string): string {
+  return node.trim().toLowerCase();
+}
+
+function uniqueNodes(nodes: readonly string[]): string[] {
+  return Array.from(new Set(nodes.map(normalizeNode).filter(Boolean)));
+}
+
+/**
+ * In-memory node → open-outage inverted index.
+ * Lookups touch only the posting sets of the queried nodes, so "which open outages affect router-01"
+ * and duplicate checks cost O(nodes queried) rather than a scan of every open outage, which matters
+ * during incident storms with thousands of concurrent outages. Resolved outages are dropped on
+ * upsert, so the index only ever holds open ones.
+ */
+export function createOutageNodeIndex() {
+  const postings = new Map<string, Set<string>>();
+  const outages = new Map<string, { nodes: string[]; siteId?: string }>();
+
+  function remove(id: string): void {
+    const entry = outages.get(id);
+    if (!entry) return;
+    outages.delete(id);
+    for (const node of entry.nodes) {
+      const ids = postings.get(node);
+      ids?.delete(id);
+      if (ids && !ids.size) postings.delete(node);
+    }
+  }
+
+  function upsert(outage: IndexedOutage): void {
+    remove(outage.id);
+    if (outage.status !== "open") return;
+
+    const nodes = uniqueNodes(outage.affected_services ?? []);
+    outages.set(outage.id, { nodes, siteId: outage.site_id });
+    for (const node of nodes) {
+      let ids = postings.get(node);
+      if (!ids) postings.set(node, (ids = new Set()));
+      ids.add(outage.id);
+    }
+  }
+
+  function rebuild(open: Iterable<IndexedOutage>): void {
+    postings.clear();
+    outages.clear();
+    for (const outage of open) upsert(outage);
+  }
+
+  function openOutagesForNode(node: string): string[] {
+    return Array.from(postings.get(normalizeNode(node)) ?? []);
+  }
+
+  /**
+   * Open outages sharing at least one node with `nodes`, most shared nodes first.
+   */
+  function correlate(nodes: readonly string[]): NodeCorrelation[] {
+    const shared = new Map<string, string[]>();
+    for (const node of uniqueNodes(nodes)) {
+      for (const id of postings.get(node) ?? []) {
+        const list = shared.get(id);
+        if (list) list.push(node);
+        else shared.set(id, [node]);
+      }
+    }
+    return Array.from(shared, ([outageId, sharedNodes]) => ({ outageId, sharedNodes })).sort(
+      (a, b) => b.sharedNodes.length - a.sharedNodes.length || a.outageId.localeCompare(b.outageId),
+    );
+  }
+
+  /**
+   * An open outage at the same site (when both have one) affecting exactly the same nodes, if any.
+   */
+  function findDuplicate(candidate: Pick<Outage, "affected_services" | "site_id">): string | undefined {
+    const nodes = uniqueNodes(candidate.affected_services ?? []);
+    if (!nodes.length) return undefined;
+
+    // Intersect from the rarest node's postings so the candidate set is as small as possible
+    const rarest = nodes.reduce((best, node) =>
+      (postings.get(node)?.size ?? 0) < (postings.get(best)?.size ?? 0) ? node : best,
+    );
+    for (const id of postings.get(rarest) ?? []) {
+      const entry = outages.get(id);
+      if (!entry || entry.nodes.length !== nodes.length) continue;
+      if (candidate.site_id && entry.siteId && candidate.site_id !== entry.siteId) continue;
+      if (nodes.every((node) => postings.get(node)?.has(id))) return id;
+    }
+    return undefined;
+  }
+
+  return {
+    upsert,
+    remove,
+    rebuild,
+    openOutagesForNode,
+    correlate,
+    findDuplicate,
+    size: () => outages.size,
+  };
+}
+
+export type OutageNodeIndex = ReturnType<typeof createOutageNodeIndex>;
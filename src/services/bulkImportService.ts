@@ -1,16 +1,26 @@
 import type { AxiosRequestConfig } from "axios";
 
 import { api } from "@/lib/api";
+import { createRowParser, isCSVImportFile, readLines, type OutageRow } from "@/lib/bulkImportRows";
+import { createIdempotencyNonce, deriveIdempotencyKey, IDEMPOTENCY_HEADER } from "@/lib/idempotency";
 
 import type {
+  BulkImportBatchResult,
   BulkImportRecord,
   BulkImportResult,
+  ImportValidationError,
+  StreamingImportProgress,
 } from "@/types/bulkImport";
 
 type AxiosProgressEvent = { loaded: number; total?: number };
 
 const BULK_IMPORT_ENDPOINT = "/outages/bulk";
 const BULK_IMPORT_HISTORY_ENDPOINT = "/outages/bulk/history";
+const BULK_IMPORT_BATCH_ENDPOINT = "/outages/bulk/batch";
+
+export const DEFAULT_IMPORT_BATCH_SIZE = 1000;
+// Every row error is streamed to onRowError; only this many are kept on the returned result
+const MAX_RETAINED_ERRORS = 1000;
 
 interface BulkImportProgress {
   loaded: number;
@@ -108,6 +118,127 @@ export async function bulkImportOutages(
   }
 }
 
+/* ------------------------------------------------------------------ */
+/* Streaming import                                                    */
+/* ------------------------------------------------------------------ */
+
+interface StreamingImportOptions {
+  batchSize?: number;
+  /**
+   * Identifies one user-initiated import. Re-running an import under the same id after a failure
+   * reuses each batch's key, so batches that already landed are not inserted twice; a new id
+   * (the default) imports the file again.
+   */
+  importId?: string;
+  signal?: AbortSignal;
+  onProgress?: (progress: StreamingImportProgress) => void;
+  onRowError?: (error: ImportValidationError) => void;
+}
+
+/**
+ * A streaming import that failed part-way; `partial` holds what was committed before the failure.
+ */
+export class BulkImportError extends Error {
+  readonly partial: BulkImportResult;
+
+  constructor(message: string, partial: BulkImportResult) {
+    super(message);
+
+    this.name = "BulkImportError";
+    this.partial = partial;
+  }
+}
+
+/**
+ * Streams a CSV or NDJSON outage file to the server in batches of `batchSize` rows.
+ * Rows are parsed and validated as the file is read and only one batch is held in memory, so
+ * imports of 100k+ outages run at flat memory. Each batch is one transactional insert
+ * server-side and carries an idempotency key derived from `importId`, the batch size and the batch
+ * body, so a retried import does not duplicate batches that already landed. Row errors, local or
+ * server-reported, are streamed through `onRowError` as they occur. A failed batch rejects with a
+ * BulkImportError carrying the rows imported so far.
+ */
+export async function streamBulkImportOutages(
+  file: File,
+  options: StreamingImportOptions = {}
+): Promise<BulkImportResult> {
+  if (!file) {
+    throw new Error("No file provided for upload.");
+  }
+
+  const batchSize = options.batchSize ?? DEFAULT_IMPORT_BATCH_SIZE;
+  const importId = options.importId ?? createIdempotencyNonce();
+  const parseRow = createRowParser(isCSVImportFile(file));
+  const result: BulkImportResult = { imported: 0, skipped: 0, errors: [] };
+  let batch: { row: number; outage: OutageRow }[] = [];
+  let rowsRead = 0;
+  let percent = 0;
+
+  const reportError = (error: ImportValidationError) => {
+    if (result.errors.length < MAX_RETAINED_ERRORS) result.errors.push(error);
+    options.onRowError?.(error);
+  };
+
+  const reportProgress = () => {
+    options.onProgress?.({ rowsRead, imported: result.imported, skipped: result.skipped, percent });
+  };
+
+  const flush = async () => {
+    if (!batch.length) return;
+    const rows = batch;
+    batch = [];
+
+    const body = rows.map((row) => JSON.stringify(row)).join("\n");
+    const key = await deriveIdempotencyKey("bulk-import", [importId, file.name, file.size, batchSize, rows[0].row, body]);
+    try {
+      const response = await api.post<BulkImportBatchResult>(
+        BULK_IMPORT_BATCH_ENDPOINT,
+        body,
+        {
+          headers: { "Content-Type": "application/x-ndjson", [IDEMPOTENCY_HEADER]: key },
+          signal: options.signal,
+        }
+      );
+      result.imported += response.data.imported;
+      result.skipped += rows.length - response.data.imported;
+      response.data.errors.forEach(reportError);
+    } catch (error: unknown) {
+      if ((error as { name?: string }).name === "CanceledError") {
+        throw error;
+      }
+      throw new BulkImportError(extractErrorMessage(error), result);
+    }
+    reportProgress();
+  };
+
+  for await (const { line, lineNumber } of readLines(file, (loaded) => {
+    percent = file.size ? Math.min(100, Math.round((loaded * 100) / file.size)) : 100;
+  })) {
+    options.signal?.throwIfAborted();
+    const { record, header, errors } = parseRow(line, lineNumber);
+    if (header) {
+      // A missing column fails every row, so stop before uploading anything
+      if (errors.length) {
+        errors.forEach(reportError);
+        return result;
+      }
+      continue;
+    }
+
+    rowsRead++;
+    if (record && !errors.length) {
+      batch.push({ row: lineNumber, outage: record });
+      if (batch.length >= batchSize) await flush();
+    } else {
+      result.skipped++;
+      errors.forEach(reportError);
+    }
+  }
+
+  await flush();
+  return result;
+}
+
 /**
  * Fetch bulk import history records.
  */
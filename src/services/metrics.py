@@ -1,12 +1,60 @@
-from typing import Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional, Tuple, Union
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import numpy as np
+
 class ScorecardMetrics(BaseModel):
     slo_success_rate: float      # e.g., 0.995 (99.5%)
     test_pass_rate: float         # e.g., 1.00 (100%)
     open_security_vulns: int     # Count of blocking CVEs
     incident_count: int          # Active P1/P2 production events
 
+MetricsKey = Tuple[float, float, int, int]
+MetricsColumns = Union[Mapping[str, Any], "np.ndarray"]
+
+class ScorecardCache:
+    """
+    Thread-safe LRU cache with per-entry TTL for evaluated scorecards, keyed on the normalized metrics tuple.
+    Cached scorecards are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[MetricsKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: MetricsKey) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: MetricsKey, scorecard: Dict[str, Any]) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl_seconds, scorecard)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+scorecard_cache = ScorecardCache()
+
 class ReliabilityScorecardService:
     @staticmethod
     def calculate_reliability_index(metrics: ScorecardMetrics) -> Dict[str, Any]:
@@ -45,4 +93,92 @@ class ReliabilityScorecardService:
                 "incident_component": incident_score
             },
             "metrics_evaluated": metrics.dict()
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def normalize(metrics: ScorecardMetrics) -> MetricsKey:
+        return (
+            float(metrics.slo_success_rate),
+            float(metrics.test_pass_rate),
+            int(metrics.open_security_vulns),
+            int(metrics.incident_count),
+        )
+
+    @classmethod
+    def evaluate_cached(cls, metrics: ScorecardMetrics) -> Dict[str, Any]:
+        """
+        Returns the cached scorecard for an identical metrics tuple, computing and caching it on a miss.
+        """
+        key = cls.normalize(metrics)
+        scorecard = scorecard_cache.get(key)
+        if scorecard is None:
+            scorecard = cls.calculate_reliability_index(metrics)
+            scorecard_cache.put(key, scorecard)
+        return scorecard
+
+    @classmethod
+    def evaluate_batch(cls, metrics_batch: List[ScorecardMetrics]) -> List[Dict[str, Any]]:
+        """
+        Evaluates many metric sets in order; duplicates within the batch are computed once.
+        """
+        evaluated: Dict[MetricsKey, Dict[str, Any]] = {}
+        results = []
+        for metrics in metrics_batch:
+            key = cls.normalize(metrics)
+            if key not in evaluated:
+                evaluated[key] = cls.evaluate_cached(metrics)
+            results.append(evaluated[key])
+        return results
+
+    @staticmethod
+    def calculate_reliability_indices(metrics: MetricsColumns) -> Dict[str, "np.ndarray"]:
+        """
+        Columnar counterpart of calculate_reliability_index for historical backfills.
+        Accepts a structured NumPy array or a mapping of arrays keyed by the ScorecardMetrics field names and
+        returns one array per scorecard field, element-for-element identical to the scalar path.
+        """
+        # Only backfills need NumPy; the request path never imports it
+        import numpy as np
+
+        slo_success_rate = np.asarray(metrics["slo_success_rate"], dtype=np.float64)
+        test_pass_rate = np.asarray(metrics["test_pass_rate"], dtype=np.float64)
+        open_security_vulns = np.asarray(metrics["open_security_vulns"], dtype=np.int64)
+        incident_count = np.asarray(metrics["incident_count"], dtype=np.int64)
+
+        # Same operations, in the same order, as the scalar formula so float results match bit for bit
+        slo_score = slo_success_rate * 100
+        test_score = test_pass_rate * 100
+        security_score = np.maximum(0, 100 - (open_security_vulns * 25))
+        incident_score = np.maximum(0, 100 - (incident_count * 50))
+
+        reliability_index = (
+            (slo_score * 0.40) +
+            (test_score * 0.30) +
+            (security_score * 0.20) +
+            (incident_score * 0.10)
+        )
+
+        go = (reliability_index >= 85.0) & (open_security_vulns == 0)
+
+        return {
+            "reliability_index": _round_2dp_like_builtin(reliability_index),
+            "status": np.where(go, "GO", "NO-GO"),
+            "slo_component": _round_2dp_like_builtin(slo_score),
+            "test_component": _round_2dp_like_builtin(test_score),
+            "security_component": security_score,
+            "incident_component": incident_score,
+        }
+
+def _round_2dp_like_builtin(values: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized round(x, 2). np.round scales by 100 first, which can land exactly on a .5 tie the exact decimal
+    value does not have; the few elements whose scaled value sits next to a tie are re-rounded with round().
+    """
+    import numpy as np
+
+    scaled = values * 100
+    rounded = np.round(scaled) / 100
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for index in np.flatnonzero(near_tie):
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
@@ -1,13 +1,27 @@
 import type { AxiosError as IAxiosError } from "axios";
 
 import { api } from "@/lib/api";
+import {
+  createIdempotencyNonce,
+  createIdempotentRunner,
+  deriveIdempotencyKey,
+  IDEMPOTENCY_HEADER,
+} from "@/lib/idempotency";
+import { createOutageNodeIndex, type OutageNodeIndex } from "@/lib/outageNodeIndex";
+import type { ChangeEvent } from "@/lib/changeFeed";
+import type { PaymentJob } from "@/types/payment";
 import type {
   Outage,
   OutageCreate,
+  OutageCursorPage,
+  OutageStatus,
   OutageUpdate,
   PaginatedOutages,
   ResolveOutagePayload,
+  OutageResolutionPayment,
   ResolveOutageResponse,
+  Severity,
+  SLAResult,
 } from "@/types/outages";
 
 interface GetOutagesParams {
@@ -20,12 +34,21 @@ interface GetOutagesParams {
   sort_order?: "asc" | "desc";
 }
 
+interface GetOutagesPageParams {
+  status?: OutageStatus;
+  severity?: Severity;
+  cursor?: string | null;
+  limit?: number;
+}
+
 interface ApiErrorResponse {
   message?: string;
   errors?: Record<string, string[]>;
 }
 
 const OUTAGES_ENDPOINT = "/outages";
+const OUTAGES_CURSOR_ENDPOINT = `${OUTAGES_ENDPOINT}/cursor`;
+const DEFAULT_OUTAGE_PAGE_LIMIT = 500;
 
 function handleApiError(error: unknown, fallbackMessage: string): never {
   if ((error as IAxiosError).isAxiosError) {
@@ -80,6 +103,112 @@ export async function getOutages(
   }
 }
 
+/**
+ * Fetch one keyset page of outages.
+ * Pages are served from the (status, severity, detected_at) index, so cost does not grow with
+ * page depth the way offset pagination does; pass the previous page's `next_cursor` to continue.
+ */
+export async function getOutagesPage(
+  params: GetOutagesPageParams = {},
+  options?: { signal?: AbortSignal },
+): Promise<OutageCursorPage> {
+  try {
+    const { cursor, limit = DEFAULT_OUTAGE_PAGE_LIMIT, ...filters } = params;
+    const res = await api.get<OutageCursorPage>(OUTAGES_CURSOR_ENDPOINT, {
+      params: { ...filters, limit, ...(cursor ? { cursor } : {}) },
+      signal: options?.signal,
+    });
+
+    return res.data;
+  } catch (error) {
+    handleApiError(error, "Failed to fetch outages.");
+  }
+}
+
+/**
+ * Walk every keyset page for a filter, yielding one page of outages at a time.
+ */
+export async function* iterateOutagePages(
+  params: Omit<GetOutagesPageParams, "cursor"> = {},
+  options?: { signal?: AbortSignal },
+): AsyncGenerator<Outage[]> {
+  let cursor: string | null = null;
+
+  do {
+    const page: OutageCursorPage = await getOutagesPage({ ...params, cursor }, options);
+    if (page.items.length) {
+      yield page.items;
+    }
+    cursor = page.next_cursor;
+  } while (cursor);
+}
+
+/* -------------------------------------------------------------------------- */
+/*                          Open-Outage Node Index                            */
+/* -------------------------------------------------------------------------- */
+
+/**
+ * Node → open-outage index for correlation and duplicate checks. Kept current by the create,
+ * update, delete and resolve calls below and by change-feed events passed to applyOutageChange;
+ * loadOpenOutageNodeIndex repopulates it once the last full load is older than the TTL.
+ */
+export const openOutageNodeIndex = createOutageNodeIndex();
+// Bounds drift from changes neither this client nor the change feed saw
+const OPEN_OUTAGE_INDEX_TTL_MS = 5 * 60_000;
+let openOutageIndexLoad: Promise<OutageNodeIndex> | null = null;
+let openOutageIndexLoadedAt = 0;
+
+/**
+ * Rebuild the node index from every open outage, one keyset page at a time.
+ * Concurrent callers share a single load, and later callers reuse it until it is older than
+ * OPEN_OUTAGE_INDEX_TTL_MS; a failed load is retried by the next caller.
+ */
+export function loadOpenOutageNodeIndex(): Promise<OutageNodeIndex> {
+  if (openOutageIndexLoad && openOutageIndexLoadedAt && Date.now() - openOutageIndexLoadedAt > OPEN_OUTAGE_INDEX_TTL_MS) {
+    openOutageIndexLoad = null;
+  }
+  if (!openOutageIndexLoad) {
+    openOutageIndexLoadedAt = 0;
+    const load: Promise<OutageNodeIndex> = (async () => {
+      const open: Outage[] = [];
+      for await (const page of iterateOutagePages({ status: "open" })) {
+        open.push(...page);
+      }
+      openOutageNodeIndex.rebuild(open);
+      if (openOutageIndexLoad === load) openOutageIndexLoadedAt = Date.now();
+      return openOutageNodeIndex;
+    })().catch((error: unknown) => {
+      if (openOutageIndexLoad === load) openOutageIndexLoad = null;
+      throw error;
+    });
+    openOutageIndexLoad = load;
+  }
+  return openOutageIndexLoad;
+}
+
+/**
+ * Drop the loaded index so the next loadOpenOutageNodeIndex pages it in again.
+ */
+export function invalidateOpenOutageNodeIndex(): void {
+  openOutageIndexLoad = null;
+  openOutageIndexLoadedAt = 0;
+}
+
+/**
+ * Fold a change-feed event into the node index. Events do not carry affected services, so an outage
+ * that is created or reopened is fetched and upserted; one that leaves "open" is removed. Nothing is
+ * fetched until the index has been loaded.
+ */
+export function applyOutageChange(event: ChangeEvent): void {
+  if (!openOutageIndexLoad) return;
+
+  if (event.type === "outage.status_changed" && event.status !== "open") {
+    openOutageNodeIndex.remove(event.outage_id);
+  } else if (event.type === "outage.created" || event.type === "outage.status_changed") {
+    getOutage(event.outage_id).then(openOutageNodeIndex.upsert, invalidateOpenOutageNodeIndex);
+  }
+}
+
 /**
  * Fetch a single outage by ID
  */
@@ -113,6 +242,7 @@ export async function createOutage(
       payload,
     );
 
+    openOutageNodeIndex.upsert(res.data);
     return res.data;
   } catch (error) {
     handleApiError(error, "Failed to create outage.");
@@ -136,6 +266,7 @@ export async function updateOutage(
       payload,
     );
 
+    openOutageNodeIndex.upsert(res.data);
     return res.data;
   } catch (error) {
     handleApiError(error, "Failed to update outage.");
@@ -157,6 +288,7 @@ export async function deleteOutage(
       `${OUTAGES_ENDPOINT}/${id}`,
     );
 
+    openOutageNodeIndex.remove(id);
     return res.data;
   } catch (error) {
     handleApiError(error, "Failed to delete outage.");
@@ -180,12 +312,49 @@ export async function resolveOutage(
       payload,
     );
 
+    openOutageNodeIndex.remove(id);
     return res.data;
   } catch (error) {
     handleApiError(error, "Failed to resolve outage.");
   }
 }
 
+/* -------------------------------------------------------------------------- */
+/*                            Payment Generation                              */
+/* -------------------------------------------------------------------------- */
+
+const paymentGeneration = createIdempotentRunner<OutageResolutionPayment>();
+
+/**
+ * Generate the SLA payment for a resolved outage.
+ * The key is derived from the outage ID alone, so every caller and every retry for the same outage
+ * presents the same key: the server's unique-key insert returns the original payment for replays,
+ * and concurrent calls in this process share a single request.
+ */
+export async function generateOutagePayment(
+  id: string,
+): Promise<OutageResolutionPayment> {
+  try {
+    if (!id) {
+      throw new Error("Outage ID is required.");
+    }
+
+    const idempotencyKey = await deriveIdempotencyKey("payment-generate", [id]);
+
+    return await paymentGeneration.run(idempotencyKey, async () => {
+      const res = await api.post<OutageResolutionPayment>(
+        `${OUTAGES_ENDPOINT}/${id}/payment/generate`,
+        undefined,
+        { headers: { [IDEMPOTENCY_HEADER]: idempotencyKey } },
+      );
+
+      return res.data;
+    });
+  } catch (error) {
+    handleApiError(error, "Failed to generate payment.");
+  }
+}
+
 /* -------------------------------------------------------------------------- */
 /*                            Batch Operations                                */
 /* -------------------------------------------------------------------------- */
@@ -196,6 +365,13 @@ interface BatchOperationResponse {
   errors?: Array<{ id: string; error: string }>;
 }
 
+export interface BatchResolveResponse extends BatchOperationResponse {
+  /** SLA results for the outages resolved in this call, computed in one pass. */
+  results?: Array<{ id: string; sla: SLAResult }>;
+  /** Single batched payment generation job for the resolved outages, if requested. */
+  payment_job?: PaymentJob | null;
+}
+
 /**
  * Acknowledge multiple outages in batch.
  */
@@ -219,22 +395,42 @@ export async function batchAcknowledgeOutages(
 }
 
 /**
- * Resolve multiple outages in batch.
+ * Resolve multiple outages in one transaction.
+ * Replaces the per-outage resolve and SLA round-trips: SLAs come back in the response, and with
+ * `generate_payments` set, payment generation is enqueued as one batched job. The Idempotency-Key is
+ * derived from `actionId`, the outage set and the options, so retrying one resolve action under the
+ * same `actionId` maps onto the same payment job instead of paying twice. A new `actionId` (the
+ * default) is a new resolve.
  */
 export async function batchResolveOutages(
   ids: string[],
-  payload?: { mttr_minutes?: number },
-): Promise<BatchOperationResponse> {
+  payload?: { mttr_minutes?: number; generate_payments?: boolean },
+  actionId: string = createIdempotencyNonce(),
+): Promise<BatchResolveResponse> {
   try {
     if (!ids.length) {
       throw new Error("At least one outage ID is required.");
     }
 
-    const res = await api.post<BatchOperationResponse>(
+    const uniqueIds = Array.from(new Set(ids)).sort();
+    const generatePayments = payload?.generate_payments ?? false;
+    const idempotencyKey = await deriveIdempotencyKey("bulk-resolve", [
+      actionId,
+      uniqueIds,
+      payload?.mttr_minutes ?? null,
+      generatePayments,
+    ]);
+
+    const res = await api.post<BatchResolveResponse>(
       `${OUTAGES_ENDPOINT}/batch/resolve`,
-      { ids, ...payload },
+      { ...payload, ids: uniqueIds, generate_payments: generatePayments },
+      { headers: { [IDEMPOTENCY_HEADER]: idempotencyKey } },
     );
 
+    // Without per-outage results, every requested outage that did not report an error was resolved
+    const failed = new Set(res.data.errors?.map((error) => error.id));
+    const resolved = res.data.results?.map(({ id }) => id) ?? uniqueIds.filter((id) => !failed.has(id));
+    resolved.forEach(openOutageNodeIndex.remove);
     return res.data;
   } catch (error) {
     handleApiError(error, "Failed to resolve outages.");
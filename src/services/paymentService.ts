@@ -3,6 +3,7 @@ import type {
   PaginatedPayments,
   Payment,
   PaymentHistoryEntry,
+  PaymentJob,
   ReconciliationStatus,
 } from "@/types/payment";
 
@@ -17,6 +18,15 @@ export interface PaymentFilters {
   sort_dir?: "asc" | "desc";
 }
 
+export interface PaymentJobPollOptions {
+  signal?: AbortSignal;
+  initialDelayMs?: number;
+  maxDelayMs?: number;
+  timeoutMs?: number;
+}
+
+const PAYMENT_JOB_TERMINAL_STATUSES = new Set(["succeeded", "failed"]);
+
 interface PaymentHistoryResponse {
   total?: number;
   transactions?: unknown[];
@@ -189,6 +199,54 @@ export const reconcilePayment = async (id: string, payload?: { note?: string }):
   return normalizePayment(response.data);
 };
 
+export const fetchPaymentJob = async (jobId: string, signal?: AbortSignal): Promise<PaymentJob> => {
+  const response = await api.get<PaymentJob>(`/payments/jobs/${jobId}`, { signal });
+  return response.data;
+};
+
+function delay(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(new DOMException("Aborted", "AbortError"));
+      return;
+    }
+    const timer = setTimeout(() => {
+      signal?.removeEventListener("abort", onAbort);
+      resolve();
+    }, ms);
+    function onAbort() {
+      clearTimeout(timer);
+      reject(new DOMException("Aborted", "AbortError"));
+    }
+    signal?.addEventListener("abort", onAbort, { once: true });
+  });
+}
+
+/**
+ * Polls a queued payment generation job until it succeeds or fails.
+ * The interval starts at `initialDelayMs` and doubles up to `maxDelayMs`, with jitter so many
+ * resolved outages do not poll in lockstep; gives up after `timeoutMs`.
+ */
+export const waitForPaymentJob = async (
+  jobId: string,
+  { signal, initialDelayMs = 500, maxDelayMs = 10_000, timeoutMs = 5 * 60_000 }: PaymentJobPollOptions = {},
+): Promise<PaymentJob> => {
+  const deadline = Date.now() + timeoutMs;
+  let interval = initialDelayMs;
+
+  for (;;) {
+    const job = await fetchPaymentJob(jobId, signal);
+    if (PAYMENT_JOB_TERMINAL_STATUSES.has(job.status)) return job;
+
+    const remaining = deadline - Date.now();
+    if (remaining <= 0) {
+      throw new Error(`Payment job ${jobId} did not finish within ${Math.round(timeoutMs / 1000)}s.`);
+    }
+    await delay(Math.min(remaining, interval / 2 + Math.random() * (interval / 2)), signal);
+    interval = Math.min(interval * 2, maxDelayMs);
+  }
+};
+
 export const exportPayments = async (filters: Omit<PaymentFilters, "page" | "page_size"> = {}): Promise<void> => {
   const response = await api.get("/payments/export", {
     params: filters,
@@ -209,4 +267,6 @@ export const PaymentService = {
   retryPayment,
   reconcilePayment,
   exportPayments,
+  fetchPaymentJob,
+  waitForPaymentJob,
 };
@@ -0,0 +1,180 @@
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+DEFAULT_HISTORY_PATH = os.getenv("SCORECARD_HISTORY_PATH", "scorecard_history.db")
+TREND_WINDOWS_DAYS = (7, 30)
+# Days kept by the prune that runs on the first write of each day; never shorter than the longest trend window
+HISTORY_RETENTION_DAYS = max(int(os.getenv("SCORECARD_HISTORY_RETENTION_DAYS", "90")), max(TREND_WINDOWS_DAYS))
+
+class ScorecardHistoryStore:
+    """
+    Append-only scorecard history in a local SQLite file, laid out by day.
+    Every evaluation lands in `scorecard_history` keyed by (scope, day, evaluated_at), so range reads are
+    index seeks; the same transaction folds it into a per-day rollup (`scorecard_daily`), so 7/30-day means
+    and GO-rate are sums over at most 30 rollup rows no matter how many evaluations were recorded.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_HISTORY_PATH, retention_days: int = HISTORY_RETENTION_DAYS):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.retention_days = retention_days
+        self.pruned_on: Optional[str] = None
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS scorecard_history (
+                scope TEXT NOT NULL,
+                day TEXT NOT NULL,
+                evaluated_at TEXT NOT NULL,
+                reliability_index REAL NOT NULL,
+                go INTEGER NOT NULL,
+                slo_success_rate REAL NOT NULL,
+                test_pass_rate REAL NOT NULL,
+                open_security_vulns INTEGER NOT NULL,
+                incident_count INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_scorecard_history_scope_day
+                ON scorecard_history (scope, day, evaluated_at);
+            CREATE TABLE IF NOT EXISTS scorecard_daily (
+                scope TEXT NOT NULL,
+                day TEXT NOT NULL,
+                evaluations INTEGER NOT NULL,
+                index_sum REAL NOT NULL,
+                go_count INTEGER NOT NULL,
+                PRIMARY KEY (scope, day)
+            );
+            """
+        )
+
+    def record(self, scorecard: Dict[str, Any], evaluated_at: Optional[datetime] = None, scope: str = "default") -> None:
+        self.record_many([scorecard], evaluated_at, scope)
+
+    def record_many(self, scorecards: Iterable[Dict[str, Any]], evaluated_at: Optional[datetime] = None, scope: str = "default") -> None:
+        """
+        Appends evaluated scorecards (as returned by ReliabilityScorecardService) and updates their day's rollup.
+        The first write of each day also prunes days older than the retention window.
+        """
+        evaluated_at = evaluated_at or datetime.utcnow()
+        day = evaluated_at.date().isoformat()
+        rows = [_history_row(scorecard, scope, day, evaluated_at) for scorecard in scorecards]
+        if not rows:
+            return
+
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO scorecard_history (scope, day, evaluated_at, reliability_index, go, "
+                "slo_success_rate, test_pass_rate, open_security_vulns, incident_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.execute(
+                "INSERT INTO scorecard_daily (scope, day, evaluations, index_sum, go_count) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(scope, day) DO UPDATE SET evaluations = evaluations + excluded.evaluations, "
+                "index_sum = index_sum + excluded.index_sum, go_count = go_count + excluded.go_count",
+                (scope, day, len(rows), sum(row[3] for row in rows), sum(row[4] for row in rows)),
+            )
+        if self.pruned_on != day:
+            self.prune(evaluated_at.date() - timedelta(days=self.retention_days - 1))
+            self.pruned_on = day
+
+    def get_range(self, start_time: datetime, end_time: datetime, scope: str = "default") -> List[Dict[str, Any]]:
+        """
+        Evaluations in [start_time, end_time), oldest first.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT evaluated_at, reliability_index, go, slo_success_rate, test_pass_rate, open_security_vulns, incident_count "
+                "FROM scorecard_history WHERE scope = ? AND day >= ? AND day <= ? AND evaluated_at >= ? AND evaluated_at < ? "
+                "ORDER BY day, evaluated_at",
+                (scope, start_time.date().isoformat(), end_time.date().isoformat(), start_time.isoformat(), end_time.isoformat()),
+            ).fetchall()
+        return [
+            {
+                "evaluated_at": evaluated_at,
+                "reliability_index": reliability_index,
+                "status": "GO" if go else "NO-GO",
+                "metrics_evaluated": {
+                    "slo_success_rate": slo_success_rate,
+                    "test_pass_rate": test_pass_rate,
+                    "open_security_vulns": open_security_vulns,
+                    "incident_count": incident_count,
+                },
+            }
+            for evaluated_at, reliability_index, go, slo_success_rate, test_pass_rate, open_security_vulns, incident_count in rows
+        ]
+
+    def get_daily(self, start_day: date, end_day: date, scope: str = "default") -> List[Dict[str, Any]]:
+        """
+        Per-day rollups for start_day..end_day inclusive; days without evaluations are omitted.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT day, evaluations, index_sum, go_count FROM scorecard_daily "
+                "WHERE scope = ? AND day >= ? AND day <= ? ORDER BY day",
+                (scope, start_day.isoformat(), end_day.isoformat()),
+            ).fetchall()
+        return [
+            {"day": day, "evaluations": evaluations, "mean_index": round(index_sum / evaluations, 2), "go_rate": round(go_count / evaluations, 4)}
+            for day, evaluations, index_sum, go_count in rows
+        ]
+
+    def get_trends(self, as_of: Optional[date] = None, scope: str = "default", windows: Sequence[int] = TREND_WINDOWS_DAYS) -> Dict[str, Any]:
+        """
+        Rolling mean reliability index and GO-rate over each trailing window of days ending at `as_of` (inclusive).
+        """
+        as_of = as_of or datetime.utcnow().date()
+        trends: Dict[str, Any] = {"as_of": as_of.isoformat(), "scope": scope}
+        with self.lock:
+            for days in windows:
+                evaluations, index_sum, go_count = self.conn.execute(
+                    "SELECT COALESCE(SUM(evaluations), 0), COALESCE(SUM(index_sum), 0), COALESCE(SUM(go_count), 0) "
+                    "FROM scorecard_daily WHERE scope = ? AND day > ? AND day <= ?",
+                    (scope, (as_of - timedelta(days=days)).isoformat(), as_of.isoformat()),
+                ).fetchone()
+                trends[f"{days}d"] = {
+                    "evaluations": evaluations,
+                    "mean_index": round(index_sum / evaluations, 2) if evaluations else None,
+                    "go_rate": round(go_count / evaluations, 4) if evaluations else None,
+                }
+        return trends
+
+    def prune(self, before_day: date) -> None:
+        """
+        Drops whole days older than `before_day` from both the history and the rollups.
+        """
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM scorecard_history WHERE day < ?", (before_day.isoformat(),))
+            self.conn.execute("DELETE FROM scorecard_daily WHERE day < ?", (before_day.isoformat(),))
+
+    def close(self) -> None:
+        self.conn.close()
+
+def _history_row(scorecard: Dict[str, Any], scope: str, day: str, evaluated_at: datetime):
+    metrics = scorecard["metrics_evaluated"]
+    return (
+        scope,
+        day,
+        evaluated_at.isoformat(),
+        float(scorecard["reliability_index"]),
+        1 if scorecard["status"] == "GO" else 0,
+        float(metrics["slo_success_rate"]),
+        float(metrics["test_pass_rate"]),
+        int(metrics["open_security_vulns"]),
+        int(metrics["incident_count"]),
+    )
+
+_history_store: Optional[ScorecardHistoryStore] = None
+_history_lock = threading.Lock()
+
+def get_scorecard_history() -> ScorecardHistoryStore:
+    """
+    Process-wide history store at SCORECARD_HISTORY_PATH, opened on first use.
+    """
+    global _history_store
+    with _history_lock:
+        if _history_store is None:
+            _history_store = ScorecardHistoryStore()
+        return _history_store
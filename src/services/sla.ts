@@ -9,6 +9,8 @@ import type {
   ResolveDisputePayload,
   SLADispute,
   SLAResult,
+  SLAConfigMap,
+  SLAThreshold,
 } from "@/types/sla";
 
 /* -------------------------------------------------------------------------- */
@@ -30,6 +32,11 @@ interface APIErrorResponse {
   message?: string;
 }
 
+interface SLAConfigCacheEntry {
+  etag: string | null;
+  thresholds: SLAThreshold[];
+}
+
 /* -------------------------------------------------------------------------- */
 /*                                  Constants                                 */
 /* -------------------------------------------------------------------------- */
@@ -38,8 +45,34 @@ const SLA_ENDPOINTS = {
   CALCULATE: "/sla/calculate",
   PREVIEW: "/sla/preview",
   DISPUTES: "/sla/disputes",
+  CONFIG: "/sla/config",
 } as const;
 
+/* -------------------------------------------------------------------------- */
+/*                              SLA Config Cache                              */
+/* -------------------------------------------------------------------------- */
+
+let configCache: SLAConfigCacheEntry | null = null;
+let configRequest: Promise<SLAConfigCacheEntry> | null = null;
+
+async function loadSLAConfig(): Promise<SLAConfigCacheEntry> {
+  const previous = configCache;
+
+  const response = await api.get<SLAConfigMap>(SLA_ENDPOINTS.CONFIG, {
+    headers: previous?.etag ? { "If-None-Match": previous.etag } : undefined,
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+  });
+
+  if (response.status === 304 && previous) {
+    return previous;
+  }
+
+  return {
+    etag: (response.headers?.etag as string | undefined) ?? null,
+    thresholds: Object.entries(response.data).map(([severity, config]) => ({ severity, ...config })),
+  };
+}
+
 /* -------------------------------------------------------------------------- */
 /*                               Helper Methods                               */
 /* -------------------------------------------------------------------------- */
@@ -180,6 +213,31 @@ export async function resolveDispute(
   }
 }
 
+/**
+ * Fetch the per-severity SLA configuration.
+ * Every call revalidates with If-None-Match against the last table seen, so an unchanged table costs
+ * a 304 instead of a full download; concurrent calls share one request. Freshness and invalidation
+ * after edits are left to the caller's query cache (queryKeys.sla.config).
+ */
+export async function getSLAConfig(): Promise<SLAThreshold[]> {
+  if (!configRequest) {
+    configRequest = loadSLAConfig()
+      .then((entry) => {
+        configCache = entry;
+        return entry;
+      })
+      .finally(() => {
+        configRequest = null;
+      });
+  }
+
+  try {
+    return (await configRequest).thresholds;
+  } catch (error: unknown) {
+    throw new Error(extractErrorMessage(error));
+  }
+}
+
 /* -------------------------------------------------------------------------- */
 /*                            Optional Query Keys                             */
 /* -------------------------------------------------------------------------- */
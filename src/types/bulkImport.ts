@@ -19,3 +19,15 @@ export interface BulkImportRecord {
   errors: ImportValidationError[];
   created_at: string;
 }
+
+export interface BulkImportBatchResult {
+  imported: number;
+  errors: ImportValidationError[];
+}
+
+export interface StreamingImportProgress {
+  rowsRead: number;
+  imported: number;
+  skipped: number;
+  percent: number;
+}
@@ -1,3 +1,5 @@
+import type { PaymentJob } from "@/types/payment";
+
 export type Severity = "critical" | "high" | "medium" | "low";
 export type OutageStatus = "open" | "resolved";
 
@@ -93,6 +95,15 @@ export interface PaginatedOutages {
   page_size: number;
 }
 
+/**
+ * One keyset page of outages ordered by (status, severity, detected_at).
+ * `next_cursor` is an opaque token for the following page, or null on the last page.
+ */
+export interface OutageCursorPage {
+  items: Outage[];
+  next_cursor: string | null;
+}
+
 export interface ResolveOutagePayload {
   mttr_minutes: number;
 }
@@ -100,5 +111,8 @@ export interface ResolveOutagePayload {
 export interface ResolveOutageResponse {
   outage: Outage;
   sla: SLAResult;
-  payment: OutageResolutionPayment;
+  /** Present when the payment was settled inline with the resolve. */
+  payment?: OutageResolutionPayment | null;
+  /** Present when payment generation was queued; poll it with waitForPaymentJob. */
+  payment_job?: PaymentJob | null;
 }
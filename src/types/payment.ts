@@ -1,3 +1,5 @@
+import type { OutageResolutionPayment } from "@/types/outages";
+
 export type PaymentType = "reward" | "penalty" | "manual" | string;
 export type PaymentStatus = string;
 export type ReconciliationStatus =
@@ -48,3 +50,20 @@ export interface PaymentHistoryEntry {
   correlationId?: string | null;
   metadata?: Record<string, unknown> | null;
 }
+
+export type PaymentJobStatus = "queued" | "running" | "succeeded" | "failed";
+
+/**
+ * Server-side payment generation job. Jobs are idempotent per `idempotency_key`;
+ * resubmitting the same key returns the existing job instead of creating payments twice.
+ */
+export interface PaymentJob {
+  job_id: string;
+  status: PaymentJobStatus;
+  idempotency_key: string;
+  outage_ids: string[];
+  attempts?: number;
+  /** Populated once the job has succeeded. */
+  payments?: OutageResolutionPayment[];
+  error?: string | null;
+}
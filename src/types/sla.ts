@@ -8,6 +8,16 @@ export interface SLAResult {
   rating: "exceptional" | "excellent" | "good" | "poor";
 }
 
+export interface SLAThreshold {
+  severity: string;
+  threshold_minutes: number;
+  penalty_per_minute: number;
+  reward_base: number;
+}
+
+/** `/sla/config` response: severity → its threshold configuration. */
+export type SLAConfigMap = Record<string, Omit<SLAThreshold, "severity">>;
+
 export type DisputeStatus = "open" | "under_review" | "resolved" | "rejected";
 
 export interface SLADispute {
@@ -0,0 +1,112 @@
+"""
+SQLite-backed benchmark fixture for PaymentRepository summary queries.
+
+Loads a synthetic payments table (10M rows by default, spread over 30 days), builds the covering
+index from sql/payments_summary.sql, then checks that each summary query is answered from the
+index alone and reports its latency over a one-hour reconciliation window.
+
+    PAYMENT_BENCH_ROWS=10000000 python tests/benchmarks/bench_payment_summary.py
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.repositories.payment_repository import (
+    PaymentRepository,
+    _BUCKETED_SUMMARY_SQL,
+    _BUCKET_TOTALS_SQL,
+    _STATUS_SUMMARY_SQL,
+    bucket_params,
+)
+
+ROWS = int(os.getenv("PAYMENT_BENCH_ROWS", "10000000"))
+LATENCY_BUDGET_MS = float(os.getenv("PAYMENT_BENCH_BUDGET_MS", "250"))
+WINDOW_START = datetime(2026, 10, 10, 0, 0, 0)
+WINDOW_END = WINDOW_START + timedelta(hours=1)
+
+SCHEMA = """
+CREATE TABLE payments (
+    id          INTEGER PRIMARY KEY,
+    customer_id TEXT,
+    status      TEXT NOT NULL,
+    amount      NUMERIC NOT NULL,
+    created_at  TIMESTAMP NOT NULL,
+    updated_at  TIMESTAMP NOT NULL
+);
+"""
+
+# SQLite has no INCLUDE clause, so amount becomes a trailing key column
+COVERING_INDEX = "CREATE INDEX ix_payments_summary_covering ON payments (updated_at, status, customer_id, amount)"
+
+SEED = """
+WITH RECURSIVE seq(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM seq WHERE n < :last)
+INSERT INTO payments (customer_id, status, amount, created_at, updated_at)
+SELECT 'cust-' || (n % 500),
+       CASE WHEN n % 20 = 0 THEN 'FAILED' ELSE 'SUCCESS' END,
+       (n % 10000) / 100.0,
+       datetime(:epoch + n * 2592000 / :rows, 'unixepoch'),
+       datetime(:epoch + n * 2592000 / :rows, 'unixepoch')
+FROM seq
+"""
+
+
+def build_fixture(path: str, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executescript(SCHEMA)
+        conn.execute(SEED, {"last": rows - 1, "rows": rows, "epoch": int((datetime(2026, 10, 1) - datetime(1970, 1, 1)).total_seconds())})
+        conn.execute(COVERING_INDEX)
+        conn.execute("ANALYZE")
+    conn.close()
+
+
+def explain(session: Session, statement, params) -> str:
+    plan = session.execute(text("EXPLAIN QUERY PLAN " + statement.text), params).fetchall()
+    return " | ".join(row[-1] for row in plan)
+
+
+def timed(label: str, fn) -> float:
+    started = time.perf_counter()
+    result = fn()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"{label:<28} {elapsed_ms:9.2f} ms  ({len(result)} rows)")
+    return elapsed_ms
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "payments.db")
+        started = time.perf_counter()
+        build_fixture(path, ROWS)
+        print(f"Loaded {ROWS:,} payments in {time.perf_counter() - started:.1f}s")
+
+        engine = create_engine(f"sqlite:///{path}")
+        with Session(engine) as session:
+            repo = PaymentRepository(session)
+            params = bucket_params(WINDOW_START, WINDOW_END, timedelta(minutes=1))
+
+            plans = {
+                "status summary": explain(session, text(_STATUS_SUMMARY_SQL), params),
+                "bucketed summary": explain(session, repo.summary_statement(_BUCKETED_SUMMARY_SQL), params),
+                "bucket totals": explain(session, repo.summary_statement(_BUCKET_TOTALS_SQL), params),
+            }
+            for label, plan in plans.items():
+                print(f"{label:<28} {plan}")
+                assert "USING COVERING INDEX ix_payments_summary_covering" in plan, f"{label} is not index-only: {plan}"
+
+            latencies = [
+                timed("get_transactional_summary", lambda: repo.get_transactional_summary(WINDOW_START, WINDOW_END)),
+                timed("iter_transactional_summary", lambda: list(repo.iter_transactional_summary(WINDOW_START, WINDOW_END))),
+                timed("get_bucket_totals", lambda: repo.get_bucket_totals(WINDOW_START, WINDOW_END, timedelta(minutes=5))),
+            ]
+            assert max(latencies) <= LATENCY_BUDGET_MS, f"summary latency {max(latencies):.1f} ms exceeds {LATENCY_BUDGET_MS} ms budget"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+// @vitest-environment node
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+import { BulkImportError, streamBulkImportOutages } from "@/services/bulkImportService";
+
+const mockPost = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { post: (...a: unknown[]) => mockPost(...a) },
+}));
+
+function csvFile(rows: number, invalidEvery = 0): File {
+  const lines = ["service_id,start_time,end_time"];
+  for (let i = 0; i < rows; i++) {
+    const end = invalidEvery && i % invalidEvery === 0 ? "not-a-date" : "2024-01-01T11:00:00Z";
+    lines.push(`svc-${i},2024-01-01T10:00:00Z,${end}`);
+  }
+  return new File([lines.join("\n")], "outages.csv", { type: "text/csv" });
+}
+
+describe("streaming bulk import", () => {
+  beforeEach(() => {
+    mockPost.mockReset();
+    mockPost.mockImplementation(async (_url: string, body: string) => ({
+      data: { imported: body.split("\n").length, errors: [] },
+    }));
+  });
+
+  it("uploads valid rows in NDJSON batches and streams row errors", async () => {
+    const rowErrors: unknown[] = [];
+    const result = await streamBulkImportOutages(csvFile(25, 10), {
+      batchSize: 10,
+      onRowError: (error) => rowErrors.push(error),
+    });
+
+    expect(mockPost).toHaveBeenCalledTimes(3);
+    expect(mockPost.mock.calls[0][0]).toBe("/outages/bulk/batch");
+    expect(mockPost.mock.calls[0][2].headers["Content-Type"]).toBe("application/x-ndjson");
+    const first = JSON.parse(mockPost.mock.calls[0][1].split("\n")[0]);
+    expect(first).toEqual({
+      row: 3,
+      outage: { service_id: "svc-1", start_time: "2024-01-01T10:00:00Z", end_time: "2024-01-01T11:00:00Z" },
+    });
+
+    expect(result).toMatchObject({ imported: 22, skipped: 3 });
+    expect(rowErrors).toEqual(result.errors);
+    expect(result.errors.map((e) => e.row)).toEqual([2, 12, 22]);
+  });
+
+  it("derives a distinct, repeatable idempotency key per batch within one import", async () => {
+    const file = csvFile(20);
+    await streamBulkImportOutages(file, { batchSize: 10, importId: "import-1" });
+    await streamBulkImportOutages(file, { batchSize: 10, importId: "import-1" });
+
+    const keys = mockPost.mock.calls.map((call) => call[2].headers["Idempotency-Key"]);
+    expect(new Set(keys.slice(0, 2)).size).toBe(2);
+    expect(keys.slice(2)).toEqual(keys.slice(0, 2));
+  });
+
+  it("never reuses a key across imports or batch sizes", async () => {
+    const file = csvFile(20);
+    await streamBulkImportOutages(file, { batchSize: 10 });
+    await streamBulkImportOutages(file, { batchSize: 10 });
+    await streamBulkImportOutages(file, { batchSize: 5, importId: "import-1" });
+    await streamBulkImportOutages(file, { batchSize: 10, importId: "import-1" });
+
+    const keys = mockPost.mock.calls.map((call) => call[2].headers["Idempotency-Key"]);
+    expect(new Set(keys).size).toBe(keys.length);
+  });
+
+  it("reports the rows already imported when a batch fails", async () => {
+    mockPost
+      .mockResolvedValueOnce({ data: { imported: 10, errors: [] } })
+      .mockRejectedValueOnce({ response: { data: { message: "Database unavailable" } } });
+
+    const failure = await streamBulkImportOutages(csvFile(25), { batchSize: 10 }).catch((error) => error);
+
+    expect(failure).toBeInstanceOf(BulkImportError);
+    expect(failure.message).toBe("Database unavailable");
+    expect(failure.partial).toMatchObject({ imported: 10, skipped: 0 });
+  });
+
+  it("stops before uploading when a required column is missing", async () => {
+    const file = new File(["service_id,start_time\nsvc-1,2024-01-01T10:00:00Z"], "outages.csv");
+    const result = await streamBulkImportOutages(file);
+
+    expect(mockPost).not.toHaveBeenCalled();
+    expect(result.errors[0].message).toContain("end_time");
+  });
+});
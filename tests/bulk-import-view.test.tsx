@@ -9,15 +9,21 @@ vi.mock("next/link", () => ({
 }));
 
 const mockBulkImport = vi.fn();
+const mockStreamImport = vi.fn();
 vi.mock("@/services/bulkImportService", () => ({
+  BulkImportError: class extends Error {},
   bulkImportOutages: (...a: unknown[]) => mockBulkImport(...a),
+  streamBulkImportOutages: (...a: unknown[]) => mockStreamImport(...a),
 }));
 
 const validCsv = "service_id,start_time,end_time\ns1,2026-01-01,2026-01-02";
 const file = (name: string, content: string) => new File([content], name, { type: "text/csv" });
 
 describe("BulkImportView", () => {
-  beforeEach(() => mockBulkImport.mockReset());
+  beforeEach(() => {
+    mockBulkImport.mockReset();
+    mockStreamImport.mockReset();
+  });
 
   it("renders upload area with disabled button", () => {
     render(<BulkImportView />);
@@ -41,7 +47,7 @@ describe("BulkImportView", () => {
   });
 
   it("shows success summary after valid upload", async () => {
-    mockBulkImport.mockResolvedValue({ imported: 3, skipped: 1, errors: [] });
+    mockStreamImport.mockResolvedValue({ imported: 3, skipped: 1, errors: [] });
     render(<BulkImportView />);
     const input = document.querySelector("input[type='file']") as HTMLInputElement;
     fireEvent.change(input, { target: { files: [file("data.csv", validCsv)] } });
@@ -49,10 +55,12 @@ describe("BulkImportView", () => {
     fireEvent.click(screen.getByRole("button", { name: /upload file/i }));
     expect(await screen.findByText("Import Summary")).toBeInTheDocument();
     expect(screen.getByText("3")).toBeInTheDocument();
+    expect(mockStreamImport).toHaveBeenCalledWith(expect.objectContaining({ name: "data.csv" }), expect.any(Object));
+    expect(mockBulkImport).not.toHaveBeenCalled();
   });
 
   it("shows server validation errors in summary", async () => {
-    mockBulkImport.mockResolvedValue({ imported: 0, skipped: 1, errors: [{ row: 2, message: "Invalid date" }] });
+    mockStreamImport.mockResolvedValue({ imported: 0, skipped: 1, errors: [{ row: 2, message: "Invalid date" }] });
     render(<BulkImportView />);
     const input = document.querySelector("input[type='file']") as HTMLInputElement;
     fireEvent.change(input, { target: { files: [file("data.csv", validCsv)] } });
@@ -60,4 +68,48 @@ describe("BulkImportView", () => {
     fireEvent.click(screen.getByRole("button", { name: /upload file/i }));
     expect(await screen.findByText("Invalid date")).toBeInTheDocument();
   });
+
+  it("uploads JSON arrays whole instead of streaming them", async () => {
+    mockBulkImport.mockResolvedValue({ imported: 1, skipped: 0, errors: [] });
+    render(<BulkImportView />);
+    const input = document.querySelector("input[type='file']") as HTMLInputElement;
+    const json = JSON.stringify([{ service_id: "s1", start_time: "2026-01-01", end_time: "2026-01-02" }]);
+    fireEvent.change(input, { target: { files: [new File([json], "data.json", { type: "application/json" })] } });
+    await screen.findByText("data.json");
+    fireEvent.click(screen.getByRole("button", { name: /upload file/i }));
+    expect(await screen.findByText("Import Summary")).toBeInTheDocument();
+    expect(mockBulkImport).toHaveBeenCalled();
+    expect(mockStreamImport).not.toHaveBeenCalled();
+  });
+
+  it("streams NDJSON files in batches", async () => {
+    mockStreamImport.mockResolvedValue({ imported: 2, skipped: 0, errors: [] });
+    render(<BulkImportView />);
+    const input = document.querySelector("input[type='file']") as HTMLInputElement;
+    const ndjson = [
+      { service_id: "s1", start_time: "2026-01-01", end_time: "2026-01-02" },
+      { service_id: "s2", start_time: "2026-01-03", end_time: "2026-01-04" },
+    ]
+      .map((row) => JSON.stringify(row))
+      .join("\n");
+    fireEvent.change(input, { target: { files: [new File([ndjson], "data.ndjson", { type: "application/x-ndjson" })] } });
+    expect(await screen.findByText("s2")).toBeInTheDocument();
+    fireEvent.click(screen.getByRole("button", { name: /upload file/i }));
+    expect(await screen.findByText("Import Summary")).toBeInTheDocument();
+    expect(mockStreamImport).toHaveBeenCalledWith(expect.objectContaining({ name: "data.ndjson" }), expect.any(Object));
+    expect(mockBulkImport).not.toHaveBeenCalled();
+  });
+
+  it("previews a large CSV from its first rows without reading it whole", async () => {
+    const lines = ["service_id,start_time,end_time"];
+    for (let i = 0; i < 150; i++) lines.push(`svc-${i},2026-01-01,2026-01-02`);
+    const large = file("large.csv", lines.join("\n"));
+    const text = vi.spyOn(large, "text");
+    render(<BulkImportView />);
+    const input = document.querySelector("input[type='file']") as HTMLInputElement;
+    fireEvent.change(input, { target: { files: [large] } });
+    expect(await screen.findByText("Showing the first 100 rows")).toBeInTheDocument();
+    expect(screen.queryByText("svc-100")).not.toBeInTheDocument();
+    expect(text).not.toHaveBeenCalled();
+  });
 });
@@ -0,0 +1,71 @@
+import { vi, describe, it, expect, beforeEach } from "vitest";
+import { renderHook, waitFor, act } from "@testing-library/react";
+import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
+import { ReactNode } from "react";
+import { useOutages } from "@/features/outages/hooks/useOutages";
+
+const mockFetchOutages = vi.fn();
+const mockIsChangeFeedLive = vi.fn();
+
+vi.mock("@/lib/outages", () => ({
+  fetchOutages: (...args: unknown[]) => mockFetchOutages(...args),
+}));
+
+vi.mock("@/lib/changeFeed", () => ({
+  isChangeFeedLive: (...args: unknown[]) => mockIsChangeFeedLive(...args),
+  onChangeFeedStatusChange: () => () => undefined,
+}));
+
+function makeWrapper(client: QueryClient) {
+  return function Wrapper({ children }: { children: ReactNode }) {
+    return <QueryClientProvider client={client}>{children}</QueryClientProvider>;
+  };
+}
+
+describe("useOutages", () => {
+  let client: QueryClient;
+
+  beforeEach(() => {
+    client = new QueryClient({ defaultOptions: { queries: { retry: false } } });
+    mockFetchOutages.mockReset().mockResolvedValue({ items: [], total: 0, page: 1, page_size: 10 });
+    mockIsChangeFeedLive.mockReset();
+  });
+
+  it("is refetched by the change feed's list invalidation", async () => {
+    mockIsChangeFeedLive.mockReturnValue(true);
+    renderHook(() => useOutages({ severity: "critical" }), { wrapper: makeWrapper(client) });
+    await waitFor(() => expect(mockFetchOutages).toHaveBeenCalledTimes(1));
+
+    await act(async () => {
+      await client.invalidateQueries({ queryKey: ["outages", "list"] });
+    });
+
+    expect(mockFetchOutages).toHaveBeenCalledTimes(2);
+    expect(mockIsChangeFeedLive).toHaveBeenCalledWith({ severity: "critical" });
+  });
+
+  it("polls every 15s only while no live feed covers the list", async () => {
+    vi.useFakeTimers();
+    try {
+      mockIsChangeFeedLive.mockReturnValue(true);
+      renderHook(() => useOutages(), { wrapper: makeWrapper(client) });
+      await act(async () => {
+        await vi.advanceTimersByTimeAsync(60_000);
+      });
+      expect(mockFetchOutages).toHaveBeenCalledTimes(1);
+
+      // The slow poll picks up the dropped feed, after which the 15s poll resumes
+      mockIsChangeFeedLive.mockReturnValue(false);
+      await act(async () => {
+        await vi.advanceTimersByTimeAsync(245_000);
+      });
+      expect(mockFetchOutages).toHaveBeenCalledTimes(2);
+      await act(async () => {
+        await vi.advanceTimersByTimeAsync(15_000);
+      });
+      expect(mockFetchOutages).toHaveBeenCalledTimes(3);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+});
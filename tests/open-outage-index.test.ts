@@ -0,0 +1,90 @@
+// @vitest-environment node
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+
+import {
+  applyOutageChange,
+  batchResolveOutages,
+  invalidateOpenOutageNodeIndex,
+  loadOpenOutageNodeIndex,
+  openOutageNodeIndex,
+} from "@/services/outages";
+
+const mockGet = vi.fn();
+const mockPost = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: {
+    get: (...a: unknown[]) => mockGet(...a),
+    post: (...a: unknown[]) => mockPost(...a),
+  },
+}));
+
+function outage(id: string, affected_services: string[], status = "open") {
+  return { id, status, severity: "high", affected_services, detected_at: "2026-10-01T00:00:00Z" };
+}
+
+function servePages(...items: ReturnType<typeof outage>[]) {
+  mockGet.mockImplementation(async (url: string) =>
+    url === "/outages/cursor" ? { data: { items, next_cursor: null } } : { data: items.find((item) => url.endsWith(`/${item.id}`)) },
+  );
+}
+
+describe("open outage node index", () => {
+  beforeEach(() => {
+    mockGet.mockReset();
+    mockPost.mockReset();
+    invalidateOpenOutageNodeIndex();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("reuses a fresh load and pages the index in again once it expires", async () => {
+    vi.useFakeTimers();
+    servePages(outage("a", ["router-01"]));
+
+    await loadOpenOutageNodeIndex();
+    await loadOpenOutageNodeIndex();
+    expect(mockGet).toHaveBeenCalledTimes(1);
+
+    servePages(outage("b", ["router-02"]));
+    vi.advanceTimersByTime(5 * 60_000 + 1);
+    await loadOpenOutageNodeIndex();
+
+    expect(mockGet).toHaveBeenCalledTimes(2);
+    expect(openOutageNodeIndex.openOutagesForNode("router-01")).toEqual([]);
+    expect(openOutageNodeIndex.openOutagesForNode("router-02")).toEqual(["b"]);
+  });
+
+  it("applies change-feed events to a loaded index", async () => {
+    servePages(outage("a", ["router-01"]));
+    await loadOpenOutageNodeIndex();
+
+    servePages(outage("a", ["router-01"]), outage("c", ["router-03"]));
+    applyOutageChange({ id: "1", type: "outage.created", outage_id: "c" });
+    applyOutageChange({ id: "2", type: "outage.status_changed", outage_id: "a", status: "resolved" });
+
+    await vi.waitFor(() => expect(openOutageNodeIndex.openOutagesForNode("router-03")).toEqual(["c"]));
+    expect(openOutageNodeIndex.openOutagesForNode("router-01")).toEqual([]);
+  });
+
+  it("ignores change-feed events until the index is loaded", () => {
+    applyOutageChange({ id: "1", type: "outage.created", outage_id: "c" });
+
+    expect(mockGet).not.toHaveBeenCalled();
+  });
+
+  it("drops every requested outage but the failed ones when a batch resolve returns no results", async () => {
+    servePages(outage("a", ["router-01"]), outage("b", ["router-02"]));
+    await loadOpenOutageNodeIndex();
+    mockPost.mockResolvedValue({
+      data: { success_count: 1, failure_count: 1, errors: [{ id: "b", error: "locked" }] },
+    });
+
+    await batchResolveOutages(["a", "b"]);
+
+    expect(openOutageNodeIndex.openOutagesForNode("router-01")).toEqual([]);
+    expect(openOutageNodeIndex.openOutagesForNode("router-02")).toEqual(["b"]);
+  });
+});
@@ -0,0 +1,50 @@
+// @vitest-environment node
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+import { batchResolveOutages } from "@/services/outages";
+
+const mockPost = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { post: (...a: unknown[]) => mockPost(...a) },
+}));
+
+describe("bulk outage resolve", () => {
+  beforeEach(() => {
+    mockPost.mockReset();
+    mockPost.mockResolvedValue({
+      data: {
+        success_count: 2,
+        failure_count: 0,
+        payment_job: { job_id: "job-1", status: "queued", idempotency_key: "k", outage_ids: ["a", "b"] },
+      },
+    });
+  });
+
+  it("sends a deduplicated outage set in one request", async () => {
+    await batchResolveOutages(["b", "a", "b"], { mttr_minutes: 30 });
+
+    expect(mockPost).toHaveBeenCalledTimes(1);
+    expect(mockPost.mock.calls[0][1]).toEqual({ ids: ["a", "b"], generate_payments: false, mttr_minutes: 30 });
+  });
+
+  it("generates payments only when asked", async () => {
+    const response = await batchResolveOutages(["a", "b"], { generate_payments: true });
+
+    expect(mockPost.mock.calls[0][1]).toEqual({ ids: ["a", "b"], generate_payments: true });
+    expect(response.payment_job?.job_id).toBe("job-1");
+  });
+
+  it("reuses the idempotency key only for retries of the same action", async () => {
+    await batchResolveOutages(["a", "b"], { mttr_minutes: 30 }, "action-1");
+    await batchResolveOutages(["b", "a"], { mttr_minutes: 30 }, "action-1");
+    await batchResolveOutages(["a", "b"], { mttr_minutes: 45 }, "action-1");
+    await batchResolveOutages(["a", "b"], { mttr_minutes: 30 }, "action-2");
+    await batchResolveOutages(["a", "b"], { mttr_minutes: 30 });
+
+    const keys = mockPost.mock.calls.map((call) => call[2].headers["Idempotency-Key"]);
+    expect(keys[0]).toMatch(/^bulk-resolve:[0-9a-f]{64}$/);
+    expect(keys[1]).toBe(keys[0]);
+    expect(new Set(keys).size).toBe(4);
+  });
+});
@@ -31,7 +31,9 @@ const mockUseOutagesTableState = vi.fn();
 const mockUseOutages = vi.fn();
 const mockGetOutage = vi.fn();
 const mockResolveOutage = vi.fn();
+const mockGenerateOutagePayment = vi.fn();
 const mockPreviewSLA = vi.fn();
+const mockWaitForPaymentJob = vi.fn();
 
 vi.mock("@/hooks/useOutagesTableState", () => ({
   useOutagesTableState: () => mockUseOutagesTableState(),
@@ -44,12 +46,17 @@ vi.mock("@/features/outages/hooks/useOutages", () => ({
 vi.mock("@/services/outages", () => ({
   getOutage: (...args: unknown[]) => mockGetOutage(...args),
   resolveOutage: (...args: unknown[]) => mockResolveOutage(...args),
+  generateOutagePayment: (...args: unknown[]) => mockGenerateOutagePayment(...args),
 }));
 
 vi.mock("@/services/sla", () => ({
   previewSLA: (...args: unknown[]) => mockPreviewSLA(...args),
 }));
 
+vi.mock("@/services/paymentService", () => ({
+  waitForPaymentJob: (...args: unknown[]) => mockWaitForPaymentJob(...args),
+}));
+
 const baseOutage = {
   id: "outage-1",
   site_name: "Lagos Core POP",
@@ -63,11 +70,15 @@ const baseOutage = {
 
 describe("outages frontend flow", () => {
   beforeEach(() => {
+    // The detail page reads the outage through react-query; start each test from an empty cache
+    testQueryClient.clear();
     mockUseOutagesTableState.mockReset();
     mockUseOutages.mockReset();
     mockGetOutage.mockReset();
     mockResolveOutage.mockReset();
+    mockGenerateOutagePayment.mockReset();
     mockPreviewSLA.mockReset();
+    mockWaitForPaymentJob.mockReset();
     mockPreviewSLA.mockResolvedValue({
       status: "met",
       rating: "excellent",
@@ -180,4 +191,75 @@ describe("outages frontend flow", () => {
     expect(await screen.findByText("pending")).toBeInTheDocument();
     expect(screen.getByText(/150 USDC/)).toBeInTheDocument();
   });
+
+  it("stops polling a queued payment job when the page unmounts", async () => {
+    mockGetOutage.mockResolvedValue(baseOutage);
+    mockResolveOutage.mockResolvedValue({
+      outage: { ...baseOutage, status: "resolved", resolved_at: "2026-03-27T09:00:00.000Z" },
+      sla: {
+        status: "met",
+        mttr_minutes: 42,
+        threshold_minutes: 60,
+        amount: 150,
+        payment_type: "reward",
+        rating: "excellent",
+      },
+      payment: null,
+      payment_job: { job_id: "job-1", status: "queued" },
+    });
+    mockWaitForPaymentJob.mockReturnValue(new Promise(() => undefined));
+
+    const { unmount } = render(
+      <QueryClientProvider client={testQueryClient}>
+        <ToastProvider>
+          <OutageDetailsPage />
+        </ToastProvider>
+      </QueryClientProvider>,
+    );
+
+    await screen.findByRole("heading", { name: "Outage outage-1" });
+    fireEvent.click(screen.getByRole("button", { name: "Resolve Outage" }));
+    fireEvent.change(screen.getByLabelText("Mean time to resolve (minutes)"), { target: { value: "42" } });
+    await act(async () => {
+      fireEvent.click(screen.getByRole("button", { name: "Review resolution" }));
+    });
+    await act(async () => {
+      fireEvent.click(screen.getByRole("button", { name: "Confirm resolution" }));
+    });
+
+    await waitFor(() => expect(mockWaitForPaymentJob).toHaveBeenCalledWith("job-1", expect.anything()));
+    const { signal } = mockWaitForPaymentJob.mock.calls[0][1] as { signal: AbortSignal };
+    expect(signal.aborted).toBe(false);
+
+    unmount();
+    expect(signal.aborted).toBe(true);
+  });
+
+  it("generates the payment for a resolved outage on request", async () => {
+    mockGetOutage.mockResolvedValue({ ...baseOutage, status: "resolved", resolved_at: "2026-03-27T09:00:00.000Z" });
+    mockGenerateOutagePayment.mockResolvedValue({
+      id: "pay-2",
+      transaction_hash: "tx-002",
+      type: "reward",
+      amount: 75,
+      asset_code: "USDC",
+      status: "confirmed",
+    });
+
+    render(
+      <QueryClientProvider client={testQueryClient}>
+        <ToastProvider>
+          <OutageDetailsPage />
+        </ToastProvider>
+      </QueryClientProvider>,
+    );
+
+    await act(async () => {
+      fireEvent.click(await screen.findByRole("button", { name: "Generate payment" }));
+    });
+
+    expect(mockGenerateOutagePayment).toHaveBeenCalledWith("outage-1");
+    expect(await screen.findByText("tx-002")).toBeInTheDocument();
+    expect(screen.queryByRole("button", { name: "Generate payment" })).not.toBeInTheDocument();
+  });
 });
@@ -0,0 +1,49 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+import { getOutagesPage, iterateOutagePages } from "@/services/outages";
+
+const mockGet = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { get: (...a: unknown[]) => mockGet(...a) },
+}));
+
+function outage(id: string) {
+  return { id, severity: "high", status: "open", detected_at: "2026-10-01T00:00:00Z" };
+}
+
+describe("keyset outage pagination", () => {
+  beforeEach(() => {
+    mockGet.mockReset();
+  });
+
+  it("omits the cursor on the first page and forwards filters", async () => {
+    mockGet.mockResolvedValueOnce({ data: { items: [outage("a")], next_cursor: null } });
+
+    await getOutagesPage({ status: "open", severity: "critical", limit: 50 });
+
+    expect(mockGet).toHaveBeenCalledWith("/outages/cursor", expect.objectContaining({
+      params: { status: "open", severity: "critical", limit: 50 },
+    }));
+  });
+
+  it("follows next_cursor until the last page", async () => {
+    mockGet
+      .mockResolvedValueOnce({ data: { items: [outage("a"), outage("b")], next_cursor: "c1" } })
+      .mockResolvedValueOnce({ data: { items: [outage("c")], next_cursor: null } });
+
+    const ids: string[] = [];
+    for await (const page of iterateOutagePages({ status: "open" })) {
+      ids.push(...page.map((item) => item.id));
+    }
+
+    expect(ids).toEqual(["a", "b", "c"]);
+    expect(mockGet.mock.calls[1][1].params).toEqual({ status: "open", limit: 500, cursor: "c1" });
+  });
+
+  it("surfaces API errors with the server message", async () => {
+    mockGet.mockRejectedValueOnce({ isAxiosError: true, message: "boom", response: { data: { message: "Invalid cursor" } } });
+
+    await expect(getOutagesPage({ cursor: "stale" })).rejects.toThrow("Invalid cursor");
+  });
+});
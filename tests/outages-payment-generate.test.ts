@@ -0,0 +1,39 @@
+// @vitest-environment node
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+import { generateOutagePayment } from "@/services/outages";
+
+const mockPost = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { post: (...a: unknown[]) => mockPost(...a) },
+}));
+
+const payment = { id: "pay-1", transaction_hash: "abc", type: "reward", amount: 150, asset_code: "USDC", status: "pending" };
+
+describe("outage payment generation", () => {
+  beforeEach(() => {
+    mockPost.mockReset();
+  });
+
+  it("sends concurrent requests for one outage as a single keyed request", async () => {
+    mockPost.mockResolvedValue({ data: payment });
+
+    const results = await Promise.all([generateOutagePayment("outage-1"), generateOutagePayment("outage-1")]);
+
+    expect(results).toEqual([payment, payment]);
+    expect(mockPost).toHaveBeenCalledTimes(1);
+    expect(mockPost.mock.calls[0][0]).toBe("/outages/outage-1/payment/generate");
+    expect(mockPost.mock.calls[0][2].headers["Idempotency-Key"]).toMatch(/^payment-generate:[0-9a-f]{64}$/);
+  });
+
+  it("retries a failed request with the same key", async () => {
+    mockPost.mockRejectedValueOnce(new Error("timeout")).mockResolvedValue({ data: payment });
+
+    await expect(generateOutagePayment("outage-2")).rejects.toThrow("timeout");
+    await expect(generateOutagePayment("outage-2")).resolves.toEqual(payment);
+
+    const [first, second] = mockPost.mock.calls.map((call) => call[2].headers["Idempotency-Key"]);
+    expect(second).toBe(first);
+  });
+});
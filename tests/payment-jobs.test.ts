@@ -0,0 +1,54 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+
+import { waitForPaymentJob } from "@/services/paymentService";
+
+const mockGet = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { get: (...a: unknown[]) => mockGet(...a) },
+}));
+
+function job(status: string) {
+  return { data: { job_id: "job-1", status, idempotency_key: "k", outage_ids: ["a"] } };
+}
+
+describe("waitForPaymentJob", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.spyOn(Math, "random").mockReturnValue(1);
+    mockGet.mockReset();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.restoreAllMocks();
+  });
+
+  it("polls with doubling intervals until the job finishes", async () => {
+    mockGet
+      .mockResolvedValueOnce(job("queued"))
+      .mockResolvedValueOnce(job("running"))
+      .mockResolvedValueOnce(job("succeeded"));
+
+    const pending = waitForPaymentJob("job-1", { initialDelayMs: 100 });
+
+    await vi.advanceTimersByTimeAsync(99);
+    expect(mockGet).toHaveBeenCalledTimes(1);
+    await vi.advanceTimersByTimeAsync(1);
+    expect(mockGet).toHaveBeenCalledTimes(2);
+    await vi.advanceTimersByTimeAsync(200);
+
+    await expect(pending).resolves.toMatchObject({ status: "succeeded" });
+    expect(mockGet).toHaveBeenCalledWith("/payments/jobs/job-1", expect.anything());
+  });
+
+  it("gives up after the timeout", async () => {
+    mockGet.mockResolvedValue(job("running"));
+
+    const pending = waitForPaymentJob("job-1", { initialDelayMs: 100, timeoutMs: 250 });
+    const assertion = expect(pending).rejects.toThrow("did not finish");
+    await vi.advanceTimersByTimeAsync(1000);
+
+    await assertion;
+  });
+});
@@ -0,0 +1,59 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+const mockGet = vi.fn();
+
+vi.mock("@/lib/api", () => ({
+  api: { get: (...a: unknown[]) => mockGet(...a) },
+}));
+
+const CONFIG = {
+  critical: { threshold_minutes: 15, penalty_per_minute: 100, reward_base: 750 },
+  high: { threshold_minutes: 30, penalty_per_minute: 50, reward_base: 750 },
+};
+
+async function loadService() {
+  vi.resetModules();
+  return import("@/services/sla");
+}
+
+describe("SLA config cache", () => {
+  beforeEach(() => {
+    mockGet.mockReset();
+  });
+
+  it("loads the per-severity table from /sla/config", async () => {
+    const sla = await loadService();
+    mockGet.mockResolvedValue({ status: 200, data: CONFIG, headers: { etag: '"v3"' } });
+
+    const thresholds = await sla.getSLAConfig();
+
+    expect(mockGet.mock.calls[0][0]).toBe("/sla/config");
+    expect(thresholds).toEqual([
+      { severity: "critical", threshold_minutes: 15, penalty_per_minute: 100, reward_base: 750 },
+      { severity: "high", threshold_minutes: 30, penalty_per_minute: 50, reward_base: 750 },
+    ]);
+  });
+
+  it("revalidates with If-None-Match and keeps the table on 304", async () => {
+    const sla = await loadService();
+    mockGet
+      .mockResolvedValueOnce({ status: 200, data: CONFIG, headers: { etag: '"v3"' } })
+      .mockResolvedValueOnce({ status: 304, data: "", headers: {} });
+
+    const first = await sla.getSLAConfig();
+    const second = await sla.getSLAConfig();
+
+    expect(second).toBe(first);
+    expect(mockGet).toHaveBeenCalledTimes(2);
+    expect(mockGet.mock.calls[1][1].headers).toEqual({ "If-None-Match": '"v3"' });
+  });
+
+  it("shares one request between concurrent reads", async () => {
+    const sla = await loadService();
+    mockGet.mockResolvedValue({ status: 200, data: CONFIG, headers: {} });
+
+    await Promise.all([sla.getSLAConfig(), sla.getSLAConfig()]);
+
+    expect(mockGet).toHaveBeenCalledTimes(1);
+  });
+});
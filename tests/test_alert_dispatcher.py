@@ -0,0 +1,107 @@
+"""
+Tests for the reconciliation alert pipeline against a local stand-in webhook receiver.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from app.repositories.utils.alert_dispatcher import AlertDispatcher, TokenBucket
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def receiver():
+    """Run a throwaway webhook endpoint that records every JSON body it receives."""
+    received = []
+    state = {"delay": 0.0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            time.sleep(state["delay"])
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append(json.loads(body))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/alerts", received, state
+    server.shutdown()
+
+
+def _mismatch(scope, window_start="2026-10-17T10:00:00", window_end="2026-10-17T11:00:00"):
+    return {
+        "status_scope": scope,
+        "window_start": window_start,
+        "window_end": window_end,
+        "expected": {"count": 10, "total_minor": 1000},
+        "actual": {"count": 9, "total_minor": 900},
+        "drift": {"count_diff": 1, "amount_diff_minor": 100},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Dispatch behaviour
+# ---------------------------------------------------------------------------
+
+class TestAlertDispatcher:
+    def test_mismatches_coalesced_by_scope_and_window(self, receiver):
+        url, received, _ = receiver
+        dispatcher = AlertDispatcher(url, coalesce_interval=0.2, rate_per_second=100, burst=10).start()
+        dispatcher.submit([_mismatch("FAILED"), _mismatch("SUCCESS")])
+        dispatcher.submit([_mismatch("FAILED")])
+        dispatcher.stop(timeout=5)
+
+        by_scope = {alert["status_scope"]: alert for alert in received}
+        assert set(by_scope) == {"FAILED", "SUCCESS"}
+        assert by_scope["FAILED"]["mismatch_count"] == 2
+        assert by_scope["FAILED"]["amount_diff_minor_total"] == 200
+
+    def test_payload_capped_with_truncation_count(self, receiver):
+        url, received, _ = receiver
+        dispatcher = AlertDispatcher(url, coalesce_interval=0.05, max_payload_bytes=2048, rate_per_second=100).start()
+        dispatcher.submit([_mismatch("FAILED") for _ in range(200)])
+        dispatcher.stop(timeout=5)
+
+        assert len(received) == 1
+        alert = received[0]
+        assert alert["mismatch_count"] == 200
+        assert alert["samples_truncated"] == 200 - len(alert["samples"])
+        assert len(json.dumps(alert)) <= 2048
+
+    def test_submit_does_not_wait_on_slow_sink(self, receiver):
+        url, _, state = receiver
+        state["delay"] = 0.5
+        dispatcher = AlertDispatcher(url, max_queue=2, coalesce_interval=0.0, rate_per_second=100).start()
+
+        started = time.monotonic()
+        accepted = [dispatcher.submit([_mismatch(f"scope-{index}")]) for index in range(20)]
+        assert time.monotonic() - started < 0.1
+        assert not all(accepted)
+        assert dispatcher.dropped_batches == accepted.count(False)
+        dispatcher.stop(timeout=0)
+
+    def test_unreachable_sink_counted_as_failure(self):
+        dispatcher = AlertDispatcher("http://127.0.0.1:9/alerts", coalesce_interval=0.0, request_timeout=0.5).start()
+        dispatcher.submit([_mismatch("FAILED")])
+        dispatcher.stop(timeout=5)
+        assert dispatcher.failed_alerts == 1
+
+
+class TestTokenBucket:
+    def test_burst_then_throttle(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        assert all(bucket.acquire(timeout=0) for _ in range(3))
+        assert not bucket.acquire(timeout=0)
+        assert bucket.acquire(timeout=0.5)
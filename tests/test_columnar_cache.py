@@ -0,0 +1,85 @@
+"""
+Tests for the per-window Arrow cache behind AnalyticsExporter's columnar export.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from app.repositories.utils.analytics_exporter import AnalyticsExporter
+from app.repositories.utils.columnar_cache import ColumnarWindowCache, columns_from_table, rows_to_record_batches
+from app.repositories.utils.vectorized_diff import to_columns
+
+
+KEY_FIELDS = ("bucket", "status", "customer_id")
+CLOSED_START = datetime(2026, 10, 1, 10, 0)
+CLOSED_END = datetime(2026, 10, 1, 11, 0)
+
+
+class CountingExporter(AnalyticsExporter):
+    def __init__(self, cache_dir):
+        super().__init__(cache_dir=cache_dir)
+        self.queries = 0
+
+    def iter_aggregated_analytics_summary(self, start_time, end_time, page_size=5000):
+        self.queries += 1
+        yield from super().iter_aggregated_analytics_summary(start_time, end_time, page_size)
+
+
+class TestColumnarWindowCache:
+    def test_table_matches_row_columns(self):
+        rows = [
+            {"bucket": CLOSED_START, "status": "FAILED", "customer_id": "cust-1", "count": 3, "total_minor": 30},
+            {"bucket": CLOSED_START, "status": "SUCCESS", "customer_id": None, "count": 5, "total_minor": 50},
+        ]
+        table = pa.Table.from_batches(list(rows_to_record_batches(rows, batch_size=1)))
+        columns = columns_from_table(table, KEY_FIELDS)
+        expected = to_columns(rows, KEY_FIELDS)
+
+        for field in ("status", "customer_id", "count", "total_minor"):
+            assert columns[field].tolist() == expected[field].tolist()
+
+    def test_closed_window_served_from_disk_after_first_read(self, tmp_path):
+        exporter = CountingExporter(str(tmp_path))
+        first = exporter.get_summary_table(CLOSED_START, CLOSED_END)
+        queried = exporter.queries
+        second = exporter.get_summary_table(CLOSED_START, CLOSED_END)
+
+        assert queried == 12
+        assert exporter.queries == queried
+        assert second.equals(first)
+        assert second.column("total_minor").to_pylist() == [row["total_minor"] for row in exporter.iter_aggregated_analytics_summary(CLOSED_START, CLOSED_END)]
+
+    def test_sliding_window_reuses_aligned_blocks(self, tmp_path):
+        exporter = CountingExporter(str(tmp_path))
+        exporter.get_summary_table(CLOSED_START, CLOSED_END)
+        files = len(list(tmp_path.iterdir()))
+        exporter.queries = 0
+
+        start, end = CLOSED_START + timedelta(minutes=2, seconds=30), CLOSED_END + timedelta(minutes=2, seconds=30)
+        table = exporter.get_summary_table(start, end)
+
+        # Only the unaligned head and tail are queried, and neither is written to the cache
+        assert exporter.queries == 2
+        assert len(list(tmp_path.iterdir())) == files
+        assert table.column("total_minor").to_pylist() == [row["total_minor"] for row in exporter.iter_aggregated_analytics_summary(start, end)]
+
+    def test_open_blocks_never_cached(self, tmp_path):
+        exporter = CountingExporter(str(tmp_path))
+        end = datetime.utcnow()
+        exporter.get_summary_table(end - timedelta(minutes=8), end)
+        queried = exporter.queries
+        exporter.get_summary_table(end - timedelta(minutes=8), end)
+
+        assert exporter.queries == 2 * queried
+        assert list(tmp_path.iterdir()) == []
+
+    def test_prune_drops_windows_past_retention(self, tmp_path):
+        cache = ColumnarWindowCache(str(tmp_path), retention=timedelta(days=1))
+        cache.put(CLOSED_START, CLOSED_END, iter([]))
+        cache.put(CLOSED_START + timedelta(days=2), CLOSED_END + timedelta(days=2), iter([]))
+
+        assert cache.get(CLOSED_START, CLOSED_END) is None
+        assert cache.get(CLOSED_START + timedelta(days=2), CLOSED_END + timedelta(days=2)) is not None
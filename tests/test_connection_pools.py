@@ -0,0 +1,98 @@
+"""
+Tests for the shared connection and client pools used by scheduled reconciliation runs.
+"""
+
+import threading
+
+import pytest
+
+from app.repositories.utils import pools
+from app.repositories.utils.instrumentation import REGISTRY
+from app.repositories.utils.pools import ClientPool, PoolTimeoutError, build_engine
+
+
+class FakeClient:
+    def __init__(self):
+        self.healthy = True
+        self.closed = False
+
+
+class TestClientPool:
+    def test_clients_reused_across_checkouts(self):
+        pool = ClientPool(FakeClient, max_size=2)
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+        assert second is first
+        assert pool.created == 1
+
+    def test_unhealthy_client_replaced_on_checkout(self):
+        pool = ClientPool(FakeClient, max_size=1, health_check=lambda client: client.healthy, close=lambda client: setattr(client, "closed", True))
+        with pool.acquire() as first:
+            first.healthy = False
+        with pool.acquire() as second:
+            pass
+        assert second is not first
+        assert first.closed
+
+    def test_failed_caller_discards_client(self):
+        pool = ClientPool(FakeClient, max_size=1)
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                raise RuntimeError("query failed")
+        assert pool.stats()["in_use"] == 0
+        assert pool.stats()["idle"] == 0
+
+    def test_exhausted_pool_times_out_and_counts_wait(self):
+        pool = ClientPool(FakeClient, max_size=1, checkout_timeout=0.05)
+        held, release = threading.Event(), threading.Event()
+
+        def hold():
+            with pool.acquire():
+                held.set()
+                release.wait(1)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        assert held.wait(1)
+        with pytest.raises(PoolTimeoutError):
+            with pool.acquire():
+                pass
+        release.set()
+        holder.join()
+
+        stats = pool.stats()
+        assert stats["waits"] == 1
+        assert stats["in_use"] == 0
+
+
+class TestEngine:
+    def test_pooled_engine_exposes_saturation(self, monkeypatch, tmp_path):
+        engine = build_engine(f"sqlite:///{tmp_path / 'payments.db'}", pool_size=2, max_overflow=0)
+        monkeypatch.setattr(pools, "_engine", engine)
+        monkeypatch.setattr(pools, "DB_POOL_SIZE", 2)
+        monkeypatch.setattr(pools, "DB_MAX_OVERFLOW", 0)
+
+        with engine.connect():
+            rendered = REGISTRY.render()
+
+        assert 'reconciliation_pool_in_use{backend="transactional"} 1' in rendered
+        assert 'reconciliation_pool_saturation{backend="transactional"} 0.5' in rendered
+
+    def test_connect_count_is_exact_under_concurrent_connects(self, monkeypatch):
+        monkeypatch.setattr(pools, "_db_connects", 0)
+        barrier = threading.Barrier(8)
+
+        def connect():
+            barrier.wait()
+            for _ in range(250):
+                pools._count_connect(None, None)
+
+        threads = [threading.Thread(target=connect) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pools._db_connects == 2000
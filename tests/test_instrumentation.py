@@ -0,0 +1,53 @@
+"""
+Tests for the reconciliation instrumentation registry and profiler hook.
+"""
+
+import os
+
+from app.repositories.utils import instrumentation
+from app.repositories.utils.instrumentation import MetricsRegistry, TimedRows, profiled, request_profile
+
+
+class TestMetricsRegistry:
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("job_seconds", "Job latency.", ("source",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, source="analytics")
+        histogram.observe(0.5, source="analytics")
+        histogram.observe(5.0, source="analytics")
+
+        lines = registry.render().splitlines()
+        assert "# TYPE job_seconds histogram" in lines
+        assert 'job_seconds_bucket{source="analytics",le="0.1"} 1' in lines
+        assert 'job_seconds_bucket{source="analytics",le="1.0"} 2' in lines
+        assert 'job_seconds_bucket{source="analytics",le="+Inf"} 3' in lines
+        assert 'job_seconds_count{source="analytics"} 3' in lines
+
+    def test_counter_label_values_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("rows_total", "Rows.", ("source",)).inc(3, source='odd"name')
+        assert 'rows_total{source="odd\\"name"} 3' in registry.render()
+
+    def test_timed_rows_records_on_exhaustion(self):
+        before = dict(instrumentation.SOURCE_ROWS.values)
+        rows = TimedRows(iter([{"count": 1}, {"count": 2}]), "test-source")
+        assert [row["count"] for row in rows] == [1, 2]
+        assert instrumentation.SOURCE_ROWS.values[("test-source",)] - before.get(("test-source",), 0) == 2
+
+
+class TestProfiledHook:
+    def test_disabled_hook_passes_through(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(instrumentation, "PROFILE_DIR", str(tmp_path))
+        assert profiled("noop-job")(lambda value: value * 2)(21) == 42
+        assert os.listdir(tmp_path) == []
+
+    def test_requested_profile_covers_exactly_one_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(instrumentation, "PROFILE_DIR", str(tmp_path))
+        job = profiled("one-shot-job")(lambda: sum(range(1000)))
+
+        request_profile("one-shot-job")
+        assert job() == 499500
+        job()
+
+        profiles = os.listdir(tmp_path)
+        assert len(profiles) == 1 and profiles[0].endswith(".prof")
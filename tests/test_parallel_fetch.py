@@ -0,0 +1,84 @@
+"""
+Tests for concurrent, optionally sharded summary fetching across reconciliation sources.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.repositories.utils.parallel_fetch import (
+    SourceTimeoutError,
+    fetch_summaries_concurrently,
+    split_window,
+)
+
+
+START = datetime(2026, 10, 1, 12, 0)
+END = START + timedelta(hours=1)
+
+
+def _per_minute(start_time, end_time):
+    minutes = int((end_time - start_time) / timedelta(minutes=1))
+    return [{"status": "SUCCESS", "count": minutes, "total_minor": minutes * 100}]
+
+
+class TestSplitWindow:
+    def test_sub_windows_are_contiguous_and_cover_the_window(self):
+        windows = split_window(START, END, 4)
+        assert windows[0][0] == START and windows[-1][1] == END
+        assert all(left[1] == right[0] for left, right in zip(windows, windows[1:]))
+
+    def test_rejects_non_positive_shards(self):
+        with pytest.raises(ValueError):
+            split_window(START, END, 0)
+
+
+class TestFetchSummariesConcurrently:
+    def test_sharded_results_merge_to_the_unsharded_totals(self):
+        results = fetch_summaries_concurrently({"tx": _per_minute, "an": _per_minute}, START, END, shards=6, max_workers=3)
+        assert results == {
+            "tx": [{"status": "SUCCESS", "count": 60, "total_minor": 6000}],
+            "an": [{"status": "SUCCESS", "count": 60, "total_minor": 6000}],
+        }
+
+    def test_concurrency_is_capped_by_max_workers(self):
+        lock, running, peak = threading.Lock(), [0], [0]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(start_time, end_time):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            barrier.wait()
+            with lock:
+                running[0] -= 1
+            return _per_minute(start_time, end_time)
+
+        fetch_summaries_concurrently({"tx": fetch, "an": fetch}, START, END, shards=4, max_workers=2)
+        assert peak[0] == 2
+
+    def test_source_failure_is_raised(self):
+        def failing(start_time, end_time):
+            raise RuntimeError("analytics store unavailable")
+
+        with pytest.raises(RuntimeError, match="analytics store unavailable"):
+            fetch_summaries_concurrently({"tx": _per_minute, "an": failing}, START, END)
+
+    def test_timeout_names_the_source_and_cancels_queued_fetches(self):
+        release = threading.Event()
+        started = []
+
+        def slow(start_time, end_time):
+            started.append(start_time)
+            release.wait(5)
+            return _per_minute(start_time, end_time)
+
+        try:
+            with pytest.raises(SourceTimeoutError) as excinfo:
+                fetch_summaries_concurrently({"tx": slow}, START, END, shards=4, timeouts={"tx": 0.05}, max_workers=1)
+        finally:
+            release.set()
+
+        assert excinfo.value.source == "tx"
+        assert started == [START]
@@ -0,0 +1,89 @@
+"""
+Tests for the bucketed payment summary queries read by the reconciliation engine.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.repositories.payment_repository import _BUCKETED_SUMMARY_SQL, _STATUS_SUMMARY_SQL, PaymentRepository, _summary_statement
+from app.repositories.payment_rollup_repository import _BUCKETED_ROLLUP_SQL
+
+
+START = datetime(2026, 10, 1, 12, 0)
+
+
+def _order_by(statement) -> str:
+    return str(statement).strip().splitlines()[-1].strip()
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE payments (id INTEGER PRIMARY KEY, customer_id TEXT, status TEXT NOT NULL, "
+                "amount NUMERIC NOT NULL, updated_at TIMESTAMP NOT NULL)"
+            )
+        )
+    with Session(engine) as db:
+        yield db
+
+
+def insert_payment(db, status, customer_id, amount, updated_at):
+    db.execute(
+        text("INSERT INTO payments (customer_id, status, amount, updated_at) VALUES (:customer_id, :status, :amount, :updated_at)"),
+        {"customer_id": customer_id, "status": status, "amount": amount, "updated_at": updated_at},
+    )
+
+
+class TestSummaryStatements:
+    def test_postgresql_summary_orders_by_collated_expressions(self):
+        order_by = _order_by(_summary_statement("postgresql", _BUCKETED_SUMMARY_SQL, "updated_at"))
+        assert order_by == 'ORDER BY 1, status COLLATE "C", COALESCE(customer_id, \'\') COLLATE "C"'
+
+    def test_postgresql_rollup_orders_by_collated_expressions(self):
+        order_by = _order_by(_summary_statement("postgresql", _BUCKETED_ROLLUP_SQL, "bucket"))
+        assert order_by == 'ORDER BY 1, status COLLATE "C", customer_id COLLATE "C"'
+
+    @pytest.mark.parametrize("template", [_BUCKETED_SUMMARY_SQL, _BUCKETED_ROLLUP_SQL])
+    def test_no_collated_ordinals(self, template):
+        rendered = str(_summary_statement("postgresql", template, "updated_at"))
+        assert "2 COLLATE" not in rendered
+        assert "3 COLLATE" not in rendered
+
+    @pytest.mark.parametrize("template", [_STATUS_SUMMARY_SQL, _BUCKETED_SUMMARY_SQL])
+    def test_postgresql_sums_minor_units_as_numeric(self, template):
+        rendered = str(_summary_statement("postgresql", template, "updated_at"))
+        assert "SUM(ROUND(amount * 10000000))" in rendered
+        assert "BIGINT" not in rendered
+
+    def test_unsupported_dialect_rejected(self):
+        with pytest.raises(NotImplementedError):
+            _summary_statement("mysql", _BUCKETED_SUMMARY_SQL, "updated_at")
+
+
+class TestPaymentRepository:
+    def test_stream_ordered_by_reconciliation_key(self, session):
+        insert_payment(session, "SUCCESS", "cust-b", 1.5, START + timedelta(seconds=10))
+        insert_payment(session, "FAILED", None, 2, START + timedelta(seconds=20))
+        insert_payment(session, "SUCCESS", "cust-a", 3, START + timedelta(minutes=1, seconds=5))
+        insert_payment(session, "SUCCESS", "cust-a", 4, START + timedelta(seconds=30))
+
+        rows = list(PaymentRepository(session).iter_transactional_summary(START, START + timedelta(minutes=2)))
+
+        keys = [(row["bucket"], row["status"], row["customer_id"]) for row in rows]
+        assert keys == sorted(keys)
+        assert keys[0] == (START, "FAILED", "")
+        assert rows[1] == {"bucket": START, "status": "SUCCESS", "customer_id": "cust-a", "count": 1, "total_minor": 40000000}
+
+    def test_status_summary_totals_are_integer_minor_units(self, session):
+        insert_payment(session, "SUCCESS", None, "1.25", START)
+        insert_payment(session, "SUCCESS", None, "2.5", START + timedelta(seconds=30))
+
+        assert PaymentRepository(session).get_transactional_summary(START, START + timedelta(minutes=1)) == [
+            {"status": "SUCCESS", "count": 2, "total_minor": 37500000},
+        ]
@@ -0,0 +1,156 @@
+"""
+Tests for the write-maintained per-minute payment rollups and their transactional outbox.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.repositories.payment_repository import PaymentRepository
+from app.repositories.payment_rollup_repository import PaymentRollupRepository
+
+
+START = datetime(2026, 10, 1, 12, 0)
+END = START + timedelta(minutes=10)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE payments (id INTEGER PRIMARY KEY, customer_id TEXT, status TEXT NOT NULL, "
+                "amount NUMERIC NOT NULL, updated_at TIMESTAMP NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE payment_rollup_outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, bucket TIMESTAMP NOT NULL, "
+                "status TEXT NOT NULL, customer_id TEXT NOT NULL DEFAULT '', count_delta BIGINT NOT NULL, "
+                "total_minor_delta NUMERIC(38, 0) NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE payment_rollups_minute (bucket TIMESTAMP NOT NULL, status TEXT NOT NULL, "
+                "customer_id TEXT NOT NULL DEFAULT '', count BIGINT NOT NULL, total_minor NUMERIC(38, 0) NOT NULL, "
+                "PRIMARY KEY (bucket, status, customer_id))"
+            )
+        )
+    with Session(engine) as db:
+        yield db
+
+
+class Payments:
+    """
+    Writes payments and their rollup deltas in the same transaction, the way the payment service does.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.rollups = PaymentRollupRepository(db)
+
+    def insert(self, status, amount, updated_at, customer_id=None):
+        payment = {"status": status, "amount": amount, "updated_at": updated_at, "customer_id": customer_id}
+        payment["id"] = self.db.execute(
+            text("INSERT INTO payments (customer_id, status, amount, updated_at) VALUES (:customer_id, :status, :amount, :updated_at)"),
+            payment,
+        ).lastrowid
+        self.rollups.record_payment_change(None, payment)
+        return payment
+
+    def update(self, payment, **changes):
+        after = dict(payment, **changes)
+        self.db.execute(
+            text("UPDATE payments SET customer_id = :customer_id, status = :status, amount = :amount, updated_at = :updated_at WHERE id = :id"),
+            after,
+        )
+        self.rollups.record_payment_change(payment, after)
+        return after
+
+    def delete(self, payment):
+        self.db.execute(text("DELETE FROM payments WHERE id = :id"), payment)
+        self.rollups.record_payment_change(payment, None)
+
+
+def outbox(db):
+    return [tuple(row) for row in db.execute(text("SELECT status, customer_id, count_delta, total_minor_delta FROM payment_rollup_outbox ORDER BY id"))]
+
+
+class TestRecordPaymentChange:
+    def test_update_within_one_key_nets_to_an_amount_delta(self, session):
+        payments = Payments(session)
+        payment = payments.insert("SUCCESS", "10.00", START + timedelta(seconds=5))
+        payments.update(payment, amount="12.50", updated_at=START + timedelta(seconds=40))
+
+        assert outbox(session) == [("SUCCESS", "", 1, 100000000), ("SUCCESS", "", 0, 25000000)]
+
+    def test_noop_update_enqueues_nothing(self, session):
+        payments = Payments(session)
+        payment = payments.insert("SUCCESS", "10.00", START)
+        payments.update(payment, updated_at=START + timedelta(seconds=30))
+
+        assert len(outbox(session)) == 1
+
+    def test_status_change_moves_the_payment_between_keys(self, session):
+        payments = Payments(session)
+        payment = payments.insert("PENDING", "10.00", START)
+        payments.update(payment, status="SUCCESS")
+
+        assert outbox(session)[1:] == [("PENDING", "", -1, -100000000), ("SUCCESS", "", 1, 100000000)]
+
+    def test_delete_retracts_the_payment(self, session):
+        payments = Payments(session)
+        payments.delete(payments.insert("FAILED", "3.00", START, customer_id="cust-1"))
+
+        assert outbox(session) == [("FAILED", "cust-1", 1, 30000000), ("FAILED", "cust-1", -1, -30000000)]
+
+
+class TestFlushOutbox:
+    def test_entries_coalesce_into_one_rollup_row_per_key(self, session):
+        payments = Payments(session)
+        for second in range(0, 60, 10):
+            payments.insert("SUCCESS", "1.00", START + timedelta(seconds=second))
+
+        assert PaymentRollupRepository(session).flush_outbox() == 6
+        assert [tuple(row) for row in session.execute(text("SELECT status, customer_id, count, total_minor FROM payment_rollups_minute"))] == [
+            ("SUCCESS", "", 6, 60000000),
+        ]
+
+    def test_drained_entries_are_deleted_by_id_and_the_rest_kept(self, session):
+        payments = Payments(session)
+        for minute in range(3):
+            payments.insert("SUCCESS", "1.00", START + timedelta(minutes=minute))
+        session.execute(text("DELETE FROM payment_rollup_outbox WHERE id = 1"))
+        rollups = PaymentRollupRepository(session)
+
+        assert rollups.flush_outbox(batch_size=1) == 1
+        assert [row[0] for row in session.execute(text("SELECT id FROM payment_rollup_outbox"))] == [3]
+        assert rollups.flush_outbox() == 1
+        assert rollups.flush_outbox() == 0
+
+    def test_rollups_match_a_fresh_group_by_after_mixed_writes(self, session):
+        payments = Payments(session)
+        written = [
+            payments.insert(status, f"{index}.25", START + timedelta(minutes=index % 7, seconds=index), customer_id=customer)
+            for index, (status, customer) in enumerate(
+                [("SUCCESS", None), ("SUCCESS", "cust-1"), ("FAILED", "cust-2"), ("PENDING", "cust-1")] * 5
+            )
+        ]
+        rollups = PaymentRollupRepository(session)
+        rollups.flush_outbox(batch_size=7)
+        payments.update(written[0], status="FAILED")
+        payments.update(written[1], updated_at=START + timedelta(minutes=9, seconds=59))
+        payments.update(written[2], amount="999.9999999", customer_id=None)
+        payments.delete(written[3])
+        payments.delete(written[4])
+        while rollups.flush_outbox(batch_size=7):
+            pass
+
+        summary = list(rollups.iter_transactional_summary(START, END))
+        assert len(summary) > 10
+        assert summary == list(PaymentRepository(session).iter_transactional_summary(START, END))
+        assert rollups.get_bucket_totals(START, END, timedelta(minutes=5)) == PaymentRepository(session).get_bucket_totals(START, END, timedelta(minutes=5))
@@ -0,0 +1,57 @@
+"""
+Tests for the persisted reconciliation watermark and per-bucket fingerprints.
+"""
+
+from datetime import datetime, timedelta
+
+from app.repositories.utils.reconciliation_cursor import ReconciliationCursor, floor_to_bucket, iter_buckets
+
+
+BUCKET = timedelta(minutes=5)
+START = datetime(2026, 10, 1, 12, 0)
+
+
+class TestBuckets:
+    def test_floor_aligns_to_epoch_multiples(self):
+        assert floor_to_bucket(START + timedelta(minutes=7, seconds=12), BUCKET) == START + timedelta(minutes=5)
+
+    def test_iter_buckets_covers_a_partial_first_bucket(self):
+        assert list(iter_buckets(START + timedelta(minutes=3), START + timedelta(minutes=11), BUCKET)) == [
+            START,
+            START + timedelta(minutes=5),
+            START + timedelta(minutes=10),
+        ]
+
+
+class TestReconciliationCursor:
+    def test_checkpoint_survives_reopening(self, tmp_path):
+        path = str(tmp_path / "cursor.db")
+        cursor = ReconciliationCursor(path)
+        assert cursor.get_watermark() is None
+        cursor.checkpoint(START + BUCKET, {START: "1:100|1:100"}, retain_after=START)
+        cursor.close()
+
+        reopened = ReconciliationCursor(path)
+        assert reopened.get_watermark() == START + BUCKET
+        assert reopened.get_fingerprints(START, START + BUCKET) == {START: "1:100|1:100"}
+        reopened.close()
+
+    def test_watermark_advances_and_fingerprints_are_replaced(self, tmp_path):
+        cursor = ReconciliationCursor(str(tmp_path / "cursor.db"))
+        cursor.checkpoint(START + BUCKET, {START: "a"}, retain_after=START)
+        cursor.checkpoint(START + 2 * BUCKET, {START: "b", START + BUCKET: "c"}, retain_after=START)
+
+        assert cursor.get_watermark() == START + 2 * BUCKET
+        assert cursor.get_fingerprints(START, START + 2 * BUCKET) == {START: "b", START + BUCKET: "c"}
+
+    def test_buckets_older_than_the_lookback_are_pruned(self, tmp_path):
+        cursor = ReconciliationCursor(str(tmp_path / "cursor.db"))
+        cursor.checkpoint(START + 2 * BUCKET, {START: "a", START + BUCKET: "b"}, retain_after=START + BUCKET)
+
+        assert cursor.get_fingerprints(START, START + 2 * BUCKET) == {START + BUCKET: "b"}
+
+    def test_jobs_keep_separate_cursors(self, tmp_path):
+        path = str(tmp_path / "cursor.db")
+        ReconciliationCursor(path, job_name="a").checkpoint(START, {}, retain_after=START)
+
+        assert ReconciliationCursor(path, job_name="b").get_watermark() is None
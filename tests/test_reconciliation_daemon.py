@@ -0,0 +1,63 @@
+"""
+Tests for the resident reconciliation daemon's scheduling, overlap protection and timing.
+"""
+
+import pytest
+
+from app.repositories.tasks.reconciliation_daemon import DaemonLockedError, ReconciliationDaemon
+from app.repositories.utils.instrumentation import RECONCILIATION_CYCLES_SKIPPED
+
+
+class TestScheduling:
+    def test_next_tick_follows_the_interval(self):
+        daemon = ReconciliationDaemon(job=lambda: True, interval=60, lock_path=None)
+        assert daemon.next_run_at(tick=1000.0, now=1010.0) == 1060.0
+
+    def test_overrunning_cycle_skips_missed_ticks(self):
+        daemon = ReconciliationDaemon(job=lambda: True, interval=60, lock_path=None)
+        skipped_before = sum(RECONCILIATION_CYCLES_SKIPPED.values.values())
+
+        assert daemon.next_run_at(tick=1000.0, now=1130.0) == 1180.0
+        assert sum(RECONCILIATION_CYCLES_SKIPPED.values.values()) - skipped_before == 2
+
+
+class TestCycles:
+    def test_runs_on_schedule_and_records_cold_start(self):
+        outcomes = iter([True, False])
+        daemon = ReconciliationDaemon(interval=0.01, jitter=0.0, lock_path=None)
+
+        def job():
+            outcome = next(outcomes)
+            if daemon.cycles == 1:
+                daemon.stop()
+            return outcome
+
+        daemon.job = job
+        daemon.run_forever()
+
+        assert daemon.cycles == 2
+        assert set(daemon.cold_start) == {"ready", "first_cycle"}
+
+    def test_failed_cycle_is_contained(self):
+        def job():
+            raise RuntimeError("source unavailable")
+
+        daemon = ReconciliationDaemon(job=job, lock_path=None)
+        assert daemon.run_cycle() is None
+        assert daemon.cycles == 1
+
+
+class TestLocking:
+    def test_second_daemon_cannot_take_the_lock(self, tmp_path):
+        lock_path = str(tmp_path / "daemon.lock")
+        first = ReconciliationDaemon(job=lambda: True, lock_path=lock_path)
+        second = ReconciliationDaemon(job=lambda: True, lock_path=lock_path)
+
+        first.acquire_lock()
+        try:
+            with pytest.raises(DaemonLockedError):
+                second.acquire_lock()
+        finally:
+            first.release_lock()
+        second.acquire_lock()
+        second.release_lock()
@@ -0,0 +1,65 @@
+"""
+Tests for the streaming merge-join diff used by the reconciliation engine.
+"""
+
+import json
+
+import pytest
+
+from app.repositories.utils.merge_diff import EMPTY_AGGREGATE, merge_join_diff, reconciliation_key
+
+
+KEY_FIELDS = ("bucket", "status", "customer_id")
+
+
+def _row(bucket, status, customer_id, count, total_minor):
+    return {"bucket": bucket, "status": status, "customer_id": customer_id, "count": count, "total_minor": total_minor}
+
+
+class TestMergeJoinDiff:
+    def test_aligned_streams_emit_nothing(self):
+        rows = [_row(1, "FAILED", "cust-1", 2, 20), _row(1, "SUCCESS", "cust-1", 5, 50)]
+        assert list(merge_join_diff(iter(rows), iter(rows), KEY_FIELDS)) == []
+
+    def test_count_and_amount_drift_reported(self):
+        tx = [_row(1, "SUCCESS", "cust-1", 5, 50), _row(2, "SUCCESS", "cust-1", 3, 30)]
+        an = [_row(1, "SUCCESS", "cust-1", 4, 40), _row(2, "SUCCESS", "cust-1", 3, 30)]
+        drift = list(merge_join_diff(tx, an, KEY_FIELDS))
+        assert len(drift) == 1
+        key, _, _, count_drift, amount_drift = drift[0]
+        assert key == (1, "SUCCESS", "cust-1")
+        assert count_drift == 1
+        assert amount_drift == 10
+
+    def test_keys_missing_on_either_side_are_flagged(self):
+        tx = [_row(1, "SUCCESS", "cust-1", 5, 50)]
+        an = [_row(1, "SUCCESS", "cust-2", 1, 10)]
+        keys = [item[0] for item in merge_join_diff(tx, an, KEY_FIELDS)]
+        assert keys == [(1, "SUCCESS", "cust-1"), (1, "SUCCESS", "cust-2")]
+
+    def test_missing_side_is_a_fresh_serializable_dict(self):
+        (_, expected, actual, _, _), = merge_join_diff([_row(1, "SUCCESS", "cust-1", 5, 50)], [], KEY_FIELDS)
+        actual["count"] = 99
+
+        assert json.loads(json.dumps(expected))["count"] == 5
+        assert EMPTY_AGGREGATE == {"count": 0, "total_minor": 0}
+        with pytest.raises(TypeError):
+            EMPTY_AGGREGATE["count"] = 1
+
+    def test_single_minor_unit_drift_reported(self):
+        tx = [_row(1, "SUCCESS", "cust-1", 5, 35500000000000)]
+        an = [_row(1, "SUCCESS", "cust-1", 5, 35500000000001)]
+        assert [item[4] for item in merge_join_diff(tx, an, KEY_FIELDS)] == [1]
+
+    def test_amount_within_explicit_tolerance_ignored(self):
+        tx = [_row(1, "SUCCESS", "cust-1", 5, 500)]
+        an = [_row(1, "SUCCESS", "cust-1", 5, 505)]
+        assert list(merge_join_diff(tx, an, KEY_FIELDS, amount_tolerance_minor=5)) == []
+
+    def test_unordered_stream_rejected(self):
+        tx = [_row(2, "SUCCESS", "cust-1", 5, 50), _row(1, "SUCCESS", "cust-1", 5, 50)]
+        with pytest.raises(ValueError):
+            list(merge_join_diff(tx, [], KEY_FIELDS))
+
+    def test_missing_dimensions_collapse_to_empty(self):
+        assert reconciliation_key({"status": "SUCCESS"}, KEY_FIELDS) == ("", "SUCCESS", "")
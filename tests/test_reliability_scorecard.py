@@ -0,0 +1,152 @@
+"""
+Tests for the columnar scorecard path against the scalar reliability index.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services import metrics
+from app.services.metrics import ReliabilityScorecardService, ScorecardCache, ScorecardMetrics
+
+
+def _scalar(slo, test, vulns, incidents):
+    return ReliabilityScorecardService.calculate_reliability_index(
+        ScorecardMetrics(slo_success_rate=slo, test_pass_rate=test, open_security_vulns=vulns, incident_count=incidents)
+    )
+
+
+class TestCalculateReliabilityIndices:
+    def test_matches_scalar_path_element_for_element(self):
+        rows = [(0.995, 1.0, 0, 0), (0.9, 0.8, 1, 0), (0.5, 0.5, 5, 3), (1.0, 1.0, 0, 1), (0.0, 0.0, 0, 0)]
+        columns = {
+            "slo_success_rate": [row[0] for row in rows],
+            "test_pass_rate": [row[1] for row in rows],
+            "open_security_vulns": [row[2] for row in rows],
+            "incident_count": [row[3] for row in rows],
+        }
+        result = ReliabilityScorecardService.calculate_reliability_indices(columns)
+
+        for index, row in enumerate(rows):
+            expected = _scalar(*row)
+            assert result["reliability_index"][index] == expected["reliability_index"]
+            assert result["status"][index] == expected["status"]
+            for component, value in expected["breakdown"].items():
+                assert result[component][index] == value
+
+    def test_rounding_ties_follow_builtin_round(self):
+        # Values whose x * 100 lands on an exact .5 tie in binary while the stored value does not
+        rates = np.array([0.79185, 0.41585, 0.52555, 0.00125, 0.00375])
+        columns = {
+            "slo_success_rate": rates,
+            "test_pass_rate": np.zeros(len(rates)),
+            "open_security_vulns": np.zeros(len(rates), dtype=np.int64),
+            "incident_count": np.full(len(rates), 2),
+        }
+        result = ReliabilityScorecardService.calculate_reliability_indices(columns)
+        assert result["slo_component"].tolist() == [round(value, 2) for value in (columns["slo_success_rate"] * 100).tolist()]
+
+    def test_accepts_structured_array(self):
+        records = np.array(
+            [(0.99, 0.98, 0, 0), (0.99, 0.98, 1, 0)],
+            dtype=[("slo_success_rate", "f8"), ("test_pass_rate", "f8"), ("open_security_vulns", "i8"), ("incident_count", "i8")],
+        )
+        result = ReliabilityScorecardService.calculate_reliability_indices(records)
+        assert result["status"].tolist() == ["GO", "NO-GO"]
+
+
+class TestScorecardCache:
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ScorecardCache(max_entries=2)
+        cache.put((1.0, 1.0, 0, 0), {"index": 1})
+        cache.put((2.0, 1.0, 0, 0), {"index": 2})
+        cache.get((1.0, 1.0, 0, 0))
+        cache.put((3.0, 1.0, 0, 0), {"index": 3})
+
+        assert cache.get((2.0, 1.0, 0, 0)) is None
+        assert cache.get((1.0, 1.0, 0, 0)) == {"index": 1}
+        assert cache.get((3.0, 1.0, 0, 0)) == {"index": 3}
+
+    def test_entries_expire_after_their_ttl(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(metrics, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        cache = ScorecardCache(ttl_seconds=10)
+        cache.put((1.0, 1.0, 0, 0), {"index": 1})
+
+        now[0] += 10
+        assert cache.get((1.0, 1.0, 0, 0)) == {"index": 1}
+        now[0] += 0.001
+        assert cache.get((1.0, 1.0, 0, 0)) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert not cache.entries
+
+
+class TestScorecardBatchEndpoint:
+    @pytest.fixture
+    def endpoints(self, monkeypatch):
+        pytest.importorskip("fastapi")
+        from app.api.v1.endpoints import metrics as endpoints
+
+        recorded = []
+        history = SimpleNamespace(
+            recorded=recorded,
+            record=lambda scorecard, scope: recorded.append(scorecard),
+            record_many=lambda scorecards, scope: recorded.extend(scorecards),
+        )
+        monkeypatch.setattr(endpoints, "get_scorecard_history", lambda: history)
+        metrics.scorecard_cache.clear()
+        return endpoints
+
+    def test_decisions_come_back_in_request_order(self, endpoints):
+        from fastapi import BackgroundTasks
+
+        batch = [
+            ScorecardMetrics(slo_success_rate=0.99, test_pass_rate=1.0, open_security_vulns=0, incident_count=0),
+            ScorecardMetrics(slo_success_rate=0.5, test_pass_rate=0.5, open_security_vulns=2, incident_count=1),
+            ScorecardMetrics(slo_success_rate=0.99, test_pass_rate=1.0, open_security_vulns=0, incident_count=0),
+        ]
+
+        response = asyncio.run(endpoints.evaluate_release_governance_batch(BackgroundTasks(), metrics_batch=batch))
+
+        assert [scorecard["status"] for scorecard in response["data"]] == ["GO", "NO-GO", "GO"]
+        assert [scorecard["metrics_evaluated"] for scorecard in response["data"]] == [item.dict() for item in batch]
+
+    def test_history_is_written_after_the_response(self, endpoints):
+        from fastapi import BackgroundTasks
+
+        metrics_set = ScorecardMetrics(slo_success_rate=0.99, test_pass_rate=1.0, open_security_vulns=0, incident_count=0)
+        tasks = BackgroundTasks()
+
+        response = asyncio.run(endpoints.evaluate_release_governance(metrics_set, tasks))
+
+        assert endpoints.get_scorecard_history().recorded == []
+        asyncio.run(tasks())
+        assert endpoints.get_scorecard_history().recorded == [response["data"]]
+
+    def test_oversized_batch_is_rejected(self, endpoints):
+        from fastapi import BackgroundTasks, HTTPException
+
+        metrics_set = ScorecardMetrics(slo_success_rate=0.99, test_pass_rate=1.0, open_security_vulns=0, incident_count=0)
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(endpoints.evaluate_release_governance_batch(
+                BackgroundTasks(), metrics_batch=[metrics_set] * (endpoints.MAX_SCORECARD_BATCH + 1)
+            ))
+
+        assert excinfo.value.status_code == 413
+
+    def test_history_failure_does_not_fail_the_evaluation(self, endpoints, monkeypatch):
+        from fastapi import BackgroundTasks
+
+        def unavailable():
+            raise OSError("history store unavailable")
+
+        monkeypatch.setattr(endpoints, "get_scorecard_history", unavailable)
+        metrics_set = ScorecardMetrics(slo_success_rate=0.99, test_pass_rate=1.0, open_security_vulns=0, incident_count=0)
+        tasks = BackgroundTasks()
+
+        response = asyncio.run(endpoints.evaluate_release_governance(metrics_set, tasks))
+        asyncio.run(tasks())
+
+        assert response["data"]["status"] == "GO"
@@ -0,0 +1,64 @@
+"""
+Tests for the persisted scorecard history store: range reads, trend rollups and retention.
+"""
+
+from datetime import date, datetime, timedelta
+
+from app.services.scorecard_history import ScorecardHistoryStore
+
+
+def _scorecard(index, status):
+    return {
+        "reliability_index": index,
+        "status": status,
+        "metrics_evaluated": {"slo_success_rate": 0.99, "test_pass_rate": 1.0, "open_security_vulns": 0, "incident_count": 0},
+    }
+
+
+class TestRange:
+    def test_returns_evaluations_in_window_oldest_first(self, tmp_path):
+        store = ScorecardHistoryStore(str(tmp_path / "history.db"))
+        start = datetime(2026, 3, 1, 12)
+        for hour in range(48):
+            store.record(_scorecard(90.0 + hour % 5, "GO"), evaluated_at=start + timedelta(hours=hour))
+        store.record(_scorecard(10.0, "NO-GO"), evaluated_at=start, scope="other")
+
+        rows = store.get_range(start + timedelta(hours=10), start + timedelta(hours=20))
+
+        assert [row["evaluated_at"] for row in rows] == [(start + timedelta(hours=h)).isoformat() for h in range(10, 20)]
+        assert all(row["status"] == "GO" for row in rows)
+        store.close()
+
+
+class TestTrends:
+    def test_roll_up_daily_means_and_go_rate(self, tmp_path):
+        store = ScorecardHistoryStore(str(tmp_path / "history.db"))
+        as_of = date(2026, 3, 31)
+        for days_back in range(30):
+            evaluated_at = datetime.combine(as_of - timedelta(days=days_back), datetime.min.time())
+            status = "GO" if days_back < 7 else "NO-GO"
+            store.record_many([_scorecard(100.0, status), _scorecard(80.0, status)], evaluated_at=evaluated_at)
+
+        trends = store.get_trends(as_of=as_of)
+
+        assert trends["7d"] == {"evaluations": 14, "mean_index": 90.0, "go_rate": 1.0}
+        assert trends["30d"] == {"evaluations": 60, "mean_index": 90.0, "go_rate": round(14 / 60, 4)}
+        assert store.get_daily(as_of, as_of) == [{"day": "2026-03-31", "evaluations": 2, "mean_index": 90.0, "go_rate": 1.0}]
+
+        store.prune(as_of - timedelta(days=6))
+        assert store.get_trends(as_of=as_of)["30d"]["evaluations"] == 14
+        store.close()
+
+
+class TestRetention:
+    def test_first_write_of_a_day_prunes_days_past_retention(self, tmp_path):
+        store = ScorecardHistoryStore(str(tmp_path / "history.db"), retention_days=30)
+        as_of = datetime(2026, 3, 31, 12)
+        store.record(_scorecard(90.0, "GO"), evaluated_at=as_of - timedelta(days=30))
+        store.record(_scorecard(90.0, "GO"), evaluated_at=as_of - timedelta(days=29))
+
+        store.record(_scorecard(90.0, "GO"), evaluated_at=as_of)
+
+        assert [row["day"] for row in store.get_daily(date(2026, 1, 1), as_of.date())] == ["2026-03-02", "2026-03-31"]
+        assert len(store.get_range(as_of - timedelta(days=31), as_of + timedelta(days=1))) == 2
+        store.close()
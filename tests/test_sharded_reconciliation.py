@@ -0,0 +1,75 @@
+"""
+Tests for the time-slice sharded reconciliation scheduler.
+"""
+
+from datetime import datetime, timedelta
+
+from app.repositories.utils.merge_diff import merge_join_diff
+from app.repositories.utils.reconciliation_cursor import iter_buckets
+from app.repositories.utils.sharded_reconciliation import plan_shards, run_sharded
+
+
+KEY_FIELDS = ("bucket", "status", "customer_id")
+MAX_REPORTED = 25
+START = datetime(2026, 3, 1, 12, 0, 37)
+END = START + timedelta(hours=1)
+
+
+def _source(start_time, end_time, drifting):
+    """
+    Key-ordered synthetic summary: one row per minute bucket x status x customer, with every
+    seventh customer's counts shifted on the drifting side.
+    """
+    for bucket in iter_buckets(start_time, end_time, timedelta(minutes=1)):
+        for status in ("FAILED", "SUCCESS"):
+            for customer in range(12):
+                count = bucket.minute + customer + 1
+                if drifting and (bucket.minute + customer) % 7 == 0:
+                    count += 1
+                yield {"bucket": bucket, "status": status, "customer_id": f"cust-{customer:02d}", "count": count, "total_minor": count * 100}
+
+
+def _mismatches(drift_stream):
+    mismatches, count = [], 0
+    for key, tx_data, an_data, count_drift, amount_drift in drift_stream:
+        count += 1
+        if len(mismatches) < MAX_REPORTED:
+            mismatches.append({"scope": dict(zip(KEY_FIELDS, key)), "drift": {"count_diff": count_drift, "amount_diff_minor": amount_drift}})
+    return count, mismatches
+
+
+def _reconcile_shard(shard):
+    return _mismatches(merge_join_diff(
+        _source(shard.start_time, shard.end_time, False),
+        _source(shard.start_time, shard.end_time, True),
+        KEY_FIELDS,
+    ))
+
+
+class TestPlanShards:
+    def test_slices_cover_the_window_on_aligned_boundaries(self):
+        slices = plan_shards(START, END, timedelta(minutes=5))
+
+        assert len(slices) == 13
+        assert slices[0][0] == START and slices[-1][1] == END
+        assert all(previous[1] == current[0] for previous, current in zip(slices, slices[1:]))
+        assert all(start.second == 0 and start.minute % 5 == 0 for start, _ in slices[1:])
+
+    def test_window_inside_one_slice_is_a_single_shard(self):
+        assert plan_shards(START, START + timedelta(minutes=1)) == [(START, START + timedelta(minutes=1))]
+
+
+class TestRunSharded:
+    def test_matches_a_single_process_run(self):
+        expected = _mismatches(merge_join_diff(_source(START, END, False), _source(START, END, True), KEY_FIELDS))
+
+        result = run_sharded(
+            plan_shards(START, END, timedelta(minutes=5)),
+            _reconcile_shard,
+            KEY_FIELDS,
+            MAX_REPORTED,
+            max_workers=2,
+        )
+
+        assert expected[0] > MAX_REPORTED
+        assert result == expected
@@ -0,0 +1,173 @@
+"""
+End-to-end tests for the reconciliation jobs against a SQLite payments table and the analytics exporter.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.repositories.payment_repository import PaymentRepository
+from app.repositories.tasks import sla_tasks
+from app.repositories.utils.analytics_exporter import AnalyticsExporter
+from app.repositories.utils.reconciliation_cursor import ReconciliationCursor
+
+
+START = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE payments (id INTEGER PRIMARY KEY, customer_id TEXT, status TEXT NOT NULL, "
+                "amount NUMERIC NOT NULL, updated_at TIMESTAMP NOT NULL)"
+            )
+        )
+    with Session(engine) as db:
+        yield db
+
+
+def insert_payments(db, status, count, updated_at, amount=2500, customer_id=None):
+    db.execute(
+        text("INSERT INTO payments (customer_id, status, amount, updated_at) VALUES (:customer_id, :status, :amount, :updated_at)"),
+        [{"customer_id": customer_id, "status": status, "amount": amount, "updated_at": updated_at}] * count,
+    )
+
+
+def seed_minute(db, minute):
+    # Matches the exporter's simulated minute exactly
+    insert_payments(db, "FAILED", 1, minute + timedelta(seconds=5))
+    insert_payments(db, "SUCCESS", 24, minute + timedelta(seconds=30))
+
+
+class TestReconcileWindow:
+    def test_aligned_minutes_report_no_drift(self, session):
+        seed_minute(session, START)
+        seed_minute(session, START + timedelta(minutes=1))
+        mismatches = []
+
+        count = sla_tasks._reconcile_window(PaymentRepository(session), AnalyticsExporter(cache_dir=None), START, START + timedelta(minutes=2), mismatches)
+
+        assert count == 0
+        assert mismatches == []
+
+    def test_missing_and_unknown_keys_reported_in_key_order(self, session):
+        seed_minute(session, START)
+        insert_payments(session, "SUCCESS", 2, START + timedelta(seconds=40), customer_id="cust-1")
+        mismatches = []
+
+        count = sla_tasks._reconcile_window(PaymentRepository(session), AnalyticsExporter(cache_dir=None), START, START + timedelta(minutes=2), mismatches)
+
+        assert count == 3
+        assert [tuple(item["scope"].values()) for item in mismatches] == [
+            (START, "SUCCESS", "cust-1"),
+            (START + timedelta(minutes=1), "FAILED", ""),
+            (START + timedelta(minutes=1), "SUCCESS", ""),
+        ]
+        assert mismatches[1]["drift"] == {"count_diff": 1, "amount_diff_minor": 25000000000}
+
+    def test_streaming_run_reports_drift(self, session):
+        seed_minute(session, START)
+        assert sla_tasks._run_streaming_reconciliation(PaymentRepository(session), AnalyticsExporter(cache_dir=None), START, START + timedelta(minutes=1))
+        assert not sla_tasks._run_streaming_reconciliation(PaymentRepository(session), AnalyticsExporter(cache_dir=None), START, START + timedelta(minutes=2))
+
+
+class TestVectorizedReconciliation:
+    def test_vectorized_run_agrees_with_streaming_run(self, session, monkeypatch):
+        pytest.importorskip("numpy")
+        reported = []
+        monkeypatch.setattr(sla_tasks, "trigger_slack_pagerduty_alert", reported.append)
+        seed_minute(session, START)
+        insert_payments(session, "SUCCESS", 2, START + timedelta(seconds=40), customer_id="cust-1")
+        repo, exporter = PaymentRepository(session), AnalyticsExporter(cache_dir=None)
+
+        assert not sla_tasks._run_streaming_reconciliation(repo, exporter, START, START + timedelta(minutes=2))
+        assert not sla_tasks._run_vectorized_reconciliation(repo, exporter, START, START + timedelta(minutes=2))
+
+        streaming, vectorized = reported
+        assert [item["scope"] for item in vectorized] == [item["scope"] for item in streaming]
+        assert [item["drift"] for item in vectorized] == [item["drift"] for item in streaming]
+
+
+class TestIncrementalReconciliation:
+    NOW = datetime(2026, 10, 1, 14, 0)
+
+    @pytest.fixture
+    def run(self, session, tmp_path, monkeypatch):
+        """
+        Runs the incremental job at a pinned clock with a 30-minute lookback, returning (outcome, alerts).
+        """
+        cursor = ReconciliationCursor(str(tmp_path / "cursor.db"))
+
+        def run_at(now):
+            class Clock(datetime):
+                @classmethod
+                def utcnow(cls):
+                    return now
+
+            alerts = []
+            monkeypatch.setattr(sla_tasks, "datetime", Clock)
+            monkeypatch.setattr(sla_tasks, "trigger_slack_pagerduty_alert", alerts.append)
+            outcome = sla_tasks.run_incremental_reconciliation_job(session, None, cursor, late_arrival_lookback=timedelta(minutes=30))
+            return outcome, alerts
+
+        yield run_at
+        cursor.close()
+
+    def seed(self, db, start, end):
+        minute = start
+        while minute < end:
+            seed_minute(db, minute)
+            minute += timedelta(minutes=1)
+
+    def test_watermark_advances_to_the_last_closed_bucket(self, session, run):
+        self.seed(session, datetime(2026, 10, 1, 12, 50), datetime(2026, 10, 1, 13, 50))
+
+        assert run(self.NOW) == (True, [])
+        # Nothing newly closed: no window is reconciled
+        assert run(self.NOW + timedelta(minutes=2)) == (True, [])
+        assert run(self.NOW + timedelta(minutes=5))[0] is False
+
+    def test_late_arrival_in_a_checkpointed_bucket_is_rechecked(self, session, run):
+        self.seed(session, datetime(2026, 10, 1, 12, 50), datetime(2026, 10, 1, 13, 55))
+        assert run(self.NOW) == (True, [])
+
+        insert_payments(session, "SUCCESS", 1, datetime(2026, 10, 1, 13, 42, 10))
+        outcome, alerts = run(self.NOW + timedelta(minutes=5))
+
+        assert outcome is False
+        assert [item["scope"]["bucket"] for item in alerts[0]] == [datetime(2026, 10, 1, 13, 42)]
+
+    def test_unchanged_buckets_are_not_rechecked(self, session, run, monkeypatch):
+        self.seed(session, datetime(2026, 10, 1, 12, 50), datetime(2026, 10, 1, 13, 55))
+        assert run(self.NOW) == (True, [])
+        windows = []
+        reconcile = sla_tasks._reconcile_window
+
+        def recording_reconcile(repo, exporter, start, end, mismatches):
+            windows.append((start, end))
+            return reconcile(repo, exporter, start, end, mismatches)
+
+        monkeypatch.setattr(sla_tasks, "_reconcile_window", recording_reconcile)
+
+        assert run(self.NOW + timedelta(minutes=5)) == (True, [])
+        assert windows == [(datetime(2026, 10, 1, 13, 50), datetime(2026, 10, 1, 13, 55))]
+
+
+class TestCoalesceBuckets:
+    def test_adjacent_buckets_share_a_window(self):
+        bucket = timedelta(minutes=5)
+        buckets = [START, START + bucket, START + 3 * bucket, START + 4 * bucket, START + 6 * bucket]
+
+        assert sla_tasks._coalesce_buckets(buckets, bucket) == [
+            (START, START + 2 * bucket),
+            (START + 3 * bucket, START + 5 * bucket),
+            (START + 6 * bucket, START + 7 * bucket),
+        ]
+
+    def test_no_buckets_gives_no_windows(self):
+        assert sla_tasks._coalesce_buckets([], timedelta(minutes=5)) == []